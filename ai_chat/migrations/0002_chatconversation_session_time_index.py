@@ -0,0 +1,30 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ai_chat", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chatconversation",
+            index=models.Index(
+                fields=["session", "timestamp"], name="chatconv_session_time_idx"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="chatconversation",
+            name="session",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="conversations",
+                to="ai_chat.chatsession",
+            ),
+        ),
+    ]
@@ -26,7 +26,8 @@ class ChatSession(models.Model):
         return f"세션 {self.session_key} ({self.question_count}/{self.MAX_QUESTIONS})"
 
 class ChatConversation(models.Model):
-    session = models.ForeignKey(ChatSession,on_delete=models.CASCADE, related_name='conversations')     
+    session = models.ForeignKey(ChatSession,on_delete=models.CASCADE, related_name='conversations',
+                                db_index=False)  # (session, timestamp) 복합 인덱스로 대체     
     user_question = models.TextField(verbose_name="사용자 질문")
     ai_response = models.TextField(verbose_name="AI 답변")
     timestamp = models.DateTimeField(auto_now_add=True, verbose_name="대화시간")
@@ -38,6 +39,10 @@ class ChatConversation(models.Model):
         verbose_name = "채팅 대화"
         verbose_name_plural = "채팅 대화"
         ordering = ['timestamp']
+        indexes = [
+            # 세션별 대화 기록을 시간순으로 조회 (get_chat_history)
+            models.Index(fields=['session', 'timestamp'], name='chatconv_session_time_idx'),
+        ]
 
     def __str__(self):
         return f"Q: {self.user_question[:30]}... | A:{self.ai_response[:30]}..."
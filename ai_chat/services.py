@@ -1,8 +1,20 @@
 """
 AI Chat 앱의 비즈니스 로직을 담당하는 서비스 계층
 """
+from functools import lru_cache
+
 from django.conf import settings
-import openai
+
+
+@lru_cache(maxsize=1)
+def get_openai_client():
+    """
+    프로세스 공용 OpenAI 클라이언트
+    openai 패키지는 import 비용이 커서 첫 챗봇 요청 때 import합니다. (서버 시작 시간 단축)
+    """
+    import openai
+
+    return openai.OpenAI(api_key=settings.OPENAI_API_KEY)
 
 
 def get_portfolio_context_for_ai() -> dict:
@@ -53,8 +65,6 @@ def generate_ai_response_stream(user_input: str, context_data: dict):
     Yields:
         str: AI 응답 텍스트 청크
     """
-    openai.api_key = settings.OPENAI_API_KEY
-
     # DB 기반 컨텍스트 생성
     system_prompt = f"""
     당신은 이동혁의 포트폴리오 AI 어시스턴트입니다.
@@ -73,7 +83,8 @@ def generate_ai_response_stream(user_input: str, context_data: dict):
     """
 
     try:
-        stream = openai.chat.completions.create(
+        client = get_openai_client()
+        stream = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -1,3 +1,26 @@
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from core.testing import QueryPlanAssertionsMixin
+
+from .models import ChatConversation, ChatSession
+
+
+class ChatHistoryQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    """대화 기록 조회 쿼리의 인덱스 사용 확인"""
+
+    def setUp(self):
+        session = self.client.session
+        session.save()
+        chat_session = ChatSession.objects.create(session_key=session.session_key)
+        other_session = ChatSession.objects.create(session_key='other')
+        for index in range(5):
+            for owner in (chat_session, other_session):
+                ChatConversation.objects.create(session=owner, user_question=f"질문 {index}", ai_response="답변")
+
+    def test_history_uses_session_timestamp_index(self):
+        with self.capture_queries() as captured:
+            response = self.client.get(reverse('ai_chat:chat_history'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['history']), 5)
+        self.assertQueryUsesIndex(captured, 'ai_chat_chatconversation', 'chatconv_session_time_idx')
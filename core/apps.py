@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        # 콘텐츠 변경 시 캐시 무효화 시그널 등록
+        from .signals import connect_signals
+        connect_signals()
@@ -0,0 +1,116 @@
+"""
+포트폴리오 콘텐츠 캐시 버전 관리
+모델이 변경될 때마다 증가하는 전역 콘텐츠 버전을 캐시에 보관합니다.
+캐시 키에 버전을 포함시키므로 버전이 바뀌면 이전 스냅샷은 자연스럽게 무효화됩니다.
+"""
+import time
+from datetime import date, datetime, timezone
+from functools import wraps
+from inspect import iscoroutinefunction
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.timezone import make_aware
+from django.views.decorators.http import condition
+
+CONTENT_VERSION_KEY = 'portfolio:content_version'
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def get_content_version() -> int:
+    """
+    현재 전역 콘텐츠 버전을 반환합니다.
+    버전은 마지막 변경 시각(ms)을 기준으로 하므로 캐시가 비워져도 이전 값보다 작아지지 않습니다.
+
+    Returns:
+        int: 콘텐츠 버전 (마지막 변경 시각, epoch milliseconds)
+    """
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        # 캐시가 비어 있으면 현재 시각으로 초기화 (동시 초기화 시 먼저 저장된 값 사용)
+        cache.add(CONTENT_VERSION_KEY, _now_ms(), timeout=None)
+        version = cache.get(CONTENT_VERSION_KEY, _now_ms())
+    return version
+
+
+def bump_content_version() -> int:
+    """
+    콘텐츠 버전을 올려 버전이 포함된 모든 캐시 항목을 무효화합니다.
+
+    Returns:
+        int: 새 콘텐츠 버전
+    """
+    version = max(get_content_version() + 1, _now_ms())
+    cache.set(CONTENT_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def versioned_key(prefix: str) -> str:
+    """현재 콘텐츠 버전이 포함된 캐시 키를 반환합니다."""
+    return f'{prefix}:v{get_content_version()}'
+
+
+def content_etag(request, *args, **kwargs) -> str:
+    """
+    콘텐츠 버전 기반 ETag (조건부 GET용)
+    배포마다 템플릿/정적 파일이 바뀔 수 있으므로 릴리스 식별자를 함께 포함합니다.
+    """
+    return f'{settings.RELEASE_VERSION}-{get_content_version()}'
+
+
+def content_last_modified(request, *args, **kwargs) -> datetime:
+    """콘텐츠 버전 기반 Last-Modified (조건부 GET용)"""
+    return datetime.fromtimestamp(get_content_version() / 1000, tz=timezone.utc)
+
+
+def dated_content_etag(request, *args, **kwargs) -> str:
+    """
+    오늘 날짜가 포함된 콘텐츠 ETag
+    총 경력 기간처럼 요청 날짜로 계산하는 값을 렌더링하는 페이지는 날짜가 바뀌면 다시 렌더링해야 합니다.
+    """
+    return f'{content_etag(request)}-{date.today().isoformat()}'
+
+
+def dated_content_last_modified(request, *args, **kwargs) -> datetime:
+    """콘텐츠 Last-Modified와 오늘 0시 중 늦은 시각 (If-Modified-Since만 보내는 클라이언트용)"""
+    start_of_today = make_aware(datetime.combine(date.today(), datetime.min.time()))
+    return max(content_last_modified(request), start_of_today)
+
+
+# 뷰 데코레이터: 콘텐츠가 바뀌지 않았으면 뷰 실행(렌더링/쿼리) 없이 304 응답
+conditional_content = condition(
+    etag_func=content_etag,
+    last_modified_func=content_last_modified,
+)
+
+# 날짜에 따라 바뀌는 값을 렌더링하는 뷰용 (콘텐츠가 같아도 날짜가 바뀌면 200)
+conditional_dated_content = condition(
+    etag_func=dated_content_etag,
+    last_modified_func=dated_content_last_modified,
+)
+
+
+def no_store_if_degraded(view):
+    """
+    응답에 degraded=True가 표시되어 있으면 검증자(ETag/Last-Modified)를 빼고 no-store로 보냅니다.
+    외부 연동 일부가 빠진 응답(예: README 조회 시간 초과)이 정상 콘텐츠 ETag로 캐시되면
+    이후 재검증이 계속 304가 되어 다시 조회되지 않으므로, conditional_content보다 바깥에 적용합니다.
+    """
+    def finalize(response):
+        if getattr(response, 'degraded', False):
+            del response['ETag']
+            del response['Last-Modified']
+            response['Cache-Control'] = 'no-store'
+        return response
+
+    if iscoroutinefunction(view):
+        async def wrapper(request, *args, **kwargs):
+            return finalize(await view(request, *args, **kwargs))
+    else:
+        def wrapper(request, *args, **kwargs):
+            return finalize(view(request, *args, **kwargs))
+
+    return wraps(view)(wrapper)
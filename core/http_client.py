@@ -0,0 +1,233 @@
+"""
+외부 HTTP 요청 공용 클라이언트
+호스트별 연결 풀(keep-alive), 백오프 재시도, 호스트별 서킷 브레이커와 호출 지표를 제공합니다.
+GitHub README 조회, Demo URL 임베드 확인 등 외부 호출은 이 모듈을 통해 보냅니다.
+"""
+import asyncio
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = 5
+
+
+class CircuitOpenError(requests.RequestException):
+    """서킷이 열려 있어 요청을 보내지 않은 경우"""
+
+
+class CircuitBreaker:
+    """
+    호스트별 서킷 브레이커
+    연속 실패가 기준을 넘으면 일정 시간 동안 요청을 바로 실패시키고(open),
+    이후 한 번의 시험 요청(half-open)이 성공하면 다시 닫습니다(closed).
+    시험 요청 결과가 reset_timeout 안에 기록되지 않으면 다음 시험 요청을 다시 1회 허용합니다.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at >= self.reset_timeout:
+                # 시험 요청 1회만 허용 (half-open 진입 시각부터 다시 reset_timeout 동안은 차단)
+                self.state = self.HALF_OPEN
+                self.opened_at = now
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+_breakers = {}
+_metrics = {}
+_registry_lock = threading.Lock()
+_sessions = {}
+_session_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _get_session(retry: bool = True) -> requests.Session:
+    """
+    프로세스 공용 Session (호스트별 keep-alive 연결 풀)
+    retry=True: 연결 오류/502·503·504를 백오프로 재시도 (관리 명령, 백그라운드 작업용)
+    retry=False: 재시도 없음 (요청 처리 중 호출 - 응답 지연 상한이 timeout 한 번으로 제한됨)
+    """
+    session = _sessions.get(retry)
+    if session is None:
+        with _session_lock:
+            session = _sessions.get(retry)
+            if session is None:
+                if retry:
+                    max_retries = Retry(
+                        total=settings.HTTP_CLIENT_RETRIES,
+                        backoff_factor=0.3,
+                        status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset({'GET', 'HEAD'}),
+                        raise_on_status=False,
+                    )
+                else:
+                    max_retries = 0
+                adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=max_retries)
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _sessions[retry] = session
+    return session
+
+
+def _get_host_state(host: str):
+    with _registry_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(
+                settings.HTTP_CIRCUIT_FAILURE_THRESHOLD,
+                settings.HTTP_CIRCUIT_RESET_TIMEOUT,
+            )
+            _metrics[host] = {
+                'requests': 0,
+                'failures': 0,
+                'short_circuited': 0,
+                'total_time': 0.0,
+            }
+        return breaker, _metrics[host]
+
+
+def _before_request(url: str):
+    host = urlsplit(url).netloc
+    breaker, metrics = _get_host_state(host)
+    if not breaker.allow():
+        with _registry_lock:
+            metrics['short_circuited'] += 1
+        raise CircuitOpenError(f"Circuit open for {host}")
+    return breaker, metrics
+
+
+def _after_request(breaker, metrics, started, failed: bool):
+    with _registry_lock:
+        metrics['requests'] += 1
+        metrics['total_time'] += time.monotonic() - started
+        if failed:
+            metrics['failures'] += 1
+    if failed:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+def request(method: str, url: str, retry: bool = True, **kwargs) -> requests.Response:
+    """
+    공용 Session으로 요청을 보냅니다. 5xx 응답과 연결 오류는 서킷 브레이커 실패로 기록됩니다.
+    사용자 요청(뷰, 관리자 저장) 안에서 호출할 때는 retry=False로 재시도 대기 없이 실패시킵니다.
+
+    Raises:
+        CircuitOpenError: 해당 호스트의 서킷이 열려 있는 경우
+        requests.RequestException: 재시도 후에도 요청이 실패한 경우
+    """
+    breaker, metrics = _before_request(url)
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    started = time.monotonic()
+    try:
+        response = _get_session(retry).request(method, url, **kwargs)
+    except BaseException:
+        # 어떤 예외든 결과를 기록해야 half-open 시험 요청이 끝남
+        _after_request(breaker, metrics, started, failed=True)
+        raise
+    _after_request(breaker, metrics, started, failed=response.status_code >= 500)
+    return response
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request('GET', url, **kwargs)
+
+
+def head(url: str, **kwargs) -> requests.Response:
+    return request('HEAD', url, **kwargs)
+
+
+def get_async_client():
+    """
+    이벤트 루프별 공용 httpx.AsyncClient (호스트별 keep-alive 연결 풀, 연결 오류 1회 재시도)
+    연결은 생성한 이벤트 루프에 묶이므로 루프마다 하나씩 만들고, 루프가 사라지면 함께 정리됩니다.
+    (uvicorn 워커는 루프가 하나이므로 프로세스당 하나)
+    """
+    import httpx  # 비동기 뷰에서만 사용 - 시작 시 import 비용 제외
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(retries=1, limits=httpx.Limits(max_keepalive_connections=20)),
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True,
+        )
+    return client
+
+
+async def arequest(client, method: str, url: str, **kwargs):
+    """
+    request()의 비동기 버전. 전달받은 httpx.AsyncClient(보통 get_async_client())로 요청하며
+    서킷 브레이커와 지표를 공유합니다. 요청별 마감 시간은 timeout으로 전달합니다.
+
+    Raises:
+        CircuitOpenError: 해당 호스트의 서킷이 열려 있는 경우
+        httpx.HTTPError: 요청이 실패한 경우
+    """
+    breaker, metrics = _before_request(url)
+    started = time.monotonic()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except BaseException:
+        # 마감 시간 초과로 작업이 취소된 경우(asyncio.CancelledError)도 실패로 기록
+        _after_request(breaker, metrics, started, failed=True)
+        raise
+    _after_request(breaker, metrics, started, failed=response.status_code >= 500)
+    return response
+
+
+def get_metrics() -> dict:
+    """
+    호스트별 호출 지표를 반환합니다.
+
+    Returns:
+        dict: {host: {requests, failures, short_circuited, avg_ms, circuit}}
+    """
+    with _registry_lock:
+        items = [(host, dict(metrics), _breakers[host].state) for host, metrics in _metrics.items()]
+
+    return {
+        host: {
+            'requests': metrics['requests'],
+            'failures': metrics['failures'],
+            'short_circuited': metrics['short_circuited'],
+            'avg_ms': round(metrics['total_time'] / metrics['requests'] * 1000, 1) if metrics['requests'] else 0,
+            'circuit': state,
+        }
+        for host, metrics, state in items
+    }
@@ -0,0 +1,253 @@
+"""
+업로드 이미지 처리: 반응형 파생본(variant)과 표시용 메타데이터 생성
+원본 업로드 이미지를 고정 너비 단계별로 축소하여 WebP(와 지원 시 AVIF)로 변환하고,
+기본 Storage(SupabaseStorage)에 저장한 경로를 모델의 `<필드명>_variants` JSONField에 기록합니다.
+같은 처리에서 원본 크기, 대표 색상, 블러 미리보기(LQIP)를 계산하여
+`<필드명>_width/_height/_color/_placeholder` 필드에 저장합니다. (템플릿/JSON은 원본을 다시 열지 않음)
+
+variants 형식:
+    {
+        'source': 'project/img/a.png',         # 파생본을 만든 원본 경로
+        'webp': {'320': 'project/img/variants/a-1a2b3c4d5e6f-320w.webp', ...},
+        'avif': {...},                         # AVIF 인코더가 있을 때만
+    }
+"""
+import base64
+import hashlib
+import logging
+import os
+from functools import lru_cache
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+# 카드(300px대)부터 전체 폭 배너까지 커버하는 너비 단계
+VARIANT_WIDTHS = (320, 640, 960, 1280, 1920)
+
+# 형식별 저장 옵션 (브라우저는 <source> 순서대로 선택하므로 압축률 좋은 형식 우선)
+VARIANT_FORMATS = {
+    'avif': {'format': 'AVIF', 'quality': 55},
+    'webp': {'format': 'WEBP', 'quality': 80, 'method': 4},
+}
+
+
+@lru_cache(maxsize=1)
+def available_formats() -> tuple:
+    """현재 Pillow 빌드에서 인코딩 가능한 파생본 형식 (AVIF는 pillow-avif-plugin 설치 시)"""
+    try:
+        import pillow_avif  # noqa: F401  (import 시 AVIF 플러그인 등록)
+    except ImportError:
+        pass
+    Image.init()
+    return tuple(name for name, options in VARIANT_FORMATS.items() if options['format'] in Image.SAVE)
+
+
+# 블러 미리보기 최대 변 길이(px) - data URI로 HTML/JSON에 그대로 넣으므로 수백 바이트 수준 유지
+PLACEHOLDER_SIZE = 16
+
+
+def variant_widths(original_width: int) -> list:
+    """원본보다 작은 단계 + 원본 너비(최대 단계 이하일 때) — 확대는 하지 않음"""
+    widths = {width for width in VARIANT_WIDTHS if width < original_width}
+    widths.add(min(original_width, VARIANT_WIDTHS[-1]))
+    return sorted(widths)
+
+
+def dominant_color(image) -> str:
+    """축소한 이미지를 5색으로 양자화하여 가장 많이 쓰인 색을 #rrggbb로 반환"""
+    small = image.convert('RGB')
+    small.thumbnail((64, 64))
+    quantized = small.quantize(colors=5)
+    _, index = max(quantized.getcolors())
+    red, green, blue = quantized.getpalette()[index * 3:index * 3 + 3]
+    return f'#{red:02x}{green:02x}{blue:02x}'
+
+
+def placeholder_data_uri(image) -> str:
+    """
+    PLACEHOLDER_SIZE 이하로 축소한 WebP data URI (LQIP)
+    브라우저가 img 배경으로 늘려 그리면 흐릿한 미리보기가 됩니다.
+    투명 영역이 있는 이미지는 원본 로딩 후에도 배경이 비쳐 보이므로 만들지 않습니다.
+    """
+    if image.mode == 'RGBA':
+        return ''
+    tiny = image.copy()
+    tiny.thumbnail((PLACEHOLDER_SIZE, PLACEHOLDER_SIZE))
+    buffer = BytesIO()
+    tiny.save(buffer, format='WEBP', quality=40)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def image_metadata(image) -> dict:
+    """방향 보정된 이미지의 표시용 메타데이터 (width, height, color, placeholder)"""
+    return {
+        'width': image.width,
+        'height': image.height,
+        'color': dominant_color(image),
+        'placeholder': placeholder_data_uri(image),
+    }
+
+
+class InvalidImageError(ValueError):
+    """원본을 이미지로 읽을 수 없는 경우 (같은 원본은 다시 시도해도 같은 결과)"""
+
+
+def decode_image(source: bytes):
+    """
+    원본 바이트를 방향 보정된 RGB/RGBA 이미지로 디코딩합니다.
+
+    Raises:
+        InvalidImageError: 이미지 형식이 아니거나 손상된 경우
+    """
+    try:
+        with Image.open(BytesIO(source)) as image:
+            image = ImageOps.exif_transpose(image)
+            has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+            # convert()가 픽셀을 모두 읽으므로 잘린 파일 등 디코딩 오류도 여기서 발생
+            return image.convert('RGBA' if has_alpha else 'RGB')
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, SyntaxError, ValueError) as e:
+        # 메모리의 바이트를 읽으므로 OSError도 I/O 오류가 아닌 디코딩 오류
+        raise InvalidImageError(str(e)) from e
+
+
+def build_variants(source: bytes, name: str, storage) -> tuple:
+    """
+    원본 이미지 바이트로 파생본을 만들어 storage에 저장하고 메타데이터를 계산합니다.
+
+    Args:
+        source: 원본 이미지 바이트
+        name: 원본 저장 경로 (파생본은 같은 디렉토리의 variants/ 아래에 저장)
+        storage: 파생본을 저장할 Storage
+
+    Returns:
+        tuple: (모듈 docstring의 variants 형식, image_metadata() 결과)
+
+    Raises:
+        InvalidImageError: 이미지를 읽을 수 없는 경우
+        OSError: 파생본 저장 실패 (Storage/네트워크 - 다시 시도 가능)
+    """
+    directory = os.path.dirname(name)
+    stem = os.path.splitext(os.path.basename(name))[0]
+    # 원본 내용 + 인코딩 옵션 해시를 파일명에 포함 -> 같은 원본은 같은 이름, 교체 시 새 이름 (CDN 캐시 무효화 불필요)
+    digest = hashlib.sha256(source + repr(VARIANT_FORMATS).encode()).hexdigest()[:12]
+    variants = {'source': name}
+
+    image = decode_image(source)
+    metadata = image_metadata(image)
+
+    formats = available_formats()
+    for fmt in formats:
+        variants[fmt] = {}
+
+    for width in variant_widths(image.width):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+
+        for fmt in formats:
+            path = f"{directory}/variants/{stem}-{digest}-{width}w.{fmt}".lstrip('/')
+            if storage.exists(path):
+                # 같은 이름이면 같은 내용이므로 다시 올리지 않음 (백필 재실행 시)
+                variants[fmt][str(width)] = path
+                continue
+            buffer = BytesIO()
+            resized.save(buffer, **VARIANT_FORMATS[fmt])
+            variants[fmt][str(width)] = storage.save(path, ContentFile(buffer.getvalue()))
+
+    return variants, metadata
+
+
+def variant_paths(variants) -> list:
+    """variants dict에 기록된 파생본 저장 경로 목록 (형식/너비 구분 없이)"""
+    return [
+        path
+        for fmt, entries in (variants or {}).items()
+        if isinstance(entries, dict)
+        for path in entries.values()
+    ]
+
+
+def _read_source(field_file) -> bytes:
+    """
+    FieldFile의 원본 바이트를 읽습니다.
+    업로드 직후(미저장)에는 메모리의 업로드 파일을 읽고 원본을 먼저 저장하여 최종 경로를 확정합니다.
+    """
+    if not field_file._committed:
+        content = field_file.file
+        content.seek(0)
+        source = content.read()
+        content.seek(0)
+        # FileField.pre_save()와 같은 방식으로 원본 저장 (이후 모델 save()에서는 다시 올리지 않음)
+        field_file.save(field_file.name, content, save=False)
+        return source
+
+    field_file.open('rb')
+    try:
+        return field_file.read()
+    finally:
+        field_file.close()
+
+
+# 이미지 필드별로 함께 저장되는 메타데이터 필드 접미사와 비어 있을 때의 값
+METADATA_FIELDS = {'width': None, 'height': None, 'color': '', 'placeholder': ''}
+
+
+def process_image(instance, field_name: str, force: bool = False, backfill: bool = False) -> bool:
+    """
+    모델 인스턴스의 이미지 필드에 대한 파생본과 메타데이터를 필요할 때만 다시 만듭니다.
+    모델 save()에서 super().save() 전에 호출하면 DB 쓰기 한 번으로 원본 경로와 함께 저장됩니다.
+
+    저장 시에는 새로 올렸거나 바뀐 이미지만 처리하고, 처리된 적 없는 기존 이미지(순서만 바꾸는 저장 등)는
+    build_image_variants 명령(backfill=True)에 맡깁니다.
+
+    Args:
+        instance: 이미지 필드와 `<field_name>_variants`, `<field_name>_width` 등 메타데이터 필드를 가진 모델 인스턴스
+        field_name: 이미지 필드명
+        force: 원본이 그대로여도 다시 생성 (백필용)
+        backfill: 처리된 적 없는 기존 이미지도 처리하고, Storage 오류는 호출자에게 전달 (백필 명령용)
+
+    Returns:
+        bool: 저장할 값이 바뀌었는지 여부
+    """
+    field_file = getattr(instance, field_name)
+    variants_attr = f'{field_name}_variants'
+    current = getattr(instance, variants_attr) or {}
+    current_metadata = {key: getattr(instance, f'{field_name}_{key}') for key in METADATA_FIELDS}
+
+    if not field_file:
+        setattr(instance, variants_attr, {})
+        for key, empty in METADATA_FIELDS.items():
+            setattr(instance, f'{field_name}_{key}', empty)
+        return bool(current) or current_metadata != METADATA_FIELDS
+
+    if not force and field_file._committed:
+        # 처리 완료(메타데이터 있음) 또는 처리 실패가 기록된 원본이면 건너뜀
+        processed = current_metadata['width'] is not None or 'error' in current
+        if current.get('source') == field_file.name and processed:
+            return False
+        # 업로드 시점 처리 이전의 기존 이미지는 요청 안에서 내려받지 않음 (build_image_variants로 처리)
+        if not backfill and current.get('source') in (None, field_file.name):
+            return False
+
+    source = _read_source(field_file)
+    try:
+        variants, metadata = build_variants(source, field_file.name, field_file.storage)
+    except InvalidImageError as e:
+        # 이미지가 아닌 파일: 원본만 사용하고 source와 오류를 기록하여 다시 시도하지 않음
+        # (재생성은 build_image_variants --force)
+        logger.warning(f"Image processing failed for {field_file.name}: {e}")
+        variants, metadata = {'source': field_file.name, 'error': str(e)}, dict(METADATA_FIELDS)
+    except OSError as e:
+        if backfill:
+            raise
+        # Storage/네트워크 일시 오류가 원본 저장을 막지 않도록 원본만 사용
+        # 미처리 상태로 두어 build_image_variants 실행 시 다시 시도
+        logger.warning(f"Image variants upload failed for {field_file.name}, left for backfill: {e}")
+        variants, metadata = {}, dict(METADATA_FIELDS)
+
+    setattr(instance, variants_attr, variants)
+    for key, value in metadata.items():
+        setattr(instance, f'{field_name}_{key}', value)
+    return variants != current or metadata != current_metadata
@@ -0,0 +1,60 @@
+"""
+Django management command to generate responsive image variants and metadata for existing images.
+Usage: python manage.py build_image_variants [--force]
+
+업로드 시점 처리가 도입되기 전의 기존 이미지(프로젝트 이미지, 프로필 사진, 메인 배너)를
+원본을 한 번씩 내려받아 너비별 WebP/AVIF 파생본과 크기/대표 색상/블러 미리보기를 채우는 백필 명령입니다.
+"""
+from django.core.management.base import BaseCommand
+
+from core.caching import bump_content_version
+from core.imaging import METADATA_FIELDS, available_formats, process_image
+from core.models import MainPageContent, Profile
+from projects.models import ProjectImage
+
+# (모델, 이미지 필드명) - 파생본은 `<필드명>_variants`, 메타데이터는 `<필드명>_width` 등에 저장
+IMAGE_FIELDS = (
+    (ProjectImage, 'image'),
+    (Profile, 'photo'),
+    (MainPageContent, 'main_banner'),
+)
+
+
+class Command(BaseCommand):
+    help = 'Backfill WebP/AVIF width variants and display metadata for project images, profile photos and banners'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate variants and metadata even if they already exist for the current image',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Formats: {', '.join(available_formats())}")
+
+        updated_count = 0
+        for model, field_name in IMAGE_FIELDS:
+            update_fields = [f'{field_name}_variants'] + [f'{field_name}_{key}' for key in METADATA_FIELDS]
+            instances = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+
+            for instance in instances.only('pk', field_name, *update_fields):
+                label = f'{model.__name__} #{instance.pk}'
+                try:
+                    changed = process_image(instance, field_name, force=options['force'], backfill=True)
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f'  ✗ {label}: {e}'))
+                    continue
+
+                if changed:
+                    # save()를 거치지 않으므로 updated_at과 썸네일 재계산은 건드리지 않음
+                    model.objects.filter(pk=instance.pk).update(
+                        **{name: getattr(instance, name) for name in update_fields}
+                    )
+                    updated_count += 1
+                    self.stdout.write(self.style.SUCCESS(f'  ✓ {label}: {getattr(instance, field_name).name}'))
+
+        if updated_count:
+            bump_content_version()
+
+        self.stdout.write(self.style.SUCCESS(f'\n✓ Done! Generated variants for {updated_count} image(s)'))
@@ -0,0 +1,56 @@
+"""
+Django management command to re-check whether project demo URLs can be embedded in an iframe.
+Usage: python manage.py check_iframe_support [--workers 8]
+
+주기적으로(예: Railway Cron) 실행하여 Project.iframe_supported 값을 최신으로 유지합니다.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+
+from projects.models import Project
+from projects.services import refresh_iframe_support
+
+
+class Command(BaseCommand):
+    help = 'Re-check iframe embeddability of all project demo URLs concurrently'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Number of concurrent HEAD requests (default: 8)',
+        )
+
+    def handle(self, *args, **options):
+        projects = list(Project.objects.exclude(demo_url=''))
+
+        if not projects:
+            self.stdout.write(self.style.WARNING('No projects with a demo URL'))
+            return
+
+        self.stdout.write(f'Checking {len(projects)} demo URLs...')
+
+        changed_count = 0
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            futures = {
+                executor.submit(refresh_iframe_support, project): project
+                for project in projects
+            }
+            for future in as_completed(futures):
+                project = futures[future]
+                try:
+                    changed = future.result()
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f'  ✗ {project.title}: {e}'))
+                    continue
+
+                status = 'embeddable' if project.iframe_supported else 'blocked'
+                if changed:
+                    changed_count += 1
+                    self.stdout.write(self.style.SUCCESS(f'  ✓ {project.title}: {status} (changed)'))
+                else:
+                    self.stdout.write(f'  ✓ {project.title}: {status}')
+
+        self.stdout.write(self.style.SUCCESS(f'\n✓ Done! {changed_count} project(s) changed'))
@@ -1,9 +1,25 @@
+"""
+Django management command to fix image paths by matching DB records with actual Supabase files.
+Usage: python manage.py fix_image_paths [--dry-run]
+
+버킷 전체 색인으로 경로/파일명/정규화한 이름 색인을 한 번 만들고 (core.media)
+프로필 사진, 메인 배너, 프로젝트 이미지 경로를 대조하여 다른 경로만 bulk_update로 수정합니다.
+"""
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from django.core.files.storage import default_storage
+
+from core.media import reconcile_file_fields
 from core.models import Profile, MainPageContent
 from projects.models import ProjectImage
-from supabase import create_client
-import re
+
+# 대조할 (모델, 파일 필드)
+TARGETS = [
+    (Profile, 'photo'),
+    (MainPageContent, 'main_banner'),
+    (ProjectImage, 'image'),
+]
+
 
 class Command(BaseCommand):
     help = 'Fix image paths by matching DB records with actual Supabase files'
@@ -22,165 +38,37 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR('Supabase not configured'))
             return
 
-        client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
-        bucket = settings.SUPABASE_BUCKET
-
-        # Get all files from Supabase
+        # Get all files from Supabase (버킷 전체 재귀 순회, 명령 실행 동안 한 번만)
         self.stdout.write('Scanning Supabase Storage...')
-        all_files = []
-
         try:
-            # List root
-            root_files = client.storage.from_(bucket).list()
-
-            for item in root_files:
-                name = item.get('name', '')
-                if item.get('id'):  # File
-                    all_files.append(name)
-                else:  # Directory
-                    try:
-                        subfiles = client.storage.from_(bucket).list(name)
-                        for subfile in subfiles:
-                            if subfile.get('id'):
-                                all_files.append(f"{name}/{subfile['name']}")
-                    except:
-                        pass
-
-            self.stdout.write(self.style.SUCCESS(f'Found {len(all_files)} files in Supabase'))
-
-            # Create lookup by base filename (for matching)
-            file_lookup = {}
-            for filepath in all_files:
-                # Extract base name without extension
-                base = filepath.split('/')[-1]
-                base_clean = re.sub(r'_[a-zA-Z0-9]{7,}\.', '.', base)  # Remove Django suffix
-                file_lookup[base] = filepath
-                file_lookup[base_clean] = filepath
-
+            all_files = set(default_storage.bucket_index().paths())
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'Error scanning Supabase: {e}'))
             return
-
+        self.stdout.write(self.style.SUCCESS(f'Found {len(all_files)} files in Supabase'))
         self.stdout.write('\n' + '=' * 80)
 
-        # Fix Profile photos
-        self.stdout.write('\n=== Fixing Profile Photos ===')
-        profiles = Profile.objects.filter(photo__isnull=False)
-
-        for profile in profiles:
-            old_path = str(profile.photo.name)
-            filename = old_path.split('/')[-1]
-
-            self.stdout.write(f'\nProfile: {profile.name}')
-            self.stdout.write(f'  Current DB path: {old_path}')
-
-            # Try to find matching file
-            matched_file = None
-
-            # Direct match
-            if old_path in all_files:
-                matched_file = old_path
-            # Filename match
-            elif filename in file_lookup:
-                matched_file = file_lookup[filename]
-            # Try without extension suffix
-            else:
-                base_name = filename.split('.')[0]
-                for supabase_file in all_files:
-                    if base_name in supabase_file:
-                        matched_file = supabase_file
-                        break
-
-            if matched_file:
-                self.stdout.write(self.style.SUCCESS(f'  ✓ Matched: {matched_file}'))
-
-                if matched_file != old_path:
-                    if not dry_run:
-                        profile.photo.name = matched_file
-                        profile.save(update_fields=['photo'])
-                        self.stdout.write(self.style.SUCCESS(f'  → Updated in DB'))
-                    else:
-                        self.stdout.write(f'  → Would update to: {matched_file}')
-            else:
-                self.stdout.write(self.style.WARNING(f'  ✗ No match found in Supabase'))
-
-        # Fix MainPageContent banners
-        self.stdout.write('\n=== Fixing Main Banners ===')
-        contents = MainPageContent.objects.filter(main_banner__isnull=False)
-
-        for content in contents:
-            old_path = str(content.main_banner.name)
-            filename = old_path.split('/')[-1]
-
-            self.stdout.write(f'\nBanner: {content.title}')
-            self.stdout.write(f'  Current DB path: {old_path}')
-
-            matched_file = None
-
-            if old_path in all_files:
-                matched_file = old_path
-            elif filename in file_lookup:
-                matched_file = file_lookup[filename]
-            else:
-                base_name = filename.split('.')[0]
-                for supabase_file in all_files:
-                    if base_name in supabase_file:
-                        matched_file = supabase_file
-                        break
-
-            if matched_file:
-                self.stdout.write(self.style.SUCCESS(f'  ✓ Matched: {matched_file}'))
-
-                if matched_file != old_path:
-                    if not dry_run:
-                        content.main_banner.name = matched_file
-                        content.save(update_fields=['main_banner'])
-                        self.stdout.write(self.style.SUCCESS(f'  → Updated in DB'))
-                    else:
-                        self.stdout.write(f'  → Would update to: {matched_file}')
-            else:
-                self.stdout.write(self.style.WARNING(f'  ✗ No match found'))
-
-        # Fix ProjectImage
-        self.stdout.write('\n=== Fixing Project Images ===')
-        images = ProjectImage.objects.filter(image__isnull=False)
-
-        for img in images:
-            old_path = str(img.image.name)
-            filename = old_path.split('/')[-1]
-
-            self.stdout.write(f'\nProject: {img.project.title} - Image {img.order}')
-            self.stdout.write(f'  Current DB path: {old_path}')
-
-            matched_file = None
-
-            if old_path in all_files:
-                matched_file = old_path
-            elif filename in file_lookup:
-                matched_file = file_lookup[filename]
-            else:
-                base_name = filename.split('.')[0]
-                for supabase_file in all_files:
-                    if base_name in supabase_file:
-                        matched_file = supabase_file
-                        break
-
-            if matched_file:
-                self.stdout.write(self.style.SUCCESS(f'  ✓ Matched: {matched_file}'))
-
-                if matched_file != old_path:
-                    if not dry_run:
-                        img.image.name = matched_file
-                        img.save(update_fields=['image'])
-                        self.stdout.write(self.style.SUCCESS(f'  → Updated in DB'))
-                    else:
-                        self.stdout.write(f'  → Would update to: {matched_file}')
-            else:
-                self.stdout.write(self.style.WARNING(f'  ✗ No match found'))
-
+        results = reconcile_file_fields(TARGETS, all_files, dry_run=dry_run)
+
+        for result in results:
+            self.stdout.write(f"\n=== {result['label']} ===")
+            self.stdout.write(
+                f"  Checked: {result['checked']}, matched: {result['matched']}, "
+                f"unmatched: {len(result['unmatched'])}"
+            )
+            for pk, old_path, new_path in result['updated']:
+                action = 'Would update' if dry_run else 'Updated'
+                self.stdout.write(self.style.SUCCESS(f'  ✓ #{pk}: {old_path} → {new_path} ({action})'))
+            for pk, old_path in result['unmatched']:
+                self.stdout.write(self.style.WARNING(f'  ✗ #{pk}: {old_path} (no match found in Supabase)'))
+
+        updated_count = sum(len(result['updated']) for result in results)
         self.stdout.write('\n' + '=' * 80)
         if dry_run:
-            self.stdout.write(self.style.WARNING('\nDRY RUN - No changes were made'))
+            self.stdout.write(self.style.WARNING(f'\nDRY RUN - {updated_count} path(s) would change, no changes were made'))
             self.stdout.write('Run without --dry-run to apply changes')
         else:
-            self.stdout.write(self.style.SUCCESS('\n✓ Image paths have been fixed!'))
+            self.stdout.write(self.style.SUCCESS(f'\n✓ {updated_count} image path(s) have been fixed!'))
+            if updated_count:
+                # bulk_update는 모델 save()를 거치지 않으므로 파생본/메타데이터는 별도로 갱신
+                self.stdout.write('Run build_image_variants to rebuild variants for the updated images')
@@ -0,0 +1,156 @@
+"""
+Django management command to delete media objects no longer referenced by the database.
+Usage: python manage.py gc_media [--dry-run] [--min-age-hours 24] [--batch-size 100]
+
+이미지/파일 교체나 프로젝트 삭제 후 Storage에 남은 파일을 정리합니다.
+버킷 전체 색인과 DB가 참조하는 경로(core, projects 앱의 파일 필드 + 이미지 파생본)를 비교하여
+참조되지 않고 일정 시간 이상 지난 파일을 storage.remove()로 묶어서 삭제합니다.
+묶음마다 삭제 직전에 DB 참조를 다시 모아, 실행 중에 참조되기 시작한 파일은 지우지 않습니다.
+DB 경로가 Storage에 없으면 fix_image_paths와 같은 규칙으로 대응하는 파일을 찾아 보존합니다.
+"""
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+
+from core.media import PathIndex, collect_file_references
+from portfolio.storage_backends import REMOVE_BATCH_SIZE
+
+# Supabase가 빈 폴더를 유지하기 위해 만드는 파일 - 삭제하지 않음
+PLACEHOLDER_NAME = '.emptyFolderPlaceholder'
+
+
+def _parse_time(value):
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def kept_paths(referenced, index, path_index):
+    """
+    삭제하면 안 되는 Storage 경로와 경로가 어긋난 참조를 반환합니다.
+    DB 경로가 Storage에 없으면 fix_image_paths와 같은 규칙(PathIndex.match - 같은 파일명, Django 접미사 등)으로
+    대응하는 파일을 찾아 참조된 것으로 봅니다. (DB 경로를 고치기 전에 실제 파일을 지우지 않도록)
+
+    Returns:
+        tuple: (보존할 경로 set, {Storage에 없는 DB 경로: 대응 파일 경로 또는 None})
+    """
+    kept = set(referenced)
+    drifted = {}
+    for path in referenced:
+        if path not in index:
+            drifted[path] = path_index.match(path)
+            if drifted[path]:
+                kept.add(drifted[path])
+    return kept, drifted
+
+
+class Command(BaseCommand):
+    help = 'Delete storage objects that no model file field references'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='List orphaned objects without deleting them',
+        )
+        parser.add_argument(
+            '--min-age-hours',
+            type=float,
+            default=24,
+            help='Only delete objects not modified for this many hours (default: 24)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=REMOVE_BATCH_SIZE,
+            help=f'Objects per remove request (default: {REMOVE_BATCH_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        if not settings.SUPABASE_URL or not settings.SUPABASE_KEY:
+            self.stdout.write(self.style.ERROR('Supabase not configured'))
+            return
+
+        # 색인을 먼저 만들고 참조를 나중에 모음 -> 순회 중 업로드되어 저장된 파일도 참조로 확인됨
+        self.stdout.write('Scanning Supabase Storage...')
+        try:
+            index = default_storage.bucket_index()
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f'Error scanning Supabase: {e}'))
+            return
+
+        referenced = collect_file_references()
+        self.stdout.write(f'Found {len(index)} files in Supabase, {len(referenced)} referenced by the database')
+
+        if not referenced and len(index):
+            # 빈 DB(잘못된 DATABASE_URL 등)로 실행하면 버킷 전체가 고아로 보이므로 중단
+            self.stdout.write(self.style.ERROR('No file references found in the database, aborting'))
+            return
+
+        path_index = PathIndex(index.paths())
+        kept, drifted = kept_paths(referenced, index, path_index)
+        if drifted:
+            self.stdout.write(self.style.WARNING(
+                f'{len(drifted)} referenced path(s) missing from Supabase (run fix_image_paths):'
+            ))
+            for path, match in sorted(drifted.items()):
+                self.stdout.write(f'  {path} -> {match or "no matching file"}')
+
+        # 업로드 직후 DB 저장 전인 파일(파생본 생성 중 등)을 지우지 않도록 최근 파일은 제외
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=options['min_age_hours'])
+        orphans = []
+        recent_count = 0
+        for entry in index:
+            path = entry['path']
+            if path in kept or path.rsplit('/', 1)[-1] == PLACEHOLDER_NAME:
+                continue
+            updated_at = _parse_time(entry['updated_at'])
+            if updated_at is None or updated_at > cutoff:
+                recent_count += 1
+                continue
+            orphans.append(entry)
+
+        orphan_bytes = sum(entry['size'] or 0 for entry in orphans)
+        self.stdout.write('=' * 80)
+        for entry in orphans:
+            self.stdout.write(f"  {entry['path']} ({entry['size'] or 0:,} bytes, {entry['updated_at']})")
+        self.stdout.write('=' * 80)
+        self.stdout.write(
+            f'Orphaned: {len(orphans)} files ({orphan_bytes:,} bytes), '
+            f'skipped {recent_count} newer than {options["min_age_hours"]:g}h'
+        )
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('\nDRY RUN - No files were deleted'))
+            return
+
+        deleted_count = 0
+        rereferenced_count = 0
+        batch_size = max(1, options['batch_size'])
+        for start in range(0, len(orphans), batch_size):
+            # 내용 주소 모드에서는 같은 내용 업로드가 기존(오래된) 객체를 그대로 재사용하므로
+            # 목록을 만든 뒤 새로 참조된 파일이 있을 수 있음 -> 삭제 직전에 참조를 다시 확인
+            kept, _ = kept_paths(collect_file_references(), index, path_index)
+            batch = []
+            for entry in orphans[start:start + batch_size]:
+                if entry['path'] in kept:
+                    rereferenced_count += 1
+                    self.stdout.write(self.style.WARNING(f"  ⊙ Now referenced, kept: {entry['path']}"))
+                    continue
+                batch.append(entry['path'])
+            if not batch:
+                continue
+            try:
+                deleted_count += default_storage.delete_many(batch)
+            except IOError as e:
+                self.stdout.write(self.style.ERROR(f'  ✗ Batch {start // batch_size + 1}: {e}'))
+                continue
+            self.stdout.write(f'  Deleted {deleted_count}/{len(orphans)}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✓ Deleted {deleted_count} orphaned file(s), kept {rereferenced_count} referenced during the run'
+        ))
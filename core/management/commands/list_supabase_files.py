@@ -1,42 +1,41 @@
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from supabase import create_client
+from django.core.files.storage import default_storage
+
 
 class Command(BaseCommand):
-    help = 'List all files in Supabase Storage bucket'
+    help = 'List all files in Supabase Storage bucket (recursive)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prefix',
+            default='',
+            help='Only list files under this directory (e.g. "project/img")',
+        )
 
     def handle(self, *args, **options):
         if not settings.SUPABASE_URL or not settings.SUPABASE_KEY:
             self.stdout.write(self.style.ERROR('Supabase credentials not configured'))
             return
 
-        client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
         bucket = settings.SUPABASE_BUCKET
+        prefix = options['prefix'].strip('/')
 
         self.stdout.write(self.style.SUCCESS(f'Bucket: {bucket}'))
         self.stdout.write('=' * 80)
 
         try:
-            # List all files in root
-            files = client.storage.from_(bucket).list()
-
-            self.stdout.write(f'\n=== Root Level ({len(files)} items) ===')
-            for file in files:
-                if file.get('id'):  # It's a file
-                    self.stdout.write(f"  FILE: {file['name']}")
-                else:  # It's a folder
-                    self.stdout.write(f"  DIR:  {file['name']}/")
-
-                    # List files in subdirectory
-                    try:
-                        subfiles = client.storage.from_(bucket).list(file['name'])
-                        for subfile in subfiles:
-                            if subfile.get('id'):
-                                self.stdout.write(f"    FILE: {file['name']}/{subfile['name']}")
-                    except Exception as e:
-                        self.stdout.write(f"    Error listing: {e}")
-
+            # 버킷 전체를 한 번 재귀 순회한 색인 사용 (하위 디렉토리 깊이/페이지 크기 제한 없음)
+            index = default_storage.bucket_index()
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'Error: {e}'))
+            return
+
+        entries = [entry for entry in index if not prefix or entry['path'].startswith(f'{prefix}/')]
+        for entry in entries:
+            self.stdout.write(f"  FILE: {entry['path']} ({entry['size'] or 0:,} bytes)")
 
         self.stdout.write('\n' + '=' * 80)
+        self.stdout.write(
+            f"Total: {len(entries)} files, {sum(entry['size'] or 0 for entry in entries):,} bytes"
+        )
@@ -0,0 +1,20 @@
+"""
+Django management command to rebuild the project full-text search index.
+Usage: python manage.py rebuild_search_index
+
+프로젝트 제목/설명과 캐시된 GitHub README 원문을 모두 다시 색인합니다.
+평소에는 저장 시 시그널로 증분 갱신되므로 배포 직후나 색인이 어긋났을 때만 실행합니다.
+"""
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from projects import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for all projects (including README text)'
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'Rebuilding search index ({connection.vendor})...')
+        count = search.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'✓ Indexed {count} project(s)'))
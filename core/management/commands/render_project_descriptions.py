@@ -0,0 +1,41 @@
+"""
+Django management command to pre-render Markdown descriptions of existing projects.
+Usage: python manage.py render_project_descriptions [--force]
+
+Project.description_html이 비어 있는 기존 데이터를 채우는 백필 명령입니다.
+"""
+from django.core.management.base import BaseCommand
+
+from core.caching import bump_content_version
+from projects.models import Project
+
+
+class Command(BaseCommand):
+    help = 'Backfill pre-rendered Markdown HTML for project descriptions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-render every project even if its source hash is unchanged',
+        )
+
+    def handle(self, *args, **options):
+        projects = list(Project.objects.only('id', 'title', 'description', 'description_hash'))
+
+        updated = []
+        for project in projects:
+            if options['force']:
+                project.description_hash = ''
+            if project.render_description():
+                updated.append(project)
+                self.stdout.write(f'  ✓ Rendered: {project.title}')
+
+        if updated:
+            # save()를 거치지 않으므로 updated_at과 임베드 확인은 건드리지 않음
+            Project.objects.bulk_update(updated, ['description_html', 'description_hash'], batch_size=100)
+            bump_content_version()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'\n✓ Done! Rendered {len(updated)} of {len(projects)} project(s)'
+        ))
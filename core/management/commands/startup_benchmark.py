@@ -0,0 +1,109 @@
+"""
+Django management command to measure process startup (import) cost.
+Usage: python manage.py startup_benchmark [--target setup|asgi|wsgi] [--command "check"] [--top 15] [--repeat 3]
+
+새 파이썬 프로세스에서 `python -X importtime`으로 Django 초기화를 실행하고,
+stderr의 "import time:" 기록을 루트 패키지별로 합산하여 import 시간이 큰 순으로 보여줍니다.
+gunicorn 워커/관리 명령 콜드 스타트에서 어떤 패키지가 시간을 쓰는지 확인할 때 사용합니다.
+"""
+import os
+import re
+import shlex
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# 측정 대상별 실행 코드
+TARGETS = {
+    'setup': 'import django; django.setup()',
+    # gunicorn(uvicorn 워커)이 로드하는 ASGI 애플리케이션 (URLconf/미들웨어까지 포함)
+    'asgi': 'from portfolio.asgi import application',
+    'wsgi': 'from portfolio.wsgi import application',
+}
+
+# "import time: self [us] | cumulative | imported package" 형식 (하위 import는 이름 앞 공백으로 들여쓰기)
+IMPORT_TIME_RE = re.compile(r'^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)')
+
+
+def parse_import_times(stderr: str) -> dict:
+    """
+    -X importtime 출력을 루트 패키지별로 합산합니다.
+
+    Returns:
+        dict: {패키지: {'self': 해당 패키지 모듈 자체 실행 시간 합(µs),
+                       'cumulative': 해당 패키지를 처음 import할 때 끌려온 하위 import 포함 시간(µs)}}
+    """
+    totals = defaultdict(lambda: {'self': 0, 'cumulative': 0})
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        if not match:
+            continue
+        own, cumulative, indent, module = match.groups()
+        package = module.split('.')[0]
+        totals[package]['self'] += int(own)
+        if module == package:
+            totals[package]['cumulative'] = max(totals[package]['cumulative'], int(cumulative))
+    return dict(totals)
+
+
+class Command(BaseCommand):
+    help = 'Measure startup import time per package using python -X importtime'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target',
+            choices=sorted(TARGETS),
+            default='setup',
+            help='What to start: django.setup() only, or the full ASGI/WSGI application (default: setup)',
+        )
+        parser.add_argument(
+            '--command',
+            default='',
+            help='Run a manage.py command instead of --target (e.g. "check" or "showmigrations core")',
+        )
+        parser.add_argument('--top', type=int, default=15, help='Number of packages to show (default: 15)')
+        parser.add_argument('--repeat', type=int, default=3, help='Runs to take the fastest of (default: 3)')
+
+    def handle(self, *args, **options):
+        if options['command']:
+            manage_py = os.path.join(settings.BASE_DIR, 'manage.py')
+            argv = [sys.executable, '-X', 'importtime', manage_py, *shlex.split(options['command'])]
+            label = f"manage.py {options['command']}"
+        else:
+            argv = [sys.executable, '-X', 'importtime', '-c', TARGETS[options['target']]]
+            label = options['target']
+
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings.SETTINGS_MODULE}
+
+        # 첫 실행은 .pyc 생성/디스크 캐시 영향을 받으므로 가장 빠른 실행을 기준으로 사용
+        best = None
+        for _ in range(max(1, options['repeat'])):
+            started = time.perf_counter()
+            result = subprocess.run(argv, env=env, cwd=settings.BASE_DIR, capture_output=True, text=True)
+            elapsed = time.perf_counter() - started
+            if result.returncode != 0:
+                raise CommandError(f'{label} failed:\n{result.stderr[-2000:]}')
+            if best is None or elapsed < best[0]:
+                best = (elapsed, result.stderr)
+
+        elapsed, stderr = best
+        totals = parse_import_times(stderr)
+        total_import = sum(times['self'] for times in totals.values())
+
+        # self: 패키지 자체 비용(합계 = 전체 import 시간), cumulative: 그 패키지를 없앴을 때 줄어드는 시간의 상한
+        self.stdout.write(f'Startup benchmark: {label} ({settings.SETTINGS_MODULE})')
+        self.stdout.write('=' * 68)
+        self.stdout.write(f"{'package':<28}{'self':>12}{'share':>9}{'cumulative':>16}")
+        ranked = sorted(totals.items(), key=lambda item: item[1]['self'], reverse=True)
+        for package, times in ranked[:options['top']]:
+            share = times['self'] / total_import * 100 if total_import else 0
+            self.stdout.write(
+                f"{package:<28}{times['self'] / 1000:>9.1f} ms{share:>8.1f}%{times['cumulative'] / 1000:>13.1f} ms"
+            )
+        self.stdout.write('=' * 68)
+        self.stdout.write(f'Total import time: {total_import / 1000:.1f} ms')
+        self.stdout.write(self.style.SUCCESS(f'Wall time (fastest of {max(1, options["repeat"])}): {elapsed * 1000:.1f} ms'))
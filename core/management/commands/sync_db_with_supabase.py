@@ -2,7 +2,7 @@ from django.core.management.base import BaseCommand
 from django.conf import settings
 from core.models import Profile, MainPageContent
 from projects.models import ProjectImage
-from supabase import create_client
+from django.core.files.storage import default_storage
 
 class Command(BaseCommand):
     help = 'Sync database image paths with existing Supabase files'
@@ -12,30 +12,26 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR('Supabase not configured'))
             return
 
-        client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
-        bucket = settings.SUPABASE_BUCKET
-
         self.stdout.write('Fetching files from Supabase...')
 
-        # Get all files from Supabase
+        # Get all files from Supabase (버킷 전체를 한 번 재귀 순회한 색인에서 디렉토리별로 조회)
         supabase_files = {}
 
         try:
-            # List directories
-            for directory in ['photos', 'banners', 'project/img']:
-                try:
-                    files = client.storage.from_(bucket).list(directory.replace('/', ''))
-                    for file in files:
-                        if file.get('id'):  # It's a file
-                            path = f"{directory}/{file['name']}"
-                            supabase_files[directory] = path
-                            self.stdout.write(f'  Found: {path}')
-                except Exception as e:
-                    self.stdout.write(f'  No files in {directory}')
+            index = default_storage.bucket_index()
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'Error: {e}'))
             return
 
+        for directory in ['photos', 'banners', 'project/img']:
+            entries = index.in_directory(directory)
+            if not entries:
+                self.stdout.write(f'  No files in {directory}')
+                continue
+            for entry in entries:
+                supabase_files[directory] = entry['path']
+                self.stdout.write(f"  Found: {entry['path']}")
+
         self.stdout.write(f'\nFound {len(supabase_files)} directories with files\n')
         self.stdout.write('=' * 80)
 
@@ -26,7 +26,7 @@ class Command(BaseCommand):
             self.stdout.write('\nTesting file upload to Supabase...')
 
             try:
-                from portfolio.storage import SupabaseStorage
+                from portfolio.storage_backends import SupabaseStorage
                 storage = SupabaseStorage()
 
                 # Create test file
@@ -1,67 +1,253 @@
-from django.core.management.base import BaseCommand
-from django.core.files import File
+"""
+Django management command to upload local media files to Supabase Storage.
+Usage: python manage.py upload_local_media [--workers 8] [--retries 3] [--manifest PATH]
+
+media/ 디렉토리를 한 번만 훑어 이미지 파일을 찾고, 스레드 풀로 동시에 업로드합니다.
+파일별 결과(경로, 크기, 수정 시각, sha256, 상태)를 매니페스트 JSON에 기록하므로
+중단된 실행을 다시 시작하면 이미 끝난 파일은 Storage 확인 없이 건너뜁니다.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
 from django.conf import settings
-from pathlib import Path
+from django.core.files import File
+from django.core.management.base import BaseCommand
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+
+# 매니페스트에서 완료로 보는 상태 (uploaded: 이번 도구로 업로드, exists: Storage에 이미 있었음)
+DONE_STATUSES = {'uploaded', 'exists'}
+
+# 이 개수만큼 완료될 때마다 매니페스트를 저장 (중단되어도 그 이후만 다시 처리)
+MANIFEST_SAVE_EVERY = 20
+
+# 재시도 대기 시간: RETRY_BACKOFF * 2^(시도 - 1)초
+RETRY_BACKOFF = 1.0
+
+# 한 번에 올린 객체의 ETag는 내용 MD5 (조각 업로드는 "md5-조각수" 형식이라 비교 불가)
+MD5_ETAG_RE = re.compile(r'^"?([0-9a-f]{32})"?$')
+
+
+def find_media_files(media_dir):
+    """media/ 아래 이미지 파일을 한 번의 순회로 찾아 (Storage 경로, 로컬 경로, stat) 목록으로 반환"""
+    files = []
+    for root, _, filenames in os.walk(media_dir):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            local_path = os.path.join(root, filename)
+            storage_path = os.path.relpath(local_path, media_dir).replace('\\', '/')
+            files.append((storage_path, local_path, os.stat(local_path)))
+    return sorted(files)
+
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(path, manifest):
+    """임시 파일에 쓴 뒤 교체 (저장 중 중단되어도 이전 매니페스트 유지)"""
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def file_digest(local_path, algorithm='sha256'):
+    digest = hashlib.new(algorithm)
+    with open(local_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _parse_time(value):
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def remote_matches(entry, local_path, stat, recorded_sha256=None):
+    """
+    Storage 객체(버킷 색인 항목)가 로컬 파일과 같은 내용인지 확인
+    크기가 같으면 ETag가 MD5일 때는 내용 해시로 비교합니다.
+    조각 업로드 ETag처럼 비교할 수 없으면, 로컬 내용이 매니페스트에 기록된(이전에 올렸거나 확인한)
+    sha256과 같거나 Storage 객체가 로컬 파일 수정 이후에 저장된 경우에만 같은 것으로 봅니다.
+
+    Args:
+        entry: BucketIndex 항목 {'size', 'etag', 'updated_at'}
+        stat: 로컬 파일 os.stat 결과
+        recorded_sha256: 매니페스트에 완료로 기록된 sha256 (없으면 None)
+    """
+    if entry['size'] != stat.st_size:
+        return False
+    match = MD5_ETAG_RE.match(entry['etag'] or '')
+    if match is not None:
+        return match.group(1) == file_digest(local_path, 'md5')
+    if recorded_sha256 and recorded_sha256 == file_digest(local_path):
+        return True
+    updated_at = _parse_time(entry['updated_at'])
+    return updated_at is not None and updated_at.timestamp() >= stat.st_mtime
+
+
+def upload_file(storage, storage_path, local_path, retries):
+    """
+    파일 하나를 업로드합니다. 실패하면 지수 백오프로 retries번까지 다시 시도합니다.
+
+    Returns:
+        tuple: (저장된 경로, sha256)
+
+    Raises:
+        Exception: 마지막 시도의 오류
+    """
+    sha256 = file_digest(local_path)
+    for attempt in range(1, retries + 2):
+        try:
+            with open(local_path, 'rb') as f:
+                return storage.save(storage_path, File(f, name=os.path.basename(local_path))), sha256
+        except Exception:
+            if attempt > retries:
+                raise
+            time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+
+
+def _format_bytes(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GB'
+
 
 class Command(BaseCommand):
-    help = 'Upload all local media files to Supabase Storage'
+    help = 'Upload all local media files to Supabase Storage (concurrent, resumable)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Number of concurrent uploads (default: 8)',
+        )
+        parser.add_argument(
+            '--retries',
+            type=int,
+            default=3,
+            help='Retries per file with exponential backoff (default: 3)',
+        )
+        parser.add_argument(
+            '--manifest',
+            default='',
+            help='Manifest JSON path (default: media/.upload_manifest.json)',
+        )
 
     def handle(self, *args, **options):
-        from portfolio.storage import SupabaseStorage
+        from portfolio.storage_backends import SupabaseStorage
 
         storage = SupabaseStorage()
-        base_dir = settings.BASE_DIR
-        media_dir = base_dir / 'media'
+        # 로컬과 내용이 다른 Storage 파일은 같은 경로에 다시 올려 교체 (새 이름으로 저장하지 않음)
+        storage.file_overwrite = True
+        media_dir = settings.BASE_DIR / 'media'
 
         if not media_dir.exists():
             self.stdout.write(self.style.ERROR(f'Media directory not found: {media_dir}'))
             return
 
+        manifest_path = options['manifest'] or str(media_dir / '.upload_manifest.json')
+        manifest = load_manifest(manifest_path)
+
         self.stdout.write(self.style.SUCCESS(f'Media directory: {media_dir}'))
+        self.stdout.write(f'Manifest: {manifest_path}')
         self.stdout.write('=' * 80)
 
-        # Find all image files
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-        all_files = []
-
-        for ext in image_extensions:
-            all_files.extend(media_dir.rglob(f'*{ext}'))
-
-        self.stdout.write(f'\nFound {len(all_files)} image files\n')
+        all_files = find_media_files(media_dir)
+
+        # 매니페스트에 완료로 기록되고 크기/수정 시각이 같은 파일은 Storage 확인 없이 건너뜀
+        pending = []
+        resumed_count = 0
+        for storage_path, local_path, stat in all_files:
+            entry = manifest.get(storage_path)
+            if (entry and entry.get('status') in DONE_STATUSES
+                    and entry.get('size') == stat.st_size and entry.get('mtime') == stat.st_mtime):
+                resumed_count += 1
+                continue
+            pending.append((storage_path, local_path, stat))
+
+        self.stdout.write(
+            f'\nFound {len(all_files)} image files ({resumed_count} already done, {len(pending)} to check)\n'
+        )
+
+        # 버킷을 한 번 순회한 색인으로 존재 여부와 크기/ETag를 비교 (파일마다 조회하지 않음)
+        index = storage.bucket_index() if pending else None
+        to_upload = []
+        for storage_path, local_path, stat in pending:
+            entry = index.get(storage_path)
+            previous = manifest.get(storage_path) or {}
+            recorded_sha256 = previous.get('sha256') if previous.get('status') in DONE_STATUSES else None
+            if entry is not None and remote_matches(entry, local_path, stat, recorded_sha256):
+                manifest[storage_path] = {
+                    'size': stat.st_size, 'mtime': stat.st_mtime,
+                    'sha256': file_digest(local_path), 'status': 'exists',
+                }
+                self.stdout.write(self.style.WARNING(f'  ⊙ Already exists: {storage_path}'))
+                continue
+            if entry is not None:
+                self.stdout.write(self.style.WARNING(f'  ↻ Changed, re-uploading: {storage_path}'))
+            to_upload.append((storage_path, local_path, stat))
 
         uploaded_count = 0
         failed_count = 0
-
-        for local_file in all_files:
-            # Get relative path from media directory
-            relative_path = local_file.relative_to(media_dir)
-            supabase_path = str(relative_path).replace('\\', '/')
-
-            self.stdout.write(f'\nUploading: {local_file.name}')
-            self.stdout.write(f'  Local: {relative_path}')
-            self.stdout.write(f'  Supabase path: {supabase_path}')
-
-            try:
-                # Check if file already exists
-                if storage.exists(supabase_path):
-                    self.stdout.write(self.style.WARNING(f'  ⊙ Already exists, skipping'))
-                    continue
-
-                # Upload file
-                with open(local_file, 'rb') as f:
-                    saved_path = storage.save(supabase_path, File(f))
-
-                url = storage.url(saved_path)
-                self.stdout.write(self.style.SUCCESS(f'  ✓ Uploaded to: {saved_path}'))
-                self.stdout.write(f'  URL: {url}')
-                uploaded_count += 1
-
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f'  ✗ Failed: {e}'))
-                failed_count += 1
-
+        uploaded_bytes = 0
+        started = time.monotonic()
+
+        try:
+            with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+                futures = {
+                    executor.submit(upload_file, storage, storage_path, local_path, options['retries']):
+                        (storage_path, stat)
+                    for storage_path, local_path, stat in to_upload
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    storage_path, stat = futures[future]
+                    entry = {'size': stat.st_size, 'mtime': stat.st_mtime, 'sha256': None}
+                    progress = f'[{done}/{len(to_upload)}]'
+                    try:
+                        saved_path, entry['sha256'] = future.result()
+                    except Exception as e:
+                        failed_count += 1
+                        entry.update(status='failed', error=str(e))
+                        self.stdout.write(self.style.ERROR(f'  {progress} ✗ {storage_path}: {e}'))
+                    else:
+                        uploaded_count += 1
+                        uploaded_bytes += stat.st_size
+                        entry.update(status='uploaded', saved_path=saved_path)
+                        self.stdout.write(self.style.SUCCESS(
+                            f'  {progress} ✓ {storage_path} ({_format_bytes(stat.st_size)})'
+                        ))
+                    manifest[storage_path] = entry
+
+                    if done % MANIFEST_SAVE_EVERY == 0:
+                        save_manifest(manifest_path, manifest)
+        finally:
+            # Ctrl+C 등으로 중단되어도 완료된 항목까지는 기록
+            save_manifest(manifest_path, manifest)
+
+        elapsed = time.monotonic() - started
         self.stdout.write('\n' + '=' * 80)
-        self.stdout.write(self.style.SUCCESS(f'\n✓ Upload completed!'))
-        self.stdout.write(f'  Uploaded: {uploaded_count}')
+        self.stdout.write(self.style.SUCCESS('\n✓ Upload completed!'))
+        self.stdout.write(f'  Uploaded: {uploaded_count} ({_format_bytes(uploaded_bytes)})')
         self.stdout.write(f'  Failed: {failed_count}')
         self.stdout.write(f'  Skipped: {len(all_files) - uploaded_count - failed_count}')
+        if elapsed > 0 and uploaded_count:
+            self.stdout.write(
+                f'  Throughput: {uploaded_count / elapsed:.1f} files/s, '
+                f'{_format_bytes(uploaded_bytes / elapsed)}/s ({elapsed:.1f}s)'
+            )
@@ -0,0 +1,164 @@
+"""
+미디어 파일 경로 대조
+DB 파일 필드에 저장된 경로를 Storage에 실제로 있는 파일 경로와 맞추고 (fix_image_paths),
+DB가 참조하는 전체 경로를 모아 참조되지 않는 Storage 파일을 찾습니다. (gc_media)
+
+Storage 파일 목록으로 한 번 색인을 만든 뒤 행마다 사전 조회만 하므로
+전체 비용은 O(파일 수 + 행 수)입니다. 일치 순서:
+    1. 같은 경로
+    2. 같은 파일명 (다른 디렉토리로 옮겨진 경우)
+    3. 정규화한 이름 - 확장자와 Django 중복 방지 접미사(_AbC1234) 제거, 소문자
+       (여러 개면 DB 경로와 같은 디렉토리의 파일, 그다음 경로 순 첫 파일)
+"""
+import os
+import re
+from collections import defaultdict
+
+from django.apps import apps
+from django.db import models, transaction
+
+from .caching import bump_content_version
+from .imaging import variant_paths
+
+# Django가 같은 이름 파일을 저장할 때 붙이는 임의 접미사 (예: photo_AbC1234.jpg)
+# get_alternative_name(): "_" + get_random_string(7) (영문 대소문자+숫자 7자)
+# 단어 모양의 7자(team_project, Team_Members, LOGO_DESIGNS - 소문자만, 첫 글자만 대문자, 대문자만)는
+# 실제 이름과 구분할 수 없으므로 접미사로 보지 않음 (그런 모양으로 뽑힌 접미사(약 0.4%)는 제거하지 못함)
+DJANGO_SUFFIX_RE = re.compile(r'_(?![A-Za-z][a-z]{6}$|[A-Z]{7}$)[a-zA-Z0-9]{7}$')
+
+# 파일 참조를 수집할 앱 (업로드 파일 필드가 있는 앱)
+MEDIA_APP_LABELS = ('core', 'projects')
+
+# 원본이 아닌 생성 파일 디렉토리 (이미지 파생본) - 대조 대상에서 제외
+GENERATED_DIRECTORIES = frozenset({'variants'})
+
+BULK_UPDATE_BATCH_SIZE = 100
+
+
+def normalize_name(path: str) -> str:
+    """파일명을 대조용 키로 정규화 (확장자/Django 접미사 제거, 소문자)"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    # 접미사의 대문자 여부로 판단하므로 소문자 변환 전에 제거
+    return DJANGO_SUFFIX_RE.sub('', stem).lower()
+
+
+class PathIndex:
+    """Storage 파일 경로 색인 (경로 / 파일명 / 정규화한 이름별)"""
+
+    def __init__(self, paths):
+        self.paths = set()
+        self.by_basename = defaultdict(list)
+        self.by_normalized = defaultdict(list)
+        for path in sorted(paths):
+            if GENERATED_DIRECTORIES.intersection(path.split('/')[:-1]):
+                continue
+            self.paths.add(path)
+            self.by_basename[os.path.basename(path)].append(path)
+            self.by_normalized[normalize_name(path)].append(path)
+
+    @staticmethod
+    def _pick(candidates, path):
+        """후보 중 path와 같은 디렉토리의 파일 우선"""
+        directory = os.path.dirname(path)
+        for candidate in candidates:
+            if os.path.dirname(candidate) == directory:
+                return candidate
+        return candidates[0]
+
+    def match(self, path: str):
+        """
+        DB 경로에 해당하는 Storage 경로 반환 (없으면 None)
+        """
+        if path in self.paths:
+            return path
+        candidates = self.by_basename.get(os.path.basename(path))
+        if candidates:
+            return self._pick(candidates, path)
+        candidates = self.by_normalized.get(normalize_name(path))
+        if candidates:
+            return self._pick(candidates, path)
+        return None
+
+
+def reconcile_file_fields(targets, storage_paths, dry_run=False, batch_size=BULK_UPDATE_BATCH_SIZE) -> list:
+    """
+    모델 파일 필드 경로를 Storage 파일과 대조하여 다른 경로를 실제 파일 경로로 일괄 수정합니다.
+    수정은 bulk_update로 batch_size개씩 처리하므로 모델 save()/시그널을 거치지 않습니다.
+    (변경이 있으면 콘텐츠 버전을 한 번 올림)
+
+    Args:
+        targets: [(모델 클래스, 파일 필드명)]
+        storage_paths: Storage에 있는 파일 경로 목록 (예: BucketIndex.paths())
+        dry_run: True면 DB를 수정하지 않고 결과만 반환
+
+    Returns:
+        list: 대상별 결과 [{'label', 'checked', 'matched',
+                          'updated': [(pk, 기존 경로, 새 경로)], 'unmatched': [(pk, 기존 경로)]}]
+    """
+    index = PathIndex(storage_paths)
+    results = []
+    changed = False
+
+    for model, field_name in targets:
+        result = {
+            'label': f'{model._meta.label}.{field_name}',
+            'checked': 0,
+            'matched': 0,
+            'updated': [],
+            'unmatched': [],
+        }
+        pending = []
+        rows = (
+            model.objects.exclude(**{f'{field_name}__isnull': True})
+            .exclude(**{field_name: ''})
+            .only('pk', field_name)
+            .order_by('pk')
+        )
+        for obj in rows.iterator():
+            result['checked'] += 1
+            old_path = getattr(obj, field_name).name
+            new_path = index.match(old_path)
+            if new_path is None:
+                result['unmatched'].append((obj.pk, old_path))
+                continue
+            result['matched'] += 1
+            if new_path != old_path:
+                getattr(obj, field_name).name = new_path
+                pending.append(obj)
+                result['updated'].append((obj.pk, old_path, new_path))
+
+        if pending and not dry_run:
+            with transaction.atomic():
+                model.objects.bulk_update(pending, [field_name], batch_size=batch_size)
+            changed = True
+        results.append(result)
+
+    if changed:
+        bump_content_version()
+    return results
+
+
+def collect_file_references(app_labels=MEDIA_APP_LABELS) -> set:
+    """
+    앱 모델의 모든 FileField/ImageField 경로와 `<필드명>_variants`에 기록된 파생본 경로를 모읍니다.
+    모델별로 파일 필드 값만 한 번에 조회합니다. (values_list)
+
+    Returns:
+        set: DB가 참조하는 Storage 경로
+    """
+    referenced = set()
+    for app_label in app_labels:
+        for model in apps.get_app_config(app_label).get_models():
+            field_names = {field.name for field in model._meta.concrete_fields}
+            file_fields = [
+                field.name for field in model._meta.concrete_fields if isinstance(field, models.FileField)
+            ]
+            variant_fields = [f'{name}_variants' for name in file_fields if f'{name}_variants' in field_names]
+            if not file_fields:
+                continue
+
+            for row in model.objects.values_list(*file_fields, *variant_fields).iterator():
+                referenced.update(path for path in row[:len(file_fields)] if path)
+                for variants in row[len(file_fields):]:
+                    referenced.update(variant_paths(variants))
+    return referenced
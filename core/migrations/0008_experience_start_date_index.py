@@ -0,0 +1,17 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_drop_skill_proficiency_column'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['-start_date'], name='experience_start_date_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_experience_start_date_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mainpagecontent",
+            name="main_banner_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="배너 파생 이미지",
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="photo_variants",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                editable=False,
+                verbose_name="프로필 사진 파생 이미지",
+            ),
+        ),
+    ]
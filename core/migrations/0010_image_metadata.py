@@ -0,0 +1,72 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mainpagecontent",
+            name="main_banner_color",
+            field=models.CharField(
+                blank=True, editable=False, max_length=7, verbose_name="배너 대표 색상"
+            ),
+        ),
+        migrations.AddField(
+            model_name="mainpagecontent",
+            name="main_banner_height",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="배너 높이"
+            ),
+        ),
+        migrations.AddField(
+            model_name="mainpagecontent",
+            name="main_banner_placeholder",
+            field=models.TextField(
+                blank=True, editable=False, verbose_name="배너 미리보기"
+            ),
+        ),
+        migrations.AddField(
+            model_name="mainpagecontent",
+            name="main_banner_width",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="배너 너비"
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="photo_color",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=7,
+                verbose_name="프로필 사진 대표 색상",
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="photo_height",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="프로필 사진 높이"
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="photo_placeholder",
+            field=models.TextField(
+                blank=True, editable=False, verbose_name="프로필 사진 미리보기"
+            ),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="photo_width",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="프로필 사진 너비"
+            ),
+        ),
+    ]
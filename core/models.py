@@ -2,6 +2,7 @@ from django.db import models
 from datetime import date
 from dateutil.relativedelta import relativedelta
 from django.core.validators import MinValueValidator, MaxValueValidator
+from .imaging import process_image
 
 
 
@@ -10,6 +11,12 @@ class MainPageContent(models.Model):
     subtitle = models.TextField(verbose_name="부제목")
     main_banner = models.ImageField(upload_to='banners/', blank=True, null=True,
     verbose_name="메인 배너 이미지")
+    main_banner_variants = models.JSONField(default=dict, blank=True, editable=False,
+    verbose_name="배너 파생 이미지")
+    main_banner_width = models.PositiveIntegerField(blank=True, null=True, editable=False, verbose_name="배너 너비")
+    main_banner_height = models.PositiveIntegerField(blank=True, null=True, editable=False, verbose_name="배너 높이")
+    main_banner_color = models.CharField(max_length=7, blank=True, editable=False, verbose_name="배너 대표 색상")
+    main_banner_placeholder = models.TextField(blank=True, editable=False, verbose_name="배너 미리보기")
 
     class Meta:
         verbose_name = "1.메인 페이지 설정"
@@ -17,11 +24,21 @@ class MainPageContent(models.Model):
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        # 배너가 바뀐 경우에만 너비별 WebP/AVIF 파생본과 크기/대표 색상/미리보기 생성
+        process_image(self, 'main_banner')
+        super().save(*args, **kwargs)
     
 class Profile(models.Model):
     name = models.CharField(max_length=200, verbose_name="이름")
     english_name = models.CharField(max_length=100)
     photo = models.ImageField(upload_to="photos/", blank=True, null=True, verbose_name="프로필 사진")
+    photo_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name="프로필 사진 파생 이미지")
+    photo_width = models.PositiveIntegerField(blank=True, null=True, editable=False, verbose_name="프로필 사진 너비")
+    photo_height = models.PositiveIntegerField(blank=True, null=True, editable=False, verbose_name="프로필 사진 높이")
+    photo_color = models.CharField(max_length=7, blank=True, editable=False, verbose_name="프로필 사진 대표 색상")
+    photo_placeholder = models.TextField(blank=True, editable=False, verbose_name="프로필 사진 미리보기")
     introduce = models.TextField(verbose_name="자기 소개")
     birth_date = models.DateField()
     email = models.CharField(max_length=200, verbose_name="이메일")
@@ -36,6 +53,10 @@ class Profile(models.Model):
     
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        process_image(self, 'photo')
+        super().save(*args, **kwargs)
     
 class Education(models.Model):
     profile = models.ForeignKey(Profile, on_delete=models.CASCADE)
@@ -117,6 +138,10 @@ class Experience(models.Model):
         verbose_name = "4.경력"
         verbose_name_plural = "4.경력"
         ordering = ["-start_date"]
+        indexes = [
+            # 홈 화면 경력 목록 정렬
+            models.Index(fields=["-start_date"], name="experience_start_date_idx"),
+        ]
 
     def __str__(self):
         return f"{self.company} - {self.position}"
\ No newline at end of file
@@ -5,8 +5,13 @@ Core app의 비즈니스 로직을 담당하는 서비스 계층
 from datetime import date
 from dateutil.relativedelta import relativedelta
 from typing import Optional
+from django.conf import settings
+from django.core.cache import cache
+from .caching import versioned_key
 from .models import Experience
 
+PORTFOLIO_CONTEXT_CACHE_PREFIX = 'portfolio:context'
+
 
 def calculate_total_experience(experiences=None) -> str:
     """
@@ -80,12 +85,31 @@ def calculate_total_experience(experiences=None) -> str:
 def get_portfolio_context() -> dict:
     """
     포트폴리오 홈페이지에 필요한 모든 데이터를 조회하여 컨텍스트로 반환합니다.
+    조회 결과는 콘텐츠 버전별로 캐시되며, 모델이 변경되면 시그널에 의해 버전이 올라갑니다.
+    캐시 적중 시에는 DB 조회가 발생하지 않습니다.
 
     Returns:
         dict: 템플릿 렌더링에 필요한 컨텍스트 딕셔너리
     """
+    cache_key = versioned_key(PORTFOLIO_CONTEXT_CACHE_PREFIX)
+    snapshot = cache.get(cache_key)
+    if snapshot is None:
+        snapshot = _build_portfolio_snapshot()
+        cache.set(cache_key, snapshot, settings.PORTFOLIO_CONTEXT_CACHE_TIMEOUT)
+
+    context = dict(snapshot)
+    # 총 경력은 오늘 날짜에 따라 달라지므로 캐시된 경력 목록으로 매번 계산 (DB 조회 없음)
+    context['total_experience_duration'] = calculate_total_experience(snapshot['experiences'])
+    return context
+
+
+def _build_portfolio_snapshot() -> dict:
+    """
+    홈페이지 컨텍스트를 DB에서 조회합니다.
+    캐시에 저장할 수 있도록 QuerySet은 모두 리스트로 평가하여 반환합니다.
+    """
     from .models import MainPageContent, Profile, Skill, Education
-    from projects.models import Project
+    from projects.services import get_project_page
 
     # 메인 컨텐츠 및 프로필 조회
     try:
@@ -96,8 +120,8 @@ def get_portfolio_context() -> dict:
         profile = None
 
     # 관련 데이터 조회
-    experiences = Experience.objects.all().order_by('-start_date')
-    educations = Education.objects.all().order_by('-start_date')
+    experiences = list(Experience.objects.all().order_by('-start_date'))
+    educations = list(Education.objects.all().order_by('-start_date'))
     
     # Skill 데이터를 카테고리별로 그룹화하고 평균 계산
     skills = Skill.objects.all().order_by('category', 'order')
@@ -118,11 +142,9 @@ def get_portfolio_context() -> dict:
     
     skill_data_for_template = list(grouped_skills.values())
 
-    # 프로젝트 조회 (최신 6개, 관련 이미지 prefetch)
-    projects = Project.objects.select_related('company').prefetch_related('images').order_by('-start_date')[:6]
-
-    # 총 경력 기간 계산
-    total_experience_duration = calculate_total_experience(experiences)
+    # 프로젝트 첫 페이지 조회 (최신 6개, 대표 이미지는 조인으로 함께 조회)
+    # 이후 페이지는 무한 스크롤로 projects:list_json에서 불러옴
+    projects, next_cursor = get_project_page()
 
     return {
         'main_content': main_content,
@@ -131,5 +153,5 @@ def get_portfolio_context() -> dict:
         'experiences': experiences,
         'educations': educations,
         'projects': projects,
-        'total_experience_duration': total_experience_duration,
+        'next_cursor': next_cursor,
     }
@@ -0,0 +1,40 @@
+"""
+포트폴리오 콘텐츠 변경 감지 시그널
+관리자 화면 등에서 콘텐츠 모델이 저장/삭제되면 콘텐츠 버전을 올려 캐시를 무효화합니다.
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from projects.models import Project, ProjectImage, ProjectFile
+from .caching import bump_content_version
+from .models import MainPageContent, Profile, Experience, Education, Skill
+
+# 홈페이지 컨텍스트 및 프로젝트 상세 JSON에 포함되는 모델들
+CONTENT_MODELS = (
+    MainPageContent,
+    Profile,
+    Experience,
+    Education,
+    Skill,
+    Project,
+    ProjectImage,
+    ProjectFile,
+)
+
+
+def invalidate_content_cache(sender, **kwargs):
+    # 트랜잭션 커밋 이후에 버전을 올려야 커밋 전 데이터로 캐시가 다시 채워지지 않음
+    transaction.on_commit(bump_content_version)
+
+
+def connect_signals():
+    for model in CONTENT_MODELS:
+        label = model._meta.label_lower
+        post_save.connect(
+            invalidate_content_cache, sender=model,
+            dispatch_uid=f'content_version_save_{label}',
+        )
+        post_delete.connect(
+            invalidate_content_cache, sender=model,
+            dispatch_uid=f'content_version_delete_{label}',
+        )
@@ -0,0 +1,73 @@
+from django import template
+from django.core.files.storage import default_storage
+from django.utils.html import format_html, format_html_join
+
+register = template.Library()
+
+# 파생본 형식별 MIME 타입 (<source>는 이 순서대로 출력 -> 브라우저가 지원하는 첫 형식 사용)
+SOURCE_TYPES = (('avif', 'image/avif'), ('webp', 'image/webp'))
+
+
+@register.filter(name='srcset')
+def srcset(variants, fmt='webp'):
+    """
+    파생본 경로 dict를 srcset 문자열로 변환
+    사용: {{ image.image_variants|srcset:"webp" }} -> "https://.../a-320w.webp 320w, ..."
+    """
+    entries = (variants or {}).get(fmt) or {}
+    return ', '.join(
+        f'{default_storage.url(name)} {width}w'
+        for width, name in sorted(entries.items(), key=lambda item: int(item[0]))
+    )
+
+
+def image_data(instance, field_name):
+    """
+    이미지 표시에 필요한 값을 저장된 필드에서만 모아 반환 (원본 파일을 열지 않음)
+    프로젝트 JSON 응답과 picture 태그가 함께 사용합니다.
+
+    Returns:
+        dict: {url, srcset(WebP), width, height, color, placeholder}
+    """
+    field_file = getattr(instance, field_name)
+    return {
+        'url': field_file.url,
+        'srcset': srcset(getattr(instance, f'{field_name}_variants')),
+        'width': getattr(instance, f'{field_name}_width'),
+        'height': getattr(instance, f'{field_name}_height'),
+        'color': getattr(instance, f'{field_name}_color'),
+        'placeholder': getattr(instance, f'{field_name}_placeholder'),
+    }
+
+
+@register.simple_tag
+def picture(instance, field_name, alt='', sizes='100vw', css_class='', loading='lazy'):
+    """
+    이미지 필드로 <picture> 태그 생성
+    - 파생본이 있으면 형식별 <source srcset>을 출력 (없으면 원본 <img>만)
+    - 저장된 크기로 width/height를 지정하여 로딩 전 레이아웃 이동 방지
+    - 로딩 중에는 대표 색상 + 블러 미리보기를 배경으로 표시
+    사용: {% picture project.thumbnail "image" alt=project.title sizes="400px" %}
+    """
+    variants = getattr(instance, f'{field_name}_variants') or {}
+    data = image_data(instance, field_name)
+
+    sources = format_html_join(
+        '',
+        '<source type="{}" srcset="{}" sizes="{}">',
+        ((mime, srcset(variants, fmt), sizes) for fmt, mime in SOURCE_TYPES if variants.get(fmt)),
+    )
+
+    attrs = ''
+    if data['width'] and data['height']:
+        attrs = format_html(' width="{}" height="{}"', data['width'], data['height'])
+    if data['placeholder']:
+        attrs += format_html(
+            ' style="background: {} url({}) center / cover no-repeat;"',
+            data['color'], data['placeholder'],
+        )
+
+    return format_html(
+        '<picture>{}<img src="{}" alt="{}" class="{}" loading="{}" decoding="async"{}></picture>',
+        sources, data['url'], alt, css_class, loading, attrs,
+    )
@@ -1,3 +1,7 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 import markdown
 from django import template
 from django.template.defaultfilters import stringfilter
@@ -5,8 +9,70 @@ from django.utils.safestring import mark_safe
 
 register = template.Library()
 
+# fenced_code, tables 등 유용한 확장기능을 추가할 수 있습니다.
+DEFAULT_EXTENSIONS = ('fenced_code', 'tables')
+
+
+class MarkdownCache:
+    """
+    Markdown 변환 결과 LRU 캐시
+    (내용 해시, 확장 목록)을 키로 사용하고, 확장 목록별로 미리 만든
+    markdown.Markdown 인스턴스를 reset()하여 재사용합니다.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._converters = {}
+        # Markdown 인스턴스는 스레드 안전하지 않으므로 변환 중에는 잠금
+        self._lock = threading.Lock()
+
+    def convert(self, text, extensions=DEFAULT_EXTENSIONS):
+        extensions = tuple(extensions)
+        key = (hashlib.sha1(text.encode('utf-8')).hexdigest(), extensions)
+
+        with self._lock:
+            html = self._results.get(key)
+            if html is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return html
+
+            self.misses += 1
+            converter = self._converters.get(extensions)
+            if converter is None:
+                converter = self._converters[extensions] = markdown.Markdown(extensions=list(extensions))
+            html = converter.reset().convert(text)
+
+            self._results[key] = html
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+            return html
+
+    def info(self):
+        """캐시 적중/실패 통계 반환"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._results),
+                'maxsize': self.maxsize,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+markdown_cache = MarkdownCache()
+
+
 @register.filter(name='convert_markdown')
 @stringfilter
 def convert_makrkdown(value):
-    # fenced_code, tables 등 유용한 확장기능을 추가할 수 있습니다.
-    return mark_safe(markdown.markdown(value, extensions=['fenced_code', 'tables']))
\ No newline at end of file
+    # 같은 내용은 다시 파싱하지 않고 캐시된 HTML 반환
+    return mark_safe(markdown_cache.convert(value))
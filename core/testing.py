@@ -0,0 +1,45 @@
+"""
+테스트 공용 도구
+뷰/서비스가 실제로 보낸 쿼리의 실행 계획을 확인하여, 인덱스가 빠지거나
+쿼리 형태가 바뀌어 인덱스를 타지 못하게 되는 회귀를 잡습니다.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryPlanAssertionsMixin:
+    """TestCase에 섞어 쓰는 실행 계획 검증 도구 (SQLite, PostgreSQL 지원)"""
+
+    def capture_queries(self):
+        return CaptureQueriesContext(connection)
+
+    def explain(self, sql: str) -> str:
+        """SQL 한 건의 실행 계획을 문자열로 반환합니다."""
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                # 테스트 데이터는 몇 행뿐이라 순차 스캔이 항상 이기므로 비활성화하고 확인
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute(f'EXPLAIN {sql}')
+                return '\n'.join(row[0] for row in cursor.fetchall())
+            if connection.vendor == 'sqlite':
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                return '\n'.join(row[-1] for row in cursor.fetchall())
+        self.skipTest(f'{connection.vendor}: 실행 계획 검증 미지원')
+
+    def assertQueryUsesIndex(self, captured, table: str, index_name: str):
+        """
+        캡처한 쿼리 중 table을 조회하는 SELECT가 있고, 그 실행 계획이 모두 index_name을 사용하는지 확인합니다.
+
+        Args:
+            captured: capture_queries()로 캡처한 CaptureQueriesContext
+            table: 조회 대상 테이블명 (예: 'projects_project')
+            index_name: 사용되어야 하는 인덱스명
+        """
+        queries = [
+            query['sql'] for query in captured.captured_queries
+            if query['sql'].startswith('SELECT') and f'FROM "{table}"' in query['sql']
+        ]
+        self.assertTrue(queries, f'{table} 조회 쿼리가 없습니다.')
+        for sql in queries:
+            plan = self.explain(sql)
+            self.assertIn(index_name, plan, f'{index_name} 미사용\nSQL: {sql}\nPLAN:\n{plan}')
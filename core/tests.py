@@ -1,3 +1,509 @@
-from django.test import TestCase
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+import httpx
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from portfolio.storage_backends import BucketIndex, DirectoryListingCache, SupabaseStorage
+
+from . import http_client, imaging
+from .management.commands import gc_media, upload_local_media
+from .media import collect_file_references, normalize_name, reconcile_file_fields
+from .caching import get_content_version
+from .models import Experience, MainPageContent, Skill
+from .services import get_portfolio_context
+from .testing import QueryPlanAssertionsMixin
+
+
+class PortfolioContextQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    """홈 화면 컨텍스트 조회 쿼리의 인덱스 사용 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for year in range(2015, 2025):
+            Experience.objects.create(
+                company=f"회사 {year}",
+                position="개발자",
+                start_date=date(year, 1, 1),
+                end_date=date(year, 12, 31),
+                description="업무",
+            )
+
+    def setUp(self):
+        # 캐시 적중 시에는 쿼리가 나가지 않으므로 비우고 시작
+        cache.clear()
+
+    def test_experiences_ordered_by_index(self):
+        with self.capture_queries() as captured:
+            get_portfolio_context()
+        self.assertQueryUsesIndex(captured, 'core_experience', 'experience_start_date_idx')
+
+    def test_projects_page_ordered_by_index(self):
+        with self.capture_queries() as captured:
+            get_portfolio_context()
+        self.assertQueryUsesIndex(captured, 'projects_project', 'project_start_date_id_idx')
+
+
+class PortfolioContextCacheTests(TestCase):
+    """홈 화면 컨텍스트 스냅샷: 캐시 적중 시 DB 조회 없음, 모델 저장 시 버전이 올라 다시 만들어짐"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Skill.objects.create(name="Python", category="Backend", order=1, level=4.0)
+
+    def setUp(self):
+        cache.clear()
+
+    def skill_names(self, context):
+        return [skill.name for group in context['skill_data'] for skill in group['skills']]
+
+    def test_warm_cache_makes_no_queries(self):
+        get_portfolio_context()
+
+        with self.assertNumQueries(0):
+            context = get_portfolio_context()
+        self.assertEqual(self.skill_names(context), ["Python"])
+
+    def test_saving_model_bumps_version_and_rebuilds_snapshot(self):
+        get_portfolio_context()
+        version = get_content_version()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name="Django", category="Backend", order=2, level=4.0)
+
+        self.assertGreater(get_content_version(), version)
+        context = get_portfolio_context()
+        self.assertEqual(self.skill_names(context), ["Python", "Django"])
+        with self.assertNumQueries(0):
+            get_portfolio_context()
+
+
+class TomorrowDate(date):
+    """date.today()가 내일을 반환하는 date (날짜 변경 시뮬레이션)"""
+
+    @classmethod
+    def today(cls):
+        return date.today() + timedelta(days=1)
+
+
+class HomeConditionalGetTests(TestCase):
+    """홈 화면 조건부 GET: 총 경력 기간은 요청 날짜로 계산되므로 날짜가 바뀌면 304가 아니어야 함"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_same_day_revalidation_returns_304(self):
+        response = self.client.get(reverse('core:home'))
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(reverse('core:home'), HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_revalidation_after_date_change_returns_200(self):
+        response = self.client.get(reverse('core:home'))
+        etag, last_modified = response['ETag'], response['Last-Modified']
+
+        with mock.patch('core.caching.date', TomorrowDate), mock.patch('core.services.date', TomorrowDate):
+            response = self.client.get(reverse('core:home'), HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response['ETag'], etag)
+
+            response = self.client.get(reverse('core:home'), HTTP_IF_MODIFIED_SINCE=last_modified)
+            self.assertEqual(response.status_code, 200)
+
+
+class UnavailableHandler(BaseHTTPRequestHandler):
+    """항상 503을 반환하고 받은 요청 수를 셉니다."""
+    hits = 0
+
+    def do_HEAD(self):
+        type(self).hits += 1
+        self.send_response(503)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(HTTP_CLIENT_RETRIES=2)
+class HttpClientRetryTests(TestCase):
+    def setUp(self):
+        UnavailableHandler.hits = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), UnavailableHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f'http://127.0.0.1:{self.server.server_port}/'
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.addCleanup(http_client._sessions.clear)
+        self.addCleanup(http_client._breakers.clear)
+        http_client._sessions.clear()
+
+    def test_request_path_call_is_not_retried(self):
+        response = http_client.head(self.url, timeout=2, retry=False)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(UnavailableHandler.hits, 1)
+
+    def test_default_call_retries_unavailable_responses(self):
+        response = http_client.head(self.url, timeout=2)
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(UnavailableHandler.hits, 3)
+
+
+class DirectoryListingCacheTests(SimpleTestCase):
+    def test_get_returns_snapshot_unaffected_by_later_changes(self):
+        listing_cache = DirectoryListingCache(ttl=60)
+        listing_cache.set('images', {'a.jpg': {'name': 'a.jpg'}, 'b.jpg': {'name': 'b.jpg'}})
+
+        snapshot = listing_cache.get('images')
+        names = []
+        for name in snapshot:
+            # 순회 중 다른 스레드의 업로드/삭제 반영 (RuntimeError 없이 기존 목록 유지)
+            listing_cache.put('images', 'c.jpg', {'name': 'c.jpg'})
+            listing_cache.discard('images', 'a.jpg')
+            names.append(name)
+
+        self.assertEqual(names, ['a.jpg', 'b.jpg'])
+        self.assertEqual(sorted(listing_cache.get('images')), ['b.jpg', 'c.jpg'])
+        with self.assertRaises(TypeError):
+            snapshot['d.jpg'] = {}
+
+
+class ReconcileFileFieldsTests(TestCase):
+    """Storage 파일 대조 시 Django 임의 접미사만 제거하고 밑줄이 들어간 실제 이름은 유지하는지 확인"""
+
+    def create_banner(self, path):
+        # save()의 파생본 생성을 거치지 않도록 bulk_create 사용
+        return MainPageContent.objects.bulk_create([
+            MainPageContent(title="메인", subtitle="부제목", main_banner=path),
+        ])[0]
+
+    def test_normalize_name_strips_only_random_suffix(self):
+        self.assertEqual(normalize_name('banners/photo_AbC1234.jpg'), 'photo')
+        self.assertEqual(normalize_name('banners/photo_x7kq2m9.jpg'), 'photo')
+        self.assertEqual(normalize_name('banners/team_project.png'), 'team_project')
+        self.assertEqual(normalize_name('banners/Team_Members.png'), 'team_members')
+        self.assertEqual(normalize_name('banners/LOGO_DESIGNS.png'), 'logo_designs')
+
+    def test_suffixed_storage_file_is_matched(self):
+        banner = self.create_banner('banners/photo.jpg')
+
+        result, = reconcile_file_fields(
+            [(MainPageContent, 'main_banner')], ['banners/photo_AbC1234.jpg'], dry_run=True,
+        )
+
+        self.assertEqual(result['updated'], [(banner.pk, 'banners/photo.jpg', 'banners/photo_AbC1234.jpg')])
+
+    def test_underscore_name_is_not_matched_to_other_file(self):
+        banner = self.create_banner('banners/team_project.png')
+
+        result, = reconcile_file_fields(
+            [(MainPageContent, 'main_banner')], ['banners/team.png', 'banners/team_roster.png'],
+        )
+
+        self.assertEqual(result['updated'], [])
+        self.assertEqual(result['unmatched'], [(banner.pk, 'banners/team_project.png')])
+        banner.refresh_from_db()
+        self.assertEqual(banner.main_banner.name, 'banners/team_project.png')
+
+
+@override_settings(SUPABASE_URL='https://demo.supabase.co', SUPABASE_KEY='key')
+class GcMediaTests(TestCase):
+    """목록을 만든 뒤 참조되기 시작한 파일(내용 주소 중복 업로드 재사용)을 지우지 않는지 확인"""
+
+    def setUp(self):
+        MainPageContent.objects.bulk_create([
+            MainPageContent(title="메인", subtitle="부제목", main_banner='banners/kept.jpg'),
+        ])
+        old = '2020-01-01T00:00:00Z'
+        self.storage = mock.Mock()
+        self.storage.bucket_index.return_value = BucketIndex([
+            {'path': 'banners/kept.jpg', 'size': 1, 'etag': None, 'updated_at': old},
+            {'path': 'banners/orphan.jpg', 'size': 1, 'etag': None, 'updated_at': old},
+            {'path': 'banners/reused.jpg', 'size': 1, 'etag': None, 'updated_at': old},
+        ])
+        self.storage.delete_many.side_effect = len
+
+    def test_object_referenced_after_listing_is_not_deleted(self):
+        calls = []
+
+        def collect_then_reuse():
+            referenced = collect_file_references()
+            if not calls:
+                # 첫 수집 직후 다른 요청이 같은 내용을 올려 기존 객체를 참조하는 행을 저장
+                MainPageContent.objects.bulk_create([
+                    MainPageContent(title="메인", subtitle="부제목", main_banner='banners/reused.jpg'),
+                ])
+            calls.append(referenced)
+            return referenced
+
+        out = StringIO()
+        with mock.patch.object(gc_media, 'default_storage', self.storage), \
+                mock.patch.object(gc_media, 'collect_file_references', collect_then_reuse):
+            call_command('gc_media', stdout=out)
+
+        self.assertEqual(len(calls), 2)
+        self.storage.delete_many.assert_called_once_with(['banners/orphan.jpg'])
+        self.assertIn('Now referenced, kept: banners/reused.jpg', out.getvalue())
+
+    def test_object_matching_drifted_reference_is_kept(self):
+        # DB는 접미사 없는 경로를, Storage는 Django 접미사가 붙은 실제 파일을 가리킴
+        MainPageContent.objects.bulk_create([
+            MainPageContent(title="메인", subtitle="부제목", main_banner='banners/photo.jpg'),
+        ])
+        self.storage.bucket_index.return_value.put(
+            {'path': 'banners/photo_AbC1234.jpg', 'size': 1, 'etag': None, 'updated_at': '2020-01-01T00:00:00Z'}
+        )
+        out = StringIO()
+
+        with mock.patch.object(gc_media, 'default_storage', self.storage):
+            call_command('gc_media', stdout=out)
+
+        self.storage.delete_many.assert_called_once_with(['banners/orphan.jpg', 'banners/reused.jpg'])
+        self.assertIn('banners/photo.jpg -> banners/photo_AbC1234.jpg', out.getvalue())
+
+    def test_dry_run_deletes_nothing(self):
+        with mock.patch.object(gc_media, 'default_storage', self.storage):
+            call_command('gc_media', '--dry-run', stdout=StringIO())
+
+        self.storage.delete_many.assert_not_called()
+
+
+@override_settings(HTTP_CIRCUIT_FAILURE_THRESHOLD=1, HTTP_CIRCUIT_RESET_TIMEOUT=30)
+class CircuitBreakerTests(SimpleTestCase):
+    url = 'https://breaker.example.com/'
+
+    def setUp(self):
+        self.addCleanup(http_client._breakers.clear)
+        self.addCleanup(http_client._metrics.clear)
+        self.now = 1000.0
+        patcher = mock.patch.object(http_client.time, 'monotonic', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def open_circuit(self):
+        client = mock.AsyncMock()
+        client.request.side_effect = httpx.ConnectError('down')
+        with self.assertRaises(httpx.ConnectError):
+            asyncio.run(http_client.arequest(client, 'GET', self.url))
+        breaker, _ = http_client._get_host_state('breaker.example.com')
+        self.assertEqual(breaker.state, breaker.OPEN)
+        return breaker
+
+    def test_cancelled_trial_request_reopens_circuit(self):
+        breaker = self.open_circuit()
+        self.now += 30
+
+        async def cancelled_trial():
+            client = mock.Mock()
+
+            async def hang(*args, **kwargs):
+                await asyncio.sleep(10)
+
+            client.request = hang
+            task = asyncio.create_task(http_client.arequest(client, 'GET', self.url))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancelled_trial())
+
+        self.assertEqual(breaker.state, breaker.OPEN)
+        self.assertFalse(breaker.allow())
+        self.now += 30
+        self.assertTrue(breaker.allow())
+
+    def test_half_open_without_result_allows_new_trial_after_timeout(self):
+        breaker = self.open_circuit()
+        self.now += 30
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, breaker.HALF_OPEN)
+        self.assertFalse(breaker.allow())
+
+        self.now += 30
+        self.assertTrue(breaker.allow())
+
+
+class AsyncClientTests(SimpleTestCase):
+    def test_client_is_shared_within_event_loop(self):
+        async def two_clients():
+            return http_client.get_async_client(), http_client.get_async_client()
+
+        first, second = asyncio.run(two_clients())
+        self.assertIs(first, second)
+
+        other, _ = asyncio.run(two_clients())
+        self.assertIsNot(other, first)
+
+
+class ProcessImageTests(SimpleTestCase):
+    """저장 시 이미지 처리 범위와 오류 기록 (일시 오류는 다시 시도 가능하게 남김)"""
+
+    def banner(self, variants=None, width=None):
+        # 이미 Storage에 있는(커밋된) 원본을 가리키는 배너
+        return MainPageContent(
+            title="메인", subtitle="부제목", main_banner='banners/a.png',
+            main_banner_variants=variants or {}, main_banner_width=width,
+        )
+
+    def test_save_skips_unprocessed_legacy_image(self):
+        banner = self.banner()
+
+        with mock.patch.object(imaging, '_read_source') as read_source:
+            self.assertFalse(imaging.process_image(banner, 'main_banner'))
+
+        read_source.assert_not_called()
+
+    def test_save_processes_changed_image(self):
+        banner = self.banner(variants={'source': 'banners/old.png', 'webp': {}}, width=10)
+
+        with mock.patch.object(imaging, '_read_source', return_value=b'data'), \
+                mock.patch.object(imaging, 'build_variants', return_value=(
+                    {'source': 'banners/a.png', 'webp': {}},
+                    {'width': 20, 'height': 10, 'color': '#000000', 'placeholder': ''},
+                )):
+            self.assertTrue(imaging.process_image(banner, 'main_banner'))
+
+        self.assertEqual(banner.main_banner_width, 20)
+
+    def test_invalid_image_is_recorded_as_permanent_error(self):
+        banner = self.banner()
+
+        with mock.patch.object(imaging, '_read_source', return_value=b'not an image'):
+            imaging.process_image(banner, 'main_banner', backfill=True)
+
+        self.assertEqual(banner.main_banner_variants['source'], 'banners/a.png')
+        self.assertIn('error', banner.main_banner_variants)
+        # 같은 원본은 다시 처리하지 않음
+        with mock.patch.object(imaging, '_read_source') as read_source:
+            self.assertFalse(imaging.process_image(banner, 'main_banner', backfill=True))
+        read_source.assert_not_called()
+
+    def test_storage_error_is_left_retryable(self):
+        banner = self.banner(variants={'source': 'banners/old.png', 'webp': {}}, width=10)
+
+        with mock.patch.object(imaging, '_read_source', return_value=b'data'), \
+                mock.patch.object(imaging, 'build_variants', side_effect=IOError('upload failed')):
+            self.assertTrue(imaging.process_image(banner, 'main_banner'))
+            with self.assertRaises(OSError):
+                imaging.process_image(banner, 'main_banner', backfill=True)
+
+        self.assertEqual(banner.main_banner_variants, {})
+        self.assertIsNone(banner.main_banner_width)
+
+
+class SupabaseStorageNamingTests(SimpleTestCase):
+    def test_existing_name_is_not_reused_by_default(self):
+        storage = SupabaseStorage()
+        storage.listing_cache.set('project/img', {'screenshot.png': {'name': 'screenshot.png', 'id': '1'}})
+
+        name = storage.get_available_name('project/img/screenshot.png')
+
+        # 다른 행이 올린 같은 이름의 파일을 덮어쓰지 않도록 새 이름 사용
+        self.assertNotEqual(name, 'project/img/screenshot.png')
+        self.assertRegex(name, r'^project/img/screenshot_[a-zA-Z0-9]{7}\.png$')
+        self.assertEqual(storage.get_available_name('project/img/other.png'), 'project/img/other.png')
+
+
+class UploadLocalMediaTests(SimpleTestCase):
+    """로컬 media 업로드: 원격 비교, 재시도 백오프, 매니페스트로 이어서 실행"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.base_dir = temp_dir.name
+        os.makedirs(os.path.join(self.base_dir, 'media', 'img'))
+
+    def write(self, name, data):
+        path = os.path.join(self.base_dir, 'media', name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def remote(self, data, etag=None, updated_at='2020-01-01T00:00:00Z'):
+        return {'path': 'img/a.png', 'size': len(data), 'etag': etag, 'updated_at': updated_at}
+
+    def test_remote_matches_md5_etag(self):
+        path = self.write('img/a.png', b'local')
+        stat = os.stat(path)
+
+        self.assertTrue(upload_local_media.remote_matches(
+            self.remote(b'local', etag='"%s"' % hashlib.md5(b'local').hexdigest()), path, stat,
+        ))
+        self.assertFalse(upload_local_media.remote_matches(
+            self.remote(b'other', etag='"%s"' % hashlib.md5(b'other').hexdigest()), path, stat,
+        ))
+        self.assertFalse(upload_local_media.remote_matches(self.remote(b'longer'), path, stat))
+
+    def test_remote_matches_multipart_etag_with_same_size(self):
+        path = self.write('img/a.png', b'local')
+        os.utime(path, (1_700_000_000, 1_700_000_000))
+        stat = os.stat(path)
+        multipart = '"%s-2"' % hashlib.md5(b'x').hexdigest()
+
+        # 로컬 파일이 Storage 객체보다 나중에 수정됨 -> 다시 업로드
+        self.assertFalse(upload_local_media.remote_matches(self.remote(b'other', etag=multipart), path, stat))
+        # Storage 객체가 로컬 수정 이후에 저장됨
+        self.assertTrue(upload_local_media.remote_matches(
+            self.remote(b'other', etag=multipart, updated_at='2024-01-01T00:00:00Z'), path, stat,
+        ))
+        # 매니페스트에 기록된 내용과 같음 (수정 시각만 바뀐 경우)
+        self.assertTrue(upload_local_media.remote_matches(
+            self.remote(b'other', etag=multipart), path, stat, hashlib.sha256(b'local').hexdigest(),
+        ))
+
+    def test_upload_file_retries_with_exponential_backoff(self):
+        path = self.write('img/a.png', b'data')
+        storage = mock.Mock()
+        storage.save.side_effect = [IOError('reset'), IOError('reset'), 'img/a.png']
+
+        with mock.patch.object(upload_local_media.time, 'sleep') as sleep:
+            saved_path, sha256 = upload_local_media.upload_file(storage, 'img/a.png', path, retries=3)
+
+        self.assertEqual(saved_path, 'img/a.png')
+        self.assertEqual(sha256, hashlib.sha256(b'data').hexdigest())
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1.0, 2.0])
+
+        storage.save.side_effect = IOError('down')
+        with mock.patch.object(upload_local_media.time, 'sleep'), self.assertRaises(IOError):
+            upload_local_media.upload_file(storage, 'img/a.png', path, retries=1)
+
+    def run_command(self, storage):
+        with override_settings(BASE_DIR=Path(self.base_dir)), \
+                mock.patch('portfolio.storage_backends.SupabaseStorage', return_value=storage):
+            call_command('upload_local_media', '--retries', '0', stdout=StringIO())
+
+    def test_manifest_skips_unchanged_files_on_rerun(self):
+        self.write('img/a.png', b'aaaa')
+        changed = self.write('img/b.png', b'bbbb')
+        storage = mock.Mock()
+        storage.bucket_index.return_value = BucketIndex()
+        storage.save.side_effect = lambda name, content: name
+
+        self.run_command(storage)
+        self.assertEqual(sorted(c.args[0] for c in storage.save.call_args_list), ['img/a.png', 'img/b.png'])
+
+        storage.reset_mock()
+        self.run_command(storage)
+        # 크기/수정 시각이 같은 완료 항목은 Storage 확인도 하지 않음
+        storage.bucket_index.assert_not_called()
+        storage.save.assert_not_called()
+
+        with open(changed, 'ab') as f:
+            f.write(b'more')
+        self.run_command(storage)
+        self.assertEqual([c.args[0] for c in storage.save.call_args_list], ['img/b.png'])
@@ -5,4 +5,5 @@ app_name = 'core'
 
 urlpatterns = [
     path('', views.home, name='home'),
+    path('status/', views.runtime_status, name='status'),
 ]
\ No newline at end of file
@@ -4,14 +4,47 @@ Core 앱의 뷰 함수들
 HTTP 요청을 처리하고 적절한 템플릿을 렌더링합니다.
 비즈니스 로직은 services.py에 위임합니다.
 """
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.files.storage import default_storage
+from django.http import JsonResponse
 from django.shortcuts import render
-from . import services
+from django.views.decorators.cache import cache_control, never_cache
+from . import http_client, services
+from .caching import conditional_dated_content
+from .templatetags.markdown_extras import markdown_cache
 
 
+@cache_control(no_cache=True)
+@conditional_dated_content
 def home(request):
     """
     포트폴리오 홈페이지 뷰
     서비스 계층에서 데이터를 조회하여 템플릿에 전달합니다.
+    콘텐츠와 날짜(총 경력 기간 계산 기준)가 바뀌지 않았으면 렌더링 없이 304를 응답합니다.
     """
     context = services.get_portfolio_context()
-    return render(request, 'core/home.html', context) 
+    return render(request, 'core/home.html', context)
+
+
+@never_cache
+@staff_member_required
+def runtime_status(request):
+    """
+    운영 지표 확인용 뷰 (스태프 전용)
+    현재 프로세스의 외부 HTTP 호출 지표와 Markdown/Storage 캐시 통계를 반환합니다.
+    """
+    return JsonResponse({
+        'http': http_client.get_metrics(),
+        'markdown_cache': markdown_cache.info(),
+        'storage': _storage_cache_info(),
+    })
+
+
+def _storage_cache_info():
+    # 기본 Storage가 SupabaseStorage일 때만 목록/다운로드 캐시 통계가 있음
+    listing_cache = getattr(default_storage, 'listing_cache', None)
+    download_cache = getattr(default_storage, 'download_cache', None)
+    return {
+        'listing': listing_cache.info() if listing_cache else None,
+        'download': download_cache.info() if download_cache else None,
+    }
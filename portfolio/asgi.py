@@ -12,6 +12,8 @@ import os
 from django.core.asgi import get_asgi_application
 
 # 운영 환경을 기본으로 사용 (Railway 등에서 사용)
+# Procfile: gunicorn portfolio.asgi:application -k uvicorn.workers.UvicornWorker
+# 비동기 뷰(프로젝트 상세 JSON)는 외부 호출을 기다리는 동안 워커가 다른 요청을 처리합니다.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio.settings.prod')
 
 application = get_asgi_application()
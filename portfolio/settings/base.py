@@ -14,9 +14,8 @@ from decouple import config
 import dj_database_url
 
 import os
+import tempfile
 from dotenv import load_dotenv
-from django.conf import settings
-import openai
 
 load_dotenv()
 
@@ -94,14 +93,35 @@ WSGI_APPLICATION = 'portfolio.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# 영구 DB 연결 유지 시간 (초). 운영은 ASGI(uvicorn 워커)로 실행되며, ASGI에서는 요청이 스레드를 옮겨 다녀
+# 영구 연결이 닫히지 않고 쌓이므로 기본값 0 (요청마다 연결). WSGI로 실행할 때만 600 등으로 설정
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=0, cast=int)
+
 DATABASES = {
     'default': dj_database_url.config(
         default=config('DATABASE_URL', default='sqlite:///db.sqlite3'),
-        conn_max_age=600,
+        conn_max_age=DB_CONN_MAX_AGE,
         conn_health_checks=True,
     )
 }
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# gunicorn 워커들이 같은 콘텐츠 버전을 공유하도록 파일 기반 캐시 사용 (DB 조회 없음)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': config('CACHE_DIR', default=os.path.join(tempfile.gettempdir(), 'portfolio_cache')),
+    }
+}
+
+# 홈페이지 컨텍스트 스냅샷 캐시 유지 시간 (초). 콘텐츠 변경 시에는 시그널로 즉시 무효화됩니다.
+PORTFOLIO_CONTEXT_CACHE_TIMEOUT = config('PORTFOLIO_CONTEXT_CACHE_TIMEOUT', default=60 * 60 * 24, cast=int)
+
+# 조건부 GET(ETag)에 포함되는 릴리스 식별자. 배포가 바뀌면 브라우저 캐시도 갱신됩니다.
+RELEASE_VERSION = config('RELEASE_VERSION', default=os.environ.get('RAILWAY_DEPLOYMENT_ID', 'local'))
+
 # Supabase Storage 설정 (커스텀 백엔드 사용)
 # ------------------------------------------------------------------------------
 # 참고: 이 설정을 위해 Railway 환경 변수에 다음이 필요합니다:
@@ -113,6 +133,21 @@ DATABASES = {
 SUPABASE_URL = config('SUPABASE_URL', default='')
 SUPABASE_KEY = config('SUPABASE_KEY', default='')
 SUPABASE_BUCKET = config('SUPABASE_BUCKET', default='portfolio-media')
+# 디렉토리 목록 캐시 유지 시간 (초). exists/size 등 메타데이터 조회가 목록 API를 다시 호출하지 않는 기간
+SUPABASE_LIST_CACHE_TTL = config('SUPABASE_LIST_CACHE_TTL', default=60, cast=int)
+# 같은 경로 업로드 시 덮어쓰기(upsert) 여부. False(기본)면 기존 파일을 두고 이름 뒤에 임의 접미사를 붙여 저장
+# True는 같은 upload_to 디렉토리에 같은 파일명을 올린 다른 행의 파일까지 덮어쓰므로 모델 업로드에는 쓰지 않음
+# (같은 경로를 의도적으로 교체하는 일괄 도구는 upload_local_media처럼 인스턴스에서 직접 켬)
+SUPABASE_FILE_OVERWRITE = config('SUPABASE_FILE_OVERWRITE', default=False, cast=bool)
+# 이 크기(bytes)보다 큰 파일은 재개 가능 업로드(TUS)로 6MB씩 스트리밍 전송 (워커 메모리 사용량 일정)
+SUPABASE_RESUMABLE_THRESHOLD = config('SUPABASE_RESUMABLE_THRESHOLD', default=6 * 1024 * 1024, cast=int)
+# 다운로드 디스크 캐시 (선택 사항). 경로를 지정하면 storage.open()이 (경로, ETag)별로 내려받은 파일을 재사용
+SUPABASE_DOWNLOAD_CACHE_DIR = config('SUPABASE_DOWNLOAD_CACHE_DIR', default='')
+SUPABASE_DOWNLOAD_CACHE_MAX_MB = config('SUPABASE_DOWNLOAD_CACHE_MAX_MB', default=512, cast=int)
+# 내용 주소 저장 (선택 사항). 파일을 내용 sha256 이름으로 저장하고, 같은 내용이 이미 있으면 업로드하지 않음
+# (이름이 바뀌지 않는 객체이므로 1년 캐시 헤더로 업로드)
+# 중복 제거는 디렉토리(upload_to) 단위: 같은 내용이라도 다른 디렉토리에 올리면 각각 저장됨
+SUPABASE_CONTENT_ADDRESSED = config('SUPABASE_CONTENT_ADDRESSED', default=False, cast=bool)
 
 # 커스텀 Supabase Storage Backend 사용
 DEFAULT_FILE_STORAGE = 'portfolio.storage_backends.SupabaseStorage'
@@ -121,6 +156,19 @@ DEFAULT_FILE_STORAGE = 'portfolio.storage_backends.SupabaseStorage'
 SUPABASE_PROJECT_ID = SUPABASE_URL.replace('https://', '').replace('.supabase.co', '') if SUPABASE_URL else ''
 MEDIA_URL = f"{SUPABASE_URL}/storage/v1/object/public/{SUPABASE_BUCKET}/"
 
+# GitHub README 캐시 설정
+# GITHUB_TOKEN: 선택 사항. 설정하면 API 호출 한도가 60회/시간 -> 5000회/시간으로 늘어납니다.
+GITHUB_TOKEN = config('GITHUB_TOKEN', default='')
+# README 재검증 주기 (초). 지나면 캐시를 먼저 응답하고 백그라운드에서 재검증합니다.
+GITHUB_README_TTL = config('GITHUB_README_TTL', default=60 * 60, cast=int)
+# 프로젝트 상세(비동기) 뷰의 외부 요청(README, 임베드 확인) 공통 마감 시간 (초)
+PROJECT_DETAIL_DEADLINE = config('PROJECT_DETAIL_DEADLINE', default=4.0, cast=float)
+
+# 외부 HTTP 요청 공용 클라이언트 (core.http_client)
+HTTP_CLIENT_RETRIES = config('HTTP_CLIENT_RETRIES', default=2, cast=int)  # 연결 오류/502~504 재시도 횟수
+HTTP_CIRCUIT_FAILURE_THRESHOLD = config('HTTP_CIRCUIT_FAILURE_THRESHOLD', default=5, cast=int)  # 서킷 열림 기준 연속 실패 수
+HTTP_CIRCUIT_RESET_TIMEOUT = config('HTTP_CIRCUIT_RESET_TIMEOUT', default=30, cast=int)  # 서킷 열림 유지 시간 (초)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -0,0 +1,149 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // 프로젝트 목록 무한 스크롤 (커서 기반 페이지네이션)
+    const grid = document.querySelector('.projects-grid[data-page-url]');
+    const sentinel = document.getElementById('projects-sentinel');
+    if (!grid || !sentinel) return;
+
+    const pageUrl = grid.dataset.pageUrl;
+    let nextCursor = grid.dataset.nextCursor;
+    let loading = false;
+    let observer = null;
+
+    // 링크 버튼 생성 (GitHub, Demo, Figma)
+    function createLinkButton(url, className, title, iconClass) {
+        const link = document.createElement('a');
+        link.href = url;
+        link.target = '_blank';
+        link.classList.add('project-link-btn', className);
+        link.title = title;
+        const icon = document.createElement('i');
+        icon.className = iconClass;
+        link.appendChild(icon);
+        return link;
+    }
+
+    // project_list.html의 카드와 같은 구조로 카드 생성
+    function createCard(project) {
+        const card = document.createElement('div');
+        card.classList.add('project-card');
+        card.dataset.projectId = project.id;
+
+        const thumbnail = document.createElement('div');
+        thumbnail.classList.add('project-thumbnail');
+        if (project.thumbnail) {
+            const image = project.thumbnail;
+            const img = document.createElement('img');
+            img.src = image.url;
+            if (image.srcset) {
+                // WebP 파생본 중 카드 너비에 맞는 크기를 브라우저가 선택
+                img.srcset = image.srcset;
+                img.sizes = '(max-width: 480px) 100vw, 400px';
+            }
+            if (image.width && image.height) {
+                img.width = image.width;
+                img.height = image.height;
+            }
+            if (image.placeholder) {
+                // 로딩 중에는 대표 색상 + 블러 미리보기 표시 (picture 템플릿 태그와 동일)
+                img.style.background = `${image.color} url(${image.placeholder}) center / cover no-repeat`;
+            }
+            img.alt = `${project.title} 썸네일`;
+            img.loading = 'lazy';
+            img.decoding = 'async';
+            thumbnail.appendChild(img);
+        } else {
+            const placeholder = document.createElement('div');
+            placeholder.classList.add('thumbnail-placeholder');
+            const placeholderTitle = document.createElement('span');
+            placeholderTitle.classList.add('placeholder-title');
+            placeholderTitle.textContent = project.title;
+            placeholder.appendChild(placeholderTitle);
+            thumbnail.appendChild(placeholder);
+        }
+        card.appendChild(thumbnail);
+
+        const info = document.createElement('div');
+        info.classList.add('project-info');
+
+        const title = document.createElement('h3');
+        title.classList.add('project-title');
+        title.textContent = project.title;
+        info.appendChild(title);
+
+        const company = document.createElement('p');
+        company.classList.add('project-company');
+        company.textContent = project.company;
+        info.appendChild(company);
+
+        const period = document.createElement('p');
+        period.classList.add('project-period');
+        period.textContent = project.period;
+        info.appendChild(period);
+
+        const description = document.createElement('p');
+        description.classList.add('project-description');
+        description.textContent = project.summary;
+        info.appendChild(description);
+
+        const links = document.createElement('div');
+        links.classList.add('project-links');
+        if (project.github_url) {
+            links.appendChild(createLinkButton(project.github_url, 'github-btn', 'GitHub', 'fab fa-github'));
+        }
+        if (project.demo_url) {
+            links.appendChild(createLinkButton(project.demo_url, 'demo-btn', 'Demo', 'fas fa-external-link-alt'));
+        }
+        if (project.figma_url) {
+            links.appendChild(createLinkButton(project.figma_url, 'figma-btn', 'Figma', 'fab fa-figma'));
+        }
+        info.appendChild(links);
+
+        // 상세보기 버튼 (클릭은 project-modal.js에서 위임 처리)
+        const detailButton = document.createElement('button');
+        detailButton.classList.add('project-detail-btn');
+        detailButton.dataset.projectId = project.id;
+        detailButton.textContent = '상세보기';
+        info.appendChild(detailButton);
+
+        card.appendChild(info);
+        return card;
+    }
+
+    function finish() {
+        if (observer) observer.disconnect();
+        sentinel.remove();
+    }
+
+    // 다음 페이지 로딩
+    function loadMore() {
+        if (loading || !nextCursor) return;
+        loading = true;
+
+        fetch(`${pageUrl}?cursor=${encodeURIComponent(nextCursor)}`)
+            .then(response => response.json())
+            .then(data => {
+                data.results.forEach(project => grid.appendChild(createCard(project)));
+                nextCursor = data.next_cursor;
+                if (!nextCursor) finish();
+            })
+            .catch(error => {
+                console.error('프로젝트 목록 로딩 실패:', error);
+            })
+            .finally(() => {
+                loading = false;
+            });
+    }
+
+    if (!nextCursor) {
+        finish();
+        return;
+    }
+
+    // 목록 끝(sentinel)이 화면에 가까워지면 다음 페이지 로딩
+    observer = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+            loadMore();
+        }
+    }, { rootMargin: '200px 0px' });
+    observer.observe(sentinel);
+});
@@ -78,6 +78,18 @@ document.addEventListener('DOMContentLoaded', function(){
         data.images.forEach(img => {
             const imgElement = document.createElement('img');
             imgElement.src = img.url;
+            if (img.srcset) {
+                imgElement.srcset = img.srcset;
+                imgElement.sizes = '(max-width: 480px) 100vw, 320px'; // 갤러리 칸 너비 (minmax 220px)
+            }
+            // 저장된 크기로 자리를 미리 잡고, 로딩 중에는 블러 미리보기 표시
+            if (img.width && img.height) {
+                imgElement.width = img.width;
+                imgElement.height = img.height;
+            }
+            if (img.placeholder) {
+                imgElement.style.background = `${img.color} url(${img.placeholder}) center / cover no-repeat`;
+            }
             imgElement.alt = img.caption || data.title;
             modalImages.appendChild(imgElement);
         });
@@ -194,14 +206,14 @@ document.addEventListener('DOMContentLoaded', function(){
     }
 }
 
-    // 이벤트 리스너 등록, 모든 상세보기 버튼에 이벤트 리스너 추가
-    const detailButtons = document.querySelectorAll('.project-detail-btn');
-    detailButtons.forEach(button => {
-        button.addEventListener('click', function(e) {
-            e.stopPropagation(); // 이벤트 버블링 방지
-            const projectId = this.getAttribute('data-project-id');
-            openModal(projectId);
-        });
+    // 이벤트 리스너 등록, 상세보기 버튼 클릭을 document에서 위임 처리
+    // (무한 스크롤로 나중에 추가되는 카드의 버튼도 동작)
+    document.addEventListener('click', function(e) {
+        const button = e.target.closest('.project-detail-btn');
+        if (!button) return;
+        e.stopPropagation(); // 이벤트 버블링 방지
+        const projectId = button.getAttribute('data-project-id');
+        openModal(projectId);
     });
 
     // 닫기 버튼 이벤트
@@ -1,23 +1,401 @@
 """
 Supabase Storage를 위한 커스텀 Django Storage Backend
 Supabase Python SDK를 사용하여 파일 업로드/다운로드 처리
+(SDK는 import 비용이 커서 클라이언트가 처음 필요할 때 import합니다)
 """
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import File
 from django.core.files.storage import Storage
 from django.conf import settings
 from django.utils.deconstruct import deconstructible
 from django.utils.encoding import filepath_to_uri
-from supabase import create_client, Client
-from io import BytesIO
+from core import http_client
+from .storage_cache import DiskLRUCache
+import base64
+import hashlib
+import io
 import os
+import re
+import tempfile
 import mimetypes
+import threading
+import time
 import uuid
-from datetime import datetime
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import urljoin, quote
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_supabase_client(url, key):
+    """
+    (url, key)별로 프로세스에서 하나만 만드는 Supabase 클라이언트
+    Storage 인스턴스와 관리 명령이 함께 사용하며, supabase 패키지는 처음 호출할 때 import합니다.
+    """
+    from supabase import create_client
+
+    return create_client(url, key)
+
+# storage.list() 한 번에 받을 항목 수 (기본값 100이라 큰 디렉토리는 잘려서 조회됨)
+LIST_PAGE_SIZE = 1000
+
+# 버킷 전체 순회 시 동시에 목록을 조회할 디렉토리 수
+WALK_WORKERS = 4
+
+# storage.remove() 한 번에 삭제할 객체 수
+REMOVE_BATCH_SIZE = 100
+
+# 업로드 Cache-Control max-age (초). 내용 주소 저장 객체는 같은 이름이면 내용도 같으므로 1년
+DEFAULT_CACHE_MAX_AGE = 3600
+IMMUTABLE_CACHE_MAX_AGE = 365 * 24 * 3600
+# 내용 주소 파일명에 사용할 sha256 16진수 길이 (128비트)
+CONTENT_HASH_LENGTH = 32
+
+# Supabase 재개 가능 업로드(TUS)는 마지막 조각을 제외하고 6MB 단위 조각만 허용
+RESUMABLE_CHUNK_SIZE = 6 * 1024 * 1024
+# 조각 하나의 전송 재시도 횟수 (실패 시 서버의 Upload-Offset을 확인하고 이어서 전송)
+RESUMABLE_CHUNK_RETRIES = 3
+RESUMABLE_TIMEOUT = 60
+
+# 범위 요청(Range) 읽기: 블록 단위로 내려받은 구간을 기록하고, 빠진 구간을 요청할 때 뒤쪽을 미리 읽음
+RANGE_BLOCK_SIZE = 64 * 1024
+RANGE_READ_AHEAD = 256 * 1024
+# 내려받은 데이터가 이 크기를 넘으면 메모리 대신 임시 파일에 보관
+RANGE_SPOOL_MAX_MEMORY = 2 * 1024 * 1024
+
+
+class DirectoryListingCache:
+    """
+    디렉토리별 storage.list() 결과 캐시
+    파일명으로 색인하여 exists/size/생성·수정 시간 조회를 목록 조회 없이 처리하고,
+    이 프로세스의 업로드/삭제는 캐시에 바로 반영합니다. (다른 워커의 변경은 TTL 만료 후 반영)
+
+    항목 추가/삭제는 디렉토리 사전을 복사본으로 교체하므로(copy-on-write),
+    get()이 돌려준 목록은 다른 스레드의 put/discard와 무관하게 그대로 순회할 수 있습니다.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}  # 디렉토리 -> (만료 시각, {파일명: 항목})
+        self._lock = threading.Lock()
+
+    def get(self, directory):
+        """캐시된 {파일명: 항목}의 읽기 전용 스냅샷 반환 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(directory)
+            if entry is None or entry[0] <= time.monotonic():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return MappingProxyType(entry[1])
+
+    def set(self, directory, items):
+        with self._lock:
+            self._entries[directory] = (time.monotonic() + self.ttl, dict(items))
+
+    def put(self, directory, name, item):
+        """캐시된 디렉토리에만 항목 추가/갱신 (캐시가 없으면 다음 조회 때 목록을 새로 받음)"""
+        with self._lock:
+            entry = self._entries.get(directory)
+            if entry is not None:
+                self._entries[directory] = (entry[0], {**entry[1], name: item})
+
+    def discard(self, directory, name):
+        with self._lock:
+            entry = self._entries.get(directory)
+            if entry is not None and name in entry[1]:
+                items = dict(entry[1])
+                del items[name]
+                self._entries[directory] = (entry[0], items)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def info(self):
+        """캐시 적중/실패 통계 반환"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'directories': len(self._entries),
+                'ttl': self.ttl,
+            }
+
+
+class SupabaseRangeFile(io.RawIOBase):
+    """
+    HTTP Range 요청으로 읽는 부분만 내려받는 읽기 전용 파일 객체
+    Pillow처럼 헤더만 읽는 호출은 앞부분 몇 블록만 내려받습니다.
+
+    - 내려받은 블록(RANGE_BLOCK_SIZE)을 기록하고, 빠진 블록은 연속 구간으로 묶어 한 번에 요청
+    - 마지막 구간은 RANGE_READ_AHEAD만큼 미리 읽어 순차 읽기의 요청 수를 줄임
+    - 내려받은 데이터는 SpooledTemporaryFile에 보관 (RANGE_SPOOL_MAX_MEMORY 초과 시 디스크)
+    """
+
+    def __init__(self, url, headers, name='', size=None):
+        super().__init__()
+        self.url = url
+        self.name = name
+        self.requests = 0
+        self.bytes_downloaded = 0
+        self._headers = headers
+        self._size = size
+        self._position = 0
+        self._blocks = set()
+        self._spool = tempfile.SpooledTemporaryFile(max_size=RANGE_SPOOL_MAX_MEMORY)
+
+    @property
+    def size(self):
+        if self._size is None:
+            # 첫 요청 응답의 Content-Range로 전체 크기 확인 (앞부분은 미리 읽어 둠)
+            self._fetch(0, RANGE_READ_AHEAD)
+        return self._size
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer):
+        end = min(self._position + len(buffer), self.size)
+        if end <= self._position:
+            return 0
+        data = self._read_range(self._position, end)
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def readall(self):
+        # 남은 부분 전체를 한 번의 요청으로 (기본 구현은 작은 read()를 반복)
+        end = self.size
+        if end <= self._position:
+            return b''
+        data = self._read_range(self._position, end)
+        self._position = end
+        return data
+
+    def close(self):
+        if not self.closed:
+            self._spool.close()
+        super().close()
+
+    def _read_range(self, start, end):
+        self._ensure(start, end)
+        self._spool.seek(start)
+        return self._spool.read(end - start)
+
+    def _ensure(self, start, end):
+        """[start, end) 구간의 빠진 블록을 연속 구간 단위로 내려받음"""
+        first, last = start // RANGE_BLOCK_SIZE, (end - 1) // RANGE_BLOCK_SIZE
+        total_blocks = -(-self.size // RANGE_BLOCK_SIZE)
+
+        runs = []
+        for index in range(first, last + 1):
+            if index in self._blocks:
+                continue
+            if runs and runs[-1][1] == index:
+                runs[-1][1] = index + 1
+            else:
+                runs.append([index, index + 1])
+        if not runs:
+            return
+
+        # 마지막 구간은 이미 받은 블록을 만나기 전까지 미리 읽기만큼 연장
+        read_ahead_end = min(runs[-1][1] + RANGE_READ_AHEAD // RANGE_BLOCK_SIZE, total_blocks)
+        while runs[-1][1] < read_ahead_end and runs[-1][1] not in self._blocks:
+            runs[-1][1] += 1
+
+        for run_start, run_end in runs:
+            self._fetch(run_start * RANGE_BLOCK_SIZE, min(run_end * RANGE_BLOCK_SIZE, self.size))
+
+    def _fetch(self, start, end):
+        """Range 요청 한 번으로 [start, end)를 받아 스풀에 기록"""
+        try:
+            response = http_client.get(
+                self.url,
+                headers={**self._headers, 'Range': f'bytes={start}-{end - 1}'},
+                timeout=RESUMABLE_TIMEOUT,
+            )
+        except Exception as e:
+            raise IOError(f"파일을 읽을 수 없습니다: {self.name}. 에러: {str(e)}")
+        self.requests += 1
+
+        if response.status_code == 416:
+            # 빈 파일이거나 범위가 파일 밖인 경우: "bytes */전체크기"
+            match = re.search(r'/(\d+)$', response.headers.get('Content-Range', ''))
+            self._size = int(match.group(1)) if match else 0
+            return
+        if response.status_code == 200:
+            # Range 미지원 응답: 전체 내용이 온 경우 모두 기록
+            start = 0
+            self._size = len(response.content)
+        elif response.status_code == 206:
+            match = re.search(r'/(\d+)$', response.headers.get('Content-Range', ''))
+            if self._size is None and match:
+                self._size = int(match.group(1))
+        else:
+            raise IOError(f"파일을 읽을 수 없습니다: {self.name} ({response.status_code})")
+
+        content = response.content
+        self.bytes_downloaded += len(content)
+        self._spool.seek(start)
+        self._spool.write(content)
+
+        # 온전히 받은 블록만 기록 (마지막 블록은 파일 끝까지 받았으면 완료)
+        received_end = start + len(content)
+        for index in range(start // RANGE_BLOCK_SIZE, -(-received_end // RANGE_BLOCK_SIZE)):
+            if min((index + 1) * RANGE_BLOCK_SIZE, self._size or received_end) <= received_end:
+                self._blocks.add(index)
+
+
+def list_directory_items(bucket, directory, page_size=None):
+    """
+    디렉토리 하나의 전체 항목을 limit/offset 페이지 단위로 받아 {이름: 항목}으로 반환
+    (Supabase 기본 페이지 크기는 100이라 limit 없이 조회하면 잘림)
+
+    Args:
+        bucket: client.storage.from_(버킷명)
+        directory: 버킷 루트 기준 디렉토리 경로 ('' = 루트)
+        page_size: 페이지 크기 (기본 LIST_PAGE_SIZE)
+    """
+    page_size = page_size or LIST_PAGE_SIZE
+    items = {}
+    offset = 0
+    while True:
+        page = bucket.list(path=directory, options={'limit': page_size, 'offset': offset})
+        for item in page:
+            items[item['name']] = item
+        if len(page) < page_size:
+            return items
+        offset += page_size
+
+
+def walk_directories(bucket, prefix='', workers=WALK_WORKERS):
+    """
+    prefix 아래 모든 디렉토리를 재귀적으로 조회하여 (디렉토리, {이름: 항목})을 생성
+    하위 디렉토리는 발견되는 대로 스레드 풀에서 동시에 조회합니다. (순서는 보장하지 않음)
+    """
+    prefix = prefix.strip('/')
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pending = {executor.submit(list_directory_items, bucket, prefix): prefix}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory = pending.pop(future)
+                items = future.result()
+                for name, item in items.items():
+                    if not item.get('id'):  # 폴더는 id가 없음
+                        path = f'{directory}/{name}' if directory else name
+                        pending[executor.submit(list_directory_items, bucket, path)] = path
+                yield directory, items
+
+
+def walk_bucket(bucket, prefix='', workers=WALK_WORKERS):
+    """
+    prefix 아래 모든 파일을 재귀적으로 순회하여 (경로, 목록 항목)을 생성
+
+    사용:
+        for path, item in walk_bucket(client.storage.from_(bucket)):
+            ...
+    """
+    for directory, items in walk_directories(bucket, prefix, workers):
+        for name, item in items.items():
+            if item.get('id'):
+                yield (f'{directory}/{name}' if directory else name), item
+
+
+class BucketIndex:
+    """
+    버킷 전체 파일 목록의 메모리 색인
+    경로 -> {'path', 'size', 'etag', 'updated_at'}로 보관하여
+    미디어 관리 명령들이 버킷을 한 번만 순회하고 존재 확인/크기 비교를 조회 없이 처리합니다.
+    """
+
+    def __init__(self, entries=()):
+        self._entries = {entry['path']: entry for entry in entries}
+
+    @staticmethod
+    def entry(path, item):
+        """목록 항목을 색인 항목으로 변환"""
+        metadata = item.get('metadata') or {}
+        return {
+            'path': path,
+            'size': metadata.get('size'),
+            'etag': metadata.get('eTag'),
+            'updated_at': item.get('updated_at'),
+        }
+
+    @classmethod
+    def from_directories(cls, directories):
+        """walk_directories() 결과로 색인 생성"""
+        return cls(
+            cls.entry(f'{directory}/{name}' if directory else name, item)
+            for directory, items in directories
+            for name, item in items.items()
+            if item.get('id')
+        )
+
+    @classmethod
+    def build(cls, bucket, prefix='', workers=WALK_WORKERS):
+        return cls.from_directories(walk_directories(bucket, prefix, workers))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    def __iter__(self):
+        """경로 순으로 색인 항목 순회"""
+        return (self._entries[path] for path in sorted(self._entries))
+
+    def get(self, path):
+        return self._entries.get(path)
+
+    def put(self, entry):
+        self._entries[entry['path']] = entry
+
+    def discard(self, path):
+        self._entries.pop(path, None)
+
+    def paths(self):
+        return self._entries.keys()
+
+    def in_directory(self, directory):
+        """directory 바로 아래 파일 항목 (하위 디렉토리 제외, 경로 순)"""
+        directory = directory.strip('/')
+        return [entry for entry in self if os.path.dirname(entry['path']) == directory]
+
+    def total_size(self):
+        return sum(entry['size'] or 0 for entry in self._entries.values())
+
+
 @deconstructible
 class SupabaseStorage(Storage):
     """
@@ -28,12 +406,91 @@ class SupabaseStorage(Storage):
         self.supabase_url = settings.SUPABASE_URL
         self.supabase_key = settings.SUPABASE_KEY
         self.bucket_name = settings.SUPABASE_BUCKET
-        self.client: Client = create_client(self.supabase_url, self.supabase_key)
+        self.listing_cache = DirectoryListingCache(settings.SUPABASE_LIST_CACHE_TTL)
+        self._bucket_index = None
+        self._bucket_index_lock = threading.Lock()
+        # True: 같은 경로는 업로드 한 번으로 덮어씀(upsert), False: get_available_name으로 새 이름 사용
+        self.file_overwrite = settings.SUPABASE_FILE_OVERWRITE
+        # True: 업로드 파일을 내용 해시 이름으로 저장 (같은 내용은 한 번만 업로드)
+        self.content_addressed = settings.SUPABASE_CONTENT_ADDRESSED
+        # 선택 사항: 내려받은 객체를 로컬 디스크에 보관하여 같은 객체를 다시 열 때 재사용
+        cache_dir = settings.SUPABASE_DOWNLOAD_CACHE_DIR
+        self.download_cache = (
+            DiskLRUCache(cache_dir, settings.SUPABASE_DOWNLOAD_CACHE_MAX_MB * 1024 * 1024) if cache_dir else None
+        )
+
+    @property
+    def client(self):
+        """공유 Supabase 클라이언트 (Storage 생성 시점이 아니라 첫 요청 때 생성)"""
+        return get_supabase_client(self.supabase_url, self.supabase_key)
 
     def _get_storage_client(self):
         """Supabase Storage 클라이언트 반환"""
         return self.client.storage.from_(self.bucket_name)
 
+    def _auth_headers(self):
+        return {'Authorization': f'Bearer {self.supabase_key}', 'apikey': self.supabase_key}
+
+    def _object_url(self, name):
+        """인증 다운로드 URL (비공개 버킷에서도 사용 가능)"""
+        return f"{self.supabase_url}/storage/v1/object/{self.bucket_name}/{quote(name, safe='/')}"
+
+    def _list_directory(self, directory):
+        """
+        디렉토리 항목을 {파일명: 항목}으로 반환
+        TTL 동안은 캐시를 사용하고, 만료 시 전체 목록을 페이지 단위로 다시 받습니다.
+        """
+        items = self.listing_cache.get(directory)
+        if items is not None:
+            return items
+
+        items = list_directory_items(self._get_storage_client(), directory)
+        self.listing_cache.set(directory, items)
+        return items
+
+    def bucket_index(self, refresh=False, workers=WALK_WORKERS):
+        """
+        버킷 전체 색인 (BucketIndex)
+        처음 호출할 때 한 번 순회하고 이후에는 재사용합니다. (관리 명령 한 번 실행 동안 공유)
+        순회하면서 받은 디렉토리 목록은 목록 캐시에도 넣어 exists/size 조회가 다시 목록을 받지 않게 합니다.
+        """
+        with self._bucket_index_lock:
+            if self._bucket_index is None or refresh:
+                def directories():
+                    for directory, items in walk_directories(self._get_storage_client(), workers=workers):
+                        self.listing_cache.set(directory, items)
+                        yield directory, items
+
+                self._bucket_index = BucketIndex.from_directories(directories())
+            return self._bucket_index
+
+    def _get_item(self, name):
+        """파일 하나의 목록 항목 반환 (없으면 None)"""
+        return self._list_directory(os.path.dirname(name)).get(os.path.basename(name))
+
+    def _cache_saved_file(self, name, size, content_type, file_id=None):
+        """업로드한 파일을 목록 캐시에 반영 (다음 exists/size 조회가 목록을 다시 받지 않도록)"""
+        directory, filename = os.path.dirname(name), os.path.basename(name)
+        now = datetime.now(timezone.utc).isoformat()
+        previous = self.listing_cache.get(directory) or {}
+        created_at = (previous.get(filename) or {}).get('created_at') or now
+        item = {
+            'name': filename,
+            'id': file_id or name,
+            'created_at': created_at,
+            'updated_at': now,
+            'metadata': {'size': size, 'mimetype': content_type},
+        }
+        self.listing_cache.put(directory, filename, item)
+        if self._bucket_index is not None:
+            self._bucket_index.put(BucketIndex.entry(name, item))
+        # 새 하위 디렉토리면 상위 목록에도 폴더 항목 추가 (폴더는 id가 없음)
+        if directory:
+            parent, folder = os.path.dirname(directory), os.path.basename(directory)
+            parent_items = self.listing_cache.get(parent)
+            if parent_items is not None and folder not in parent_items:
+                self.listing_cache.put(parent, folder, {'name': folder, 'id': None, 'metadata': None})
+
     def _sanitize_filename(self, name):
         """
         한글 및 특수문자 파일명을 안전한 ASCII 파일명으로 변환
@@ -67,58 +524,168 @@ class SupabaseStorage(Storage):
             return os.path.join(directory, safe_filename).replace('\\', '/')
         return safe_filename
 
+    def _content_addressed_name(self, name, content):
+        """
+        내용 sha256으로 저장 경로 생성 (디렉토리와 확장자는 유지)
+        예: project/img/스크린샷.PNG -> project/img/3f2a...c9.png
+        디렉토리가 경로에 남으므로 중복 제거는 디렉토리 단위입니다.
+        (같은 내용을 profile/과 project/img/에 올리면 객체가 두 개)
+        """
+        digest = hashlib.sha256()
+        if hasattr(content, 'chunks'):
+            for chunk in content.chunks():
+                digest.update(chunk)
+            content.seek(0)
+        else:
+            digest.update(content)
+
+        directory = os.path.dirname(name)
+        ext = os.path.splitext(name)[1].lower()
+        filename = f"{digest.hexdigest()[:CONTENT_HASH_LENGTH]}{ext}"
+        return f"{directory}/{filename}" if directory else filename
+
+    def get_available_name(self, name, max_length=None):
+        """
+        덮어쓰기 모드에서는 존재 확인 없이 요청한 이름을 그대로 사용 (업로드가 upsert로 처리)
+        덮어쓰기를 끈 경우 Django 기본 동작(이미 있으면 임의 접미사 추가)을 따릅니다.
+        내용 주소 모드는 _save()에서 내용으로 이름을 정하므로 요청한 이름을 그대로 사용합니다.
+        """
+        if not self.file_overwrite and not self.content_addressed:
+            return super().get_available_name(name, max_length)
+
+        if max_length is not None and len(name) > max_length:
+            # 파일명 길이 제한: 확장자는 유지하고 이름 부분을 자름 (Django 기본 동작과 동일)
+            directory, filename = os.path.split(name)
+            name_part, ext = os.path.splitext(filename)
+            name_part = name_part[:len(name_part) - (len(name) - max_length)]
+            if not name_part:
+                raise SuspiciousFileOperation(
+                    f'Storage can not find an available filename for "{name}". '
+                    'Please make sure that the corresponding file field allows sufficient "max_length".'
+                )
+            name = os.path.join(directory, name_part + ext).replace('\\', '/')
+        return name
+
     def _open(self, name, mode='rb'):
         """
-        파일을 열어서 반환
+        파일을 열어서 반환 (읽기 전용)
+        전체를 내려받지 않고, 읽는 부분만 Range 요청으로 가져오는 파일 객체를 반환합니다.
+        """
+        # 로컬 다운로드 캐시를 쓰는 경우: 같은 버전의 객체는 로컬 파일로 열기
+        if self.download_cache is not None:
+            cached_path = self._open_cached(name)
+            if cached_path:
+                return File(open(cached_path, 'rb'), name=name)
+
+        # 목록 캐시에 크기가 있으면 크기 확인 요청 생략 (목록을 새로 받지는 않음)
+        cached = self.listing_cache.get(os.path.dirname(name)) or {}
+        item = cached.get(os.path.basename(name)) or {}
+        size = (item.get('metadata') or {}).get('size')
+
+        raw = SupabaseRangeFile(self._object_url(name), self._auth_headers(), name=name, size=size)
+        return File(raw, name=name)
+
+    def _open_cached(self, name):
+        """
+        (경로, ETag 또는 수정 시각)으로 다운로드 캐시를 조회하고, 없으면 전체를 내려받아 보관
+        버전을 알 수 없는 객체(목록에 없음 등)는 None을 반환하여 Range 읽기로 처리합니다.
         """
         try:
-            storage = self._get_storage_client()
-            # Supabase에서 파일 다운로드
-            response = storage.download(name)
-            return BytesIO(response)
-        except Exception as e:
-            raise IOError(f"파일을 열 수 없습니다: {name}. 에러: {str(e)}")
+            item = self._get_item(name)
+        except Exception:
+            return None
+        if not item:
+            return None
+
+        version = (item.get('metadata') or {}).get('eTag') or item.get('updated_at')
+        if not version:
+            return None
+
+        key = f"{self.bucket_name}/{name}@{version}"
+        path = self.download_cache.get(key)
+        if path is None:
+            path = self.download_cache.put(key, lambda target: self._download_to(name, target))
+        return path
+
+    def _download_to(self, name, target):
+        """객체 전체를 1MB 단위로 스트리밍하여 target 파일에 기록"""
+        response = http_client.get(
+            self._object_url(name), headers=self._auth_headers(), stream=True, timeout=RESUMABLE_TIMEOUT
+        )
+        try:
+            if response.status_code != 200:
+                raise IOError(f"파일을 열 수 없습니다: {name} ({response.status_code})")
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
+                target.write(chunk)
+        finally:
+            response.close()
 
     def _save(self, name, content):
         """
         파일을 Supabase Storage에 저장
         한글 파일명은 자동으로 안전한 ASCII 파일명으로 변환됩니다.
+        내용 주소 모드(SUPABASE_CONTENT_ADDRESSED)에서는 내용 해시 이름으로 저장하고 같은 내용은 다시 올리지 않습니다.
         """
         try:
             logger.info(f"Attempting to save file: {name}")
             storage = self._get_storage_client()
 
-            # 한글 파일명을 안전한 파일명으로 변환
-            safe_name = self._sanitize_filename(name)
+            # MIME 타입 추정 (원본 파일명 기준)
+            content_type, _ = mimetypes.guess_type(name)
+            if not content_type:
+                content_type = 'application/octet-stream'
+
+            cache_max_age = DEFAULT_CACHE_MAX_AGE
+            upsert = self.file_overwrite
+            if self.content_addressed:
+                # 같은 이름 = 같은 내용: 이미 있으면(목록 캐시/버킷 색인 기준) 업로드 생략
+                safe_name = self._content_addressed_name(name, content)
+                index = self._bucket_index
+                if (index is not None and safe_name in index) or self.exists(safe_name):
+                    logger.info(f"Identical content already stored, skipping upload: {safe_name}")
+                    return safe_name
+                cache_max_age = IMMUTABLE_CACHE_MAX_AGE
+                # 동시에 같은 내용을 올리는 경우에도 결과가 같으므로 덮어쓰기 허용
+                upsert = True
+            else:
+                # 한글 파일명을 안전한 파일명으로 변환
+                safe_name = self._sanitize_filename(name)
             logger.info(f"Sanitized filename: {safe_name}")
 
+            # 큰 파일(이력서, 프로젝트 첨부 파일 등)은 메모리에 모두 읽지 않고 6MB 조각으로 스트리밍
+            size = getattr(content, 'size', None)
+            if size and size > settings.SUPABASE_RESUMABLE_THRESHOLD and hasattr(content, 'chunks'):
+                self._upload_resumable(safe_name, content, size, content_type, cache_max_age, upsert)
+                self._cache_saved_file(safe_name, size, content_type)
+                logger.info(f"File uploaded successfully (resumable): {safe_name}")
+                return safe_name
+
             # content가 InMemoryUploadedFile이나 TemporaryUploadedFile인 경우
             if hasattr(content, 'read'):
                 file_data = content.read()
             else:
                 file_data = content
 
-            # MIME 타입 추정 (원본 파일명 기준)
-            content_type, _ = mimetypes.guess_type(name)
-            if not content_type:
-                content_type = 'application/octet-stream'
-
             logger.info(f"File size: {len(file_data)} bytes, Content-Type: {content_type}")
 
-            # 파일이 이미 존재하는지 확인
-            if self.exists(safe_name):
-                logger.warning(f"File already exists, will overwrite: {safe_name}")
-                # 기존 파일 삭제
-                self.delete(safe_name)
-
             # Supabase Storage에 업로드 (변환된 파일명 사용)
+            # 덮어쓰기 모드는 x-upsert로 한 번의 요청에 처리 (존재 확인/삭제 왕복 없음, 파일이 비는 구간 없음)
             response = storage.upload(
                 path=safe_name,
                 file=file_data,
-                file_options={"content-type": content_type}
+                file_options={
+                    "content-type": content_type,
+                    "cache-control": str(cache_max_age),
+                    "upsert": "true" if upsert else "false",
+                }
             )
 
             logger.info(f"File uploaded successfully: {safe_name}")
+            try:
+                file_id = response.json().get('Id')
+            except ValueError:
+                file_id = None
+            self._cache_saved_file(safe_name, len(file_data), content_type, file_id)
 
             # 변환된 파일명 반환 (Django가 DB에 저장할 경로)
             return safe_name
@@ -127,6 +694,90 @@ class SupabaseStorage(Storage):
             logger.error(f"File save failed: {name}. Error: {str(e)}", exc_info=True)
             raise IOError(f"파일 저장 실패: {name}. 에러: {str(e)}")
 
+    def _upload_resumable(self, name, content, size, content_type,
+                          cache_max_age=DEFAULT_CACHE_MAX_AGE, upsert=None):
+        """
+        TUS 프로토콜(재개 가능 업로드)로 파일을 조각 단위 전송
+        content.chunks()로 6MB씩 읽어 보내므로 파일 크기와 관계없이 메모리에는 조각 하나만 유지됩니다.
+        조각 전송이 실패하면 서버에 기록된 Upload-Offset을 확인하여 그 위치부터 이어서 보냅니다.
+        """
+        def encode(value):
+            return base64.b64encode(value.encode('utf-8')).decode('ascii')
+
+        headers = {
+            **self._auth_headers(),
+            'Tus-Resumable': '1.0.0',
+            'x-upsert': 'true' if (self.file_overwrite if upsert is None else upsert) else 'false',
+        }
+        metadata = {
+            'bucketName': self.bucket_name,
+            'objectName': name,
+            'contentType': content_type,
+            'cacheControl': str(cache_max_age),
+        }
+
+        # 1. 업로드 생성 -> Location 헤더의 업로드 URL로 조각 전송
+        response = http_client.request(
+            'POST',
+            f"{self.supabase_url}/storage/v1/upload/resumable",
+            headers={
+                **headers,
+                'Upload-Length': str(size),
+                'Upload-Metadata': ','.join(f'{key} {encode(value)}' for key, value in metadata.items()),
+            },
+            timeout=RESUMABLE_TIMEOUT,
+        )
+        if response.status_code != 201 or not response.headers.get('Location'):
+            raise IOError(f"재개 가능 업로드 생성 실패 ({response.status_code}): {response.text[:200]}")
+        upload_url = urljoin(f"{self.supabase_url}/", response.headers['Location'])
+
+        # 2. 조각 전송 (Upload-Offset으로 이어 붙임)
+        offset = 0
+        for chunk in content.chunks(chunk_size=RESUMABLE_CHUNK_SIZE):
+            offset = self._upload_chunk(upload_url, headers, chunk, offset)
+
+        if offset != size:
+            raise IOError(f"업로드 크기 불일치: {offset}/{size} bytes")
+
+    def _upload_chunk(self, upload_url, headers, chunk, offset):
+        """조각 하나를 전송하고 다음 offset을 반환 (실패 시 서버 offset 확인 후 재시도)"""
+        last_error = None
+        for attempt in range(RESUMABLE_CHUNK_RETRIES):
+            if attempt:
+                # 직전 시도가 서버에 반영되었는지 확인 (응답만 유실된 경우 다시 보내지 않음)
+                status = http_client.request('HEAD', upload_url, headers=headers, timeout=RESUMABLE_TIMEOUT)
+                server_offset = int(status.headers.get('Upload-Offset', -1))
+                if server_offset == offset + len(chunk):
+                    return server_offset
+                if server_offset != offset:
+                    raise IOError(f"업로드 위치 불일치: 서버 {server_offset}, 로컬 {offset}")
+                time.sleep(0.5 * 2 ** (attempt - 1))
+
+            try:
+                response = http_client.request(
+                    'PATCH',
+                    upload_url,
+                    headers={
+                        **headers,
+                        'Upload-Offset': str(offset),
+                        'Content-Type': 'application/offset+octet-stream',
+                    },
+                    data=chunk,
+                    timeout=RESUMABLE_TIMEOUT,
+                )
+            except Exception as e:
+                last_error = e
+                continue
+
+            if response.status_code == 204:
+                return int(response.headers.get('Upload-Offset', offset + len(chunk)))
+            last_error = IOError(f"조각 전송 실패 ({response.status_code}): {response.text[:200]}")
+            if response.status_code < 500 and response.status_code != 409:
+                # 인증/요청 오류는 재시도해도 같은 결과
+                break
+
+        raise IOError(f"조각 전송 실패 (offset {offset}): {last_error}")
+
     def delete(self, name):
         """
         파일 삭제
@@ -136,17 +787,39 @@ class SupabaseStorage(Storage):
             storage.remove([name])
         except Exception as e:
             raise IOError(f"파일 삭제 실패: {name}. 에러: {str(e)}")
+        self._forget(name)
+
+    def delete_many(self, names):
+        """
+        여러 파일을 storage.remove() 요청 한 번으로 삭제 (REMOVE_BATCH_SIZE개 이하씩 호출 권장)
+
+        Returns:
+            int: 삭제 요청한 파일 수
+        """
+        names = list(names)
+        if not names:
+            return 0
+        try:
+            self._get_storage_client().remove(names)
+        except Exception as e:
+            raise IOError(f"파일 일괄 삭제 실패 ({len(names)}개). 에러: {str(e)}")
+        for name in names:
+            self._forget(name)
+        return len(names)
+
+    def _forget(self, name):
+        """삭제한 파일을 목록 캐시/버킷 색인에서 제거"""
+        self.listing_cache.discard(os.path.dirname(name), os.path.basename(name))
+        if self._bucket_index is not None:
+            self._bucket_index.discard(name)
 
     def exists(self, name):
         """
         파일 존재 여부 확인
         """
         try:
-            storage = self._get_storage_client()
-            # list 메서드로 파일 존재 확인
-            files = storage.list(path=os.path.dirname(name))
-            filename = os.path.basename(name)
-            return any(f['name'] == filename for f in files)
+            # 디렉토리 목록 캐시에서 파일명으로 확인
+            return self._get_item(name) is not None
         except Exception:
             return False
 
@@ -155,8 +828,7 @@ class SupabaseStorage(Storage):
         디렉토리 내 파일 목록 반환
         """
         try:
-            storage = self._get_storage_client()
-            files = storage.list(path=path)
+            files = self._list_directory(path).values()
 
             # 디렉토리와 파일 구분
             directories = []
@@ -177,15 +849,8 @@ class SupabaseStorage(Storage):
         파일 크기 반환 (bytes)
         """
         try:
-            storage = self._get_storage_client()
-            files = storage.list(path=os.path.dirname(name))
-            filename = os.path.basename(name)
-
-            for f in files:
-                if f['name'] == filename:
-                    return f.get('metadata', {}).get('size', 0)
-
-            return 0
+            item = self._get_item(name)
+            return (item.get('metadata') or {}).get('size', 0) if item else 0
         except Exception:
             return 0
 
@@ -209,17 +874,10 @@ class SupabaseStorage(Storage):
         파일 생성 시간
         """
         try:
-            storage = self._get_storage_client()
-            files = storage.list(path=os.path.dirname(name))
-            filename = os.path.basename(name)
-
-            for f in files:
-                if f['name'] == filename:
-                    created_at = f.get('created_at')
-                    if created_at:
-                        from datetime import datetime
-                        return datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-
+            item = self._get_item(name)
+            created_at = item.get('created_at') if item else None
+            if created_at:
+                return datetime.fromisoformat(created_at.replace('Z', '+00:00'))
             return None
         except Exception:
             return None
@@ -229,17 +887,10 @@ class SupabaseStorage(Storage):
         파일 수정 시간
         """
         try:
-            storage = self._get_storage_client()
-            files = storage.list(path=os.path.dirname(name))
-            filename = os.path.basename(name)
-
-            for f in files:
-                if f['name'] == filename:
-                    updated_at = f.get('updated_at')
-                    if updated_at:
-                        from datetime import datetime
-                        return datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-
+            item = self._get_item(name)
+            updated_at = item.get('updated_at') if item else None
+            if updated_at:
+                return datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
             return None
         except Exception:
             return None
@@ -0,0 +1,146 @@
+"""
+Storage 다운로드용 로컬 디스크 LRU 캐시
+같은 객체를 반복해서 여는 관리 명령/서버 측 이미지 처리가 매번 전체를 내려받지 않도록
+(객체 경로, ETag 또는 수정 시각)을 키로 내려받은 파일을 디스크에 보관합니다.
+
+- 키에 버전(ETag/updated_at)이 포함되므로 객체가 바뀌면 자동으로 새 항목을 사용
+- 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+- 같은 디렉토리를 여러 프로세스가 공유할 수 있음 (항목 쓰기는 임시 파일 + os.replace로 원자적,
+  다른 프로세스가 지운 항목은 조회 시 실패로 처리)
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+
+class DiskLRUCache:
+    """크기 제한이 있는 디스크 LRU 캐시 (적중/실패/삭제 통계 포함)"""
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # 파일 경로 -> 크기 (오래 사용하지 않은 순)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        """기존 캐시 파일을 마지막 사용 시각(mtime) 순으로 색인"""
+        entries = []
+        for root, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if filename.startswith('.tmp'):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path, stat.st_size))
+
+        for _, path, size in sorted(entries):
+            self._entries[path] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _path(self, key):
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def get(self, key):
+        """
+        캐시된 파일 경로 반환 (없으면 None)
+
+        Returns:
+            str | None: 로컬 파일 경로
+        """
+        path = self._path(key)
+        with self._lock:
+            if path in self._entries and os.path.exists(path):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                try:
+                    # 다른 프로세스가 다시 색인할 때도 최근 사용으로 보이도록 mtime 갱신
+                    os.utime(path)
+                except OSError:
+                    pass
+                return path
+
+            if path in self._entries:
+                # 다른 프로세스가 삭제한 항목
+                self._total_bytes -= self._entries.pop(path)
+            elif os.path.exists(path):
+                # 다른 프로세스가 추가한 항목
+                self._entries[path] = os.path.getsize(path)
+                self._total_bytes += self._entries[path]
+                self.hits += 1
+                return path
+
+            self.misses += 1
+            return None
+
+    def put(self, key, write):
+        """
+        write(파일 객체)로 내용을 기록하여 캐시에 추가하고 경로를 반환합니다.
+        기록 중 오류가 나면 임시 파일을 지우고 예외를 그대로 전달합니다.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(prefix='.tmp', dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                write(temp_file)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        size = os.path.getsize(path)
+        with self._lock:
+            if path in self._entries:
+                self._total_bytes -= self._entries.pop(path)
+            self._entries[path] = size
+            self._total_bytes += size
+            self._evict()
+        return path
+
+    def _evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목 삭제 (방금 추가한 항목은 유지)"""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            path, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            for path in self._entries:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def info(self):
+        """캐시 적중/실패 통계 반환"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+            }
@@ -0,0 +1,374 @@
+import io
+import os
+import re
+import tempfile
+import threading
+from unittest import mock
+
+import requests
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from portfolio import storage_backends
+from portfolio.storage_backends import BucketIndex, SupabaseRangeFile, SupabaseStorage, walk_bucket
+from portfolio.storage_cache import DiskLRUCache
+
+
+def fake_response(status_code, headers=None, content=b''):
+    return mock.Mock(status_code=status_code, headers=headers or {}, content=content, text='')
+
+
+class FakeTusServer:
+    """
+    재개 가능 업로드(TUS) 엔드포인트 흉내
+    failures: PATCH 호출 순번(1부터) -> 'drop'(반영 전 연결 끊김) 또는 'lost'(반영 후 응답 유실)
+    """
+
+    def __init__(self, failures=None):
+        self.failures = failures or {}
+        self.data = b''
+        self.calls = []
+
+    def request(self, method, url, headers=None, data=None, **kwargs):
+        self.calls.append(method if method != 'PATCH' else f"PATCH@{headers['Upload-Offset']}")
+        if method == 'POST':
+            return fake_response(201, {'Location': '/storage/v1/upload/resumable/upload-1'})
+        if method == 'HEAD':
+            return fake_response(200, {'Upload-Offset': str(len(self.data))})
+
+        failure = self.failures.get(sum(call.startswith('PATCH') for call in self.calls))
+        if failure == 'drop':
+            raise requests.ConnectionError('connection reset')
+        if int(headers['Upload-Offset']) != len(self.data):
+            return fake_response(409)
+        self.data += data
+        if failure == 'lost':
+            raise requests.ReadTimeout('response lost')
+        return fake_response(204, {'Upload-Offset': str(len(self.data))})
+
+
+@override_settings(SUPABASE_URL='https://demo.supabase.co', SUPABASE_KEY='key')
+@mock.patch.object(storage_backends, 'RESUMABLE_CHUNK_SIZE', 4)
+@mock.patch.object(storage_backends.time, 'sleep', lambda seconds: None)
+class ResumableUploadTests(SimpleTestCase):
+    """TUS 조각 전송 실패 시 서버 Upload-Offset 확인 후 이어서 전송"""
+
+    content = b'abcdefghij'
+
+    def upload(self, server):
+        storage = SupabaseStorage()
+        with mock.patch.object(storage_backends.http_client, 'request', server.request):
+            storage._upload_resumable(
+                'files/a.bin', ContentFile(self.content), len(self.content), 'application/octet-stream'
+            )
+
+    def test_failed_chunk_resumes_from_server_offset(self):
+        server = FakeTusServer(failures={2: 'drop'})
+
+        self.upload(server)
+
+        self.assertEqual(server.data, self.content)
+        self.assertEqual(server.calls, ['POST', 'PATCH@0', 'PATCH@4', 'HEAD', 'PATCH@4', 'PATCH@8'])
+
+    def test_chunk_applied_before_lost_response_is_not_resent(self):
+        server = FakeTusServer(failures={2: 'lost'})
+
+        self.upload(server)
+
+        self.assertEqual(server.data, self.content)
+        self.assertEqual(server.calls, ['POST', 'PATCH@0', 'PATCH@4', 'HEAD', 'PATCH@8'])
+
+    def test_gives_up_after_retries(self):
+        server = FakeTusServer(failures={2: 'drop', 3: 'drop', 4: 'drop'})
+
+        with self.assertRaises(IOError):
+            self.upload(server)
+
+        self.assertEqual(server.data, b'abcd')
+        self.assertEqual(server.calls.count('PATCH@4'), storage_backends.RESUMABLE_CHUNK_RETRIES)
+
+    def test_server_offset_mismatch_is_an_error(self):
+        server = FakeTusServer(failures={2: 'drop'})
+        original_request = server.request
+
+        def request(method, url, **kwargs):
+            response = original_request(method, url, **kwargs)
+            if method == 'HEAD':
+                response.headers['Upload-Offset'] = '2'
+            return response
+        server.request = request
+
+        with self.assertRaisesRegex(IOError, '업로드 위치 불일치'):
+            self.upload(server)
+
+
+class FakeRangeServer:
+    """HTTP Range 요청에 응답하는 객체 서버 흉내 (요청한 범위를 기록)"""
+
+    def __init__(self, data, supports_range=True):
+        self.data = data
+        self.supports_range = supports_range
+        self.ranges = []
+
+    def get(self, url, headers=None, **kwargs):
+        start, end = map(int, re.fullmatch(r'bytes=(\d+)-(\d+)', headers['Range']).groups())
+        self.ranges.append((start, end + 1))
+        total = len(self.data)
+        if not self.supports_range:
+            return fake_response(200, content=self.data)
+        if start >= total:
+            return fake_response(416, {'Content-Range': f'bytes */{total}'})
+        body = self.data[start:end + 1]
+        return fake_response(206, {'Content-Range': f'bytes {start}-{start + len(body) - 1}/{total}'}, body)
+
+
+@mock.patch.object(storage_backends, 'RANGE_BLOCK_SIZE', 4)
+@mock.patch.object(storage_backends, 'RANGE_READ_AHEAD', 8)
+class SupabaseRangeFileTests(SimpleTestCase):
+    """블록 단위 Range 읽기, 미리 읽기, seek/EOF 처리와 요청 수"""
+
+    data = bytes(range(20))
+
+    def open(self, server, size=None):
+        patcher = mock.patch.object(storage_backends.http_client, 'get', server.get)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        raw = SupabaseRangeFile('https://demo.supabase.co/object', {}, name='a.bin', size=size)
+        self.addCleanup(raw.close)
+        return raw
+
+    def test_reads_across_block_boundaries_with_read_ahead(self):
+        server = FakeRangeServer(self.data)
+        raw = self.open(server)
+
+        self.assertEqual(raw.read(6), self.data[:6])
+        raw.seek(6)
+        self.assertEqual(raw.read(6), self.data[6:12])
+        self.assertEqual(raw.read(), self.data[12:])
+
+        # 크기 확인 겸 앞부분 미리 읽기 1회 + 빠진 블록부터 파일 끝까지 1회
+        self.assertEqual(server.ranges, [(0, 8), (8, 20)])
+        self.assertEqual(raw.requests, 2)
+        self.assertEqual(raw.bytes_downloaded, len(self.data))
+
+    def test_missing_blocks_are_fetched_as_runs(self):
+        server = FakeRangeServer(self.data)
+        raw = self.open(server, size=len(self.data))
+
+        raw.seek(16)
+        self.assertEqual(raw.read(4), self.data[16:])
+        raw.seek(2)
+        self.assertEqual(raw.read(16), self.data[2:18])
+
+        # 크기를 알면 첫 요청이 읽는 위치부터, 이미 받은 마지막 블록 앞에서 미리 읽기 중단
+        self.assertEqual(server.ranges, [(16, 20), (0, 16)])
+        self.assertEqual(raw.requests, 2)
+
+    def test_seek_past_eof_reads_nothing(self):
+        server = FakeRangeServer(self.data)
+        raw = self.open(server, size=len(self.data))
+
+        self.assertEqual(raw.seek(100), 100)
+        self.assertEqual(raw.read(5), b'')
+        self.assertEqual(raw.read(), b'')
+        self.assertEqual(raw.seek(-4, io.SEEK_END), 16)
+        self.assertEqual(raw.read(), self.data[16:])
+        self.assertEqual(raw.requests, 1)
+        with self.assertRaises(ValueError):
+            raw.seek(-1)
+
+    def test_zero_length_object(self):
+        server = FakeRangeServer(b'')
+        raw = self.open(server)
+
+        self.assertEqual(raw.size, 0)
+        self.assertEqual(raw.read(), b'')
+        self.assertEqual(raw.read(10), b'')
+        self.assertEqual(raw.requests, 1)
+
+    def test_server_without_range_support_returns_whole_object(self):
+        server = FakeRangeServer(self.data, supports_range=False)
+        raw = self.open(server)
+
+        raw.seek(10)
+        self.assertEqual(raw.read(4), self.data[10:14])
+        self.assertEqual(raw.read(), self.data[14:])
+        self.assertEqual(raw.requests, 1)
+
+    def test_error_status_raises_ioerror(self):
+        server = FakeRangeServer(self.data)
+        server.get = lambda url, **kwargs: fake_response(500)
+        raw = self.open(server)
+
+        with self.assertRaises(IOError):
+            raw.read(1)
+
+
+class DiskLRUCacheTests(SimpleTestCase):
+    """다운로드 캐시의 LRU 삭제, 재시작 시 mtime 순 색인, 다른 프로세스의 변경, 기록 실패 정리"""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = temp_dir.name
+
+    def put(self, cache, key, data=b'1234'):
+        return cache.put(key, lambda f: f.write(data))
+
+    def cache_files(self):
+        return sorted(
+            filename for _, _, filenames in os.walk(self.directory) for filename in filenames
+        )
+
+    def test_evicts_least_recently_used_over_max_bytes(self):
+        cache = DiskLRUCache(self.directory, max_bytes=10)
+        path_a = self.put(cache, 'a')
+        path_b = self.put(cache, 'b')
+        self.assertEqual(cache.get('a'), path_a)
+
+        path_c = self.put(cache, 'c')
+
+        self.assertFalse(os.path.exists(path_b))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), path_a)
+        self.assertEqual(cache.get('c'), path_c)
+        self.assertEqual(cache.info()['evictions'], 1)
+        self.assertEqual(cache.info()['bytes'], 8)
+
+    def test_entry_larger_than_limit_is_kept_until_next_put(self):
+        cache = DiskLRUCache(self.directory, max_bytes=2)
+
+        path = self.put(cache, 'big')
+
+        self.assertEqual(cache.get('big'), path)
+
+    def test_load_reindexes_existing_files_by_mtime(self):
+        cache = DiskLRUCache(self.directory, max_bytes=100)
+        paths = {key: self.put(cache, key) for key in ('a', 'b', 'c')}
+        for key, mtime in (('a', 3000), ('b', 1000), ('c', 2000)):
+            os.utime(paths[key], (mtime, mtime))
+        # 기록 도중 남은 임시 파일은 색인하지 않음
+        with open(os.path.join(os.path.dirname(paths['a']), '.tmpleftover'), 'wb') as f:
+            f.write(b'x' * 50)
+
+        reloaded = DiskLRUCache(self.directory, max_bytes=8)
+
+        self.assertFalse(os.path.exists(paths['b']))
+        self.assertEqual(reloaded.info()['entries'], 2)
+        self.assertEqual(reloaded.info()['bytes'], 8)
+        self.assertEqual(reloaded.get('a'), paths['a'])
+        self.assertEqual(reloaded.get('c'), paths['c'])
+
+    def test_get_after_entry_removed_by_another_process(self):
+        cache = DiskLRUCache(self.directory, max_bytes=100)
+        path = self.put(cache, 'a')
+        os.remove(path)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.info()['entries'], 0)
+        self.assertEqual(cache.info()['bytes'], 0)
+        self.assertEqual(cache.info()['misses'], 1)
+
+    def test_get_finds_entry_added_by_another_process(self):
+        cache = DiskLRUCache(self.directory, max_bytes=100)
+        other = DiskLRUCache(self.directory, max_bytes=100)
+        path = self.put(other, 'a')
+
+        self.assertEqual(cache.get('a'), path)
+        self.assertEqual(cache.info()['bytes'], 4)
+        self.assertEqual(cache.info()['hits'], 1)
+
+    def test_put_removes_temp_file_when_writer_fails(self):
+        cache = DiskLRUCache(self.directory, max_bytes=100)
+
+        def write(f):
+            f.write(b'partial')
+            raise IOError('download interrupted')
+
+        with self.assertRaisesRegex(IOError, 'download interrupted'):
+            cache.put('a', write)
+
+        self.assertEqual(self.cache_files(), [])
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.info()['entries'], 0)
+
+
+class FakeBucket:
+    """
+    storage.from_(버킷)의 list() 흉내: limit/offset 페이지 단위로 응답하고 호출을 기록
+    tree: {디렉토리: [항목명]} (하위 디렉토리는 이름 끝에 '/')
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def list(self, path='', options=None):
+        with self._lock:
+            self.calls.append((path, options['offset']))
+        items = []
+        for name in sorted(self.tree.get(path, [])):
+            if name.endswith('/'):
+                items.append({'name': name[:-1], 'id': None, 'metadata': None})
+            else:
+                items.append({'name': name, 'id': f'{path}/{name}', 'updated_at': '2024-01-01T00:00:00Z',
+                              'metadata': {'size': 1, 'eTag': '"etag"'}})
+        return items[options['offset']:options['offset'] + options['limit']]
+
+
+@mock.patch.object(storage_backends, 'LIST_PAGE_SIZE', 3)
+class BucketWalkTests(SimpleTestCase):
+    """limit/offset 페이지 순회와 하위 디렉토리 재귀 조회"""
+
+    tree = {
+        '': ['project/', 'photos/', 'root.txt'],
+        'photos': ['me.jpg'],
+        # 페이지 크기의 정확한 배수 -> 빈 페이지를 받고 멈춤
+        'project': ['img/', 'a.pdf', 'b.pdf'],
+        # 여러 페이지 + 마지막 짧은 페이지
+        'project/img': [f'{index}.png' for index in range(7)] + ['variants/'],
+        'project/img/variants': ['0-320w.webp', '0-640w.webp'],
+    }
+
+    def expected_paths(self):
+        return sorted(
+            f'{directory}/{name}' if directory else name
+            for directory, names in self.tree.items()
+            for name in names if not name.endswith('/')
+        )
+
+    def test_walk_returns_every_file_once(self):
+        bucket = FakeBucket(self.tree)
+
+        paths = [path for path, _ in walk_bucket(bucket, workers=3)]
+
+        self.assertEqual(sorted(paths), self.expected_paths())
+        self.assertEqual(len(paths), len(set(paths)))
+        self.assertEqual(
+            sorted(offset for path, offset in bucket.calls if path == 'project/img'), [0, 3, 6],
+        )
+        self.assertEqual(sorted(offset for path, offset in bucket.calls if path == 'project'), [0, 3])
+        self.assertEqual([offset for path, offset in bucket.calls if path == 'photos'], [0])
+
+    def test_walk_from_prefix(self):
+        bucket = FakeBucket(self.tree)
+
+        paths = sorted(path for path, _ in walk_bucket(bucket, prefix='/project/img/'))
+
+        self.assertEqual(paths, [p for p in self.expected_paths() if p.startswith('project/img/')])
+
+    def test_list_supabase_files_lists_index(self):
+        index = BucketIndex.build(FakeBucket(self.tree))
+        storage = mock.Mock()
+        storage.bucket_index.return_value = index
+        out = io.StringIO()
+
+        with override_settings(SUPABASE_URL='https://demo.supabase.co', SUPABASE_KEY='key'), \
+                mock.patch('core.management.commands.list_supabase_files.default_storage', storage):
+            call_command('list_supabase_files', '--prefix', 'project', stdout=out)
+
+        listed = re.findall(r'FILE: (\S+)', out.getvalue())
+        self.assertEqual(listed, [p for p in self.expected_paths() if p.startswith('project/')])
+        self.assertIn(f'Total: {len(listed)} files', out.getvalue())
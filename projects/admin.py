@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Project, ProjectFile, ProjectImage
+from .models import Project, ProjectFile, ProjectImage, GithubReadme
 from django.utils.html import format_html
 from django import forms
 # Register your models here.
@@ -114,4 +114,11 @@ class ProjectAdmin(admin.ModelAdmin):
             return  f"{obj.start_date} ~ {obj.end_date}"
         return f"{obj.start_date} ~ 진행 중"
     
-    get_period_display.short_description = "프로젝트 기간"
\ No newline at end of file
+    get_period_display.short_description = "프로젝트 기간"
+
+# GitHub README 캐시 (삭제하면 다음 요청에서 다시 가져옴)
+@admin.register(GithubReadme)
+class GithubReadmeAdmin(admin.ModelAdmin):
+    list_display = ['__str__', 'etag', 'fetched_at', 'checked_at']
+    search_fields = ['owner', 'repo']
+    readonly_fields = ['owner', 'repo', 'etag', 'content', 'html', 'fetched_at', 'checked_at']
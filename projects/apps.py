@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class ProjectsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'projects'
+
+    def ready(self):
+        # 프로젝트/README 변경 시 검색 색인 갱신 시그널 등록
+        from .signals import connect_signals
+        connect_signals()
@@ -0,0 +1,60 @@
+# Generated by Django 5.0.6 on 2026-10-18 14:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0006_alter_project_company"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GithubReadme",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "owner",
+                    models.CharField(max_length=100, verbose_name="저장소 소유자"),
+                ),
+                ("repo", models.CharField(max_length=100, verbose_name="저장소명")),
+                (
+                    "etag",
+                    models.CharField(blank=True, max_length=200, verbose_name="ETag"),
+                ),
+                ("content", models.TextField(blank=True, verbose_name="README 원문")),
+                ("html", models.TextField(blank=True, verbose_name="README HTML")),
+                (
+                    "fetched_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="내용 갱신일시"
+                    ),
+                ),
+                (
+                    "checked_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="재검증일시"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "GitHub README 캐시",
+                "verbose_name_plural": "GitHub README 캐시",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="githubreadme",
+            constraint=models.UniqueConstraint(
+                fields=("owner", "repo"), name="unique_github_readme_repo"
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.6 on 2026-10-18 14:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0007_githubreadme"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="iframe_checked_at",
+            field=models.DateTimeField(
+                blank=True, editable=False, null=True, verbose_name="임베드 확인일시"
+            ),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="iframe_supported",
+            field=models.BooleanField(
+                default=True, editable=False, verbose_name="iframe 임베드 가능"
+            ),
+        ),
+    ]
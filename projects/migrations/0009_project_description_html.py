@@ -0,0 +1,30 @@
+# Generated by Django 5.0.6 on 2026-10-18 14:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0008_project_iframe_supported"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="description_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=64,
+                verbose_name="프로젝트 설명 해시",
+            ),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="description_html",
+            field=models.TextField(
+                blank=True, editable=False, verbose_name="프로젝트 설명 HTML"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.6 on 2026-10-18 14:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_thumbnails(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectImage = apps.get_model("projects", "ProjectImage")
+
+    for project in Project.objects.all():
+        thumbnail = (
+            ProjectImage.objects.filter(project=project)
+            .exclude(image="")
+            .exclude(image__isnull=True)
+            .order_by("-is_thumbnail", "order", "id")
+            .first()
+        )
+        if thumbnail:
+            Project.objects.filter(pk=project.pk).update(thumbnail=thumbnail)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0009_project_description_html"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="thumbnail",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="projects.projectimage",
+                verbose_name="대표 이미지",
+            ),
+        ),
+        migrations.RunPython(fill_thumbnails, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+"""
+프로젝트 전문 검색 색인 생성
+- PostgreSQL: search_document/search_vector 컬럼 + GIN 인덱스
+- SQLite: FTS5 가상 테이블
+색인 내용은 projects.search 모듈이 관리합니다. (README 포함 재색인: rebuild_search_index 명령)
+"""
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(
+            "ALTER TABLE projects_project "
+            "ADD COLUMN IF NOT EXISTS search_document text, "
+            "ADD COLUMN IF NOT EXISTS search_vector tsvector"
+        )
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS projects_project_search_vector_gin "
+            "ON projects_project USING gin (search_vector)"
+        )
+        schema_editor.execute(
+            "UPDATE projects_project SET "
+            "search_document = concat_ws(E'\\n', title, description), "
+            "search_vector = setweight(to_tsvector('simple', title), 'A') || "
+            "setweight(to_tsvector('simple', description), 'B')"
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS projects_project_fts USING fts5("
+            "title, description, readme, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            "INSERT INTO projects_project_fts (rowid, title, description, readme) "
+            "SELECT id, title, description, '' FROM projects_project"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS projects_project_search_vector_gin")
+        schema_editor.execute(
+            "ALTER TABLE projects_project "
+            "DROP COLUMN IF EXISTS search_vector, DROP COLUMN IF EXISTS search_document"
+        )
+    elif vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS projects_project_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0010_project_thumbnail"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_experience_start_date_index"),
+        ("projects", "0011_project_search_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["-start_date", "-id"], name="project_start_date_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectfile",
+            index=models.Index(
+                fields=["project", "order"], name="projectfile_project_order_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectimage",
+            index=models.Index(
+                fields=["project", "-is_thumbnail", "order"],
+                name="projectimage_thumb_order_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectfile",
+            name="project",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="files",
+                to="projects.project",
+                verbose_name="프로젝트 파일",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectimage",
+            name="project",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="images",
+                to="projects.project",
+                verbose_name="프로젝트명",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0012_composite_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectimage",
+            name="image_variants",
+            field=models.JSONField(
+                blank=True, default=dict, editable=False, verbose_name="파생 이미지"
+            ),
+        ),
+    ]
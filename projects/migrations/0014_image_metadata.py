@@ -0,0 +1,41 @@
+# Generated by Django 5.0.6 on 2026-10-18 15:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("projects", "0013_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectimage",
+            name="image_color",
+            field=models.CharField(
+                blank=True, editable=False, max_length=7, verbose_name="대표 색상"
+            ),
+        ),
+        migrations.AddField(
+            model_name="projectimage",
+            name="image_height",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="이미지 높이"
+            ),
+        ),
+        migrations.AddField(
+            model_name="projectimage",
+            name="image_placeholder",
+            field=models.TextField(
+                blank=True, editable=False, verbose_name="블러 미리보기"
+            ),
+        ),
+        migrations.AddField(
+            model_name="projectimage",
+            name="image_width",
+            field=models.PositiveIntegerField(
+                blank=True, editable=False, null=True, verbose_name="이미지 너비"
+            ),
+        ),
+    ]
@@ -1,10 +1,17 @@
 from django.db import models
+from django.utils import timezone
 from core.models import Experience
+from core.imaging import process_image
 from datetime import date
 from dateutil.relativedelta import relativedelta
 from pathlib import Path
+import hashlib
+import markdown
 import mimetypes
 
+# 프로젝트 설명 Markdown 확장 (nl2br: 줄바꿈을 <br> 태그로 변환)
+DESCRIPTION_MARKDOWN_EXTENSIONS = ['fenced_code', 'tables', 'nl2br']
+
 class Project(models.Model):
     company = models.ForeignKey(
         'core.Experience',
@@ -18,11 +25,27 @@ class Project(models.Model):
 
     title = models.CharField(max_length=200, verbose_name="프로젝트명")
     description = models.TextField(verbose_name="프로젝트 설명")
+    # 저장 시 미리 렌더링한 설명 HTML과 원문 해시 (해시가 같으면 다시 렌더링하지 않음)
+    description_html = models.TextField(blank=True, editable=False, verbose_name="프로젝트 설명 HTML")
+    description_hash = models.CharField(max_length=64, blank=True, editable=False, verbose_name="프로젝트 설명 해시")
     start_date = models.DateField(verbose_name="시작일")
     end_date = models.DateField(verbose_name="종료일", blank=True, null=True)
     figma_url = models.URLField(max_length=1000, blank=True, verbose_name="Figma URL")
     github_url = models.URLField(max_length=1000, blank=True, verbose_name="Github URL")
     demo_url = models.URLField(max_length=1000, blank=True, verbose_name="Demo URL")
+    # 목록 카드용 대표 이미지 (ProjectImage 저장/삭제 시 동기화, 목록을 prefetch 없이 한 번의 쿼리로 조회)
+    thumbnail = models.ForeignKey(
+        'ProjectImage',
+        on_delete=models.SET_NULL,
+        related_name='+',
+        blank=True,
+        null=True,
+        editable=False,
+        verbose_name="대표 이미지",
+    )
+    # Demo URL의 iframe 임베드 가능 여부 (demo_url 변경 시 및 check_iframe_support 명령으로 갱신)
+    iframe_supported = models.BooleanField(default=True, editable=False, verbose_name="iframe 임베드 가능")
+    iframe_checked_at = models.DateTimeField(blank=True, null=True, editable=False, verbose_name="임베드 확인일시")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -30,9 +53,78 @@ class Project(models.Model):
         verbose_name = "5.프로젝트"
         verbose_name_plural = "5.프로젝트"
         ordering = ["-start_date"]
+        indexes = [
+            # 키셋 페이지네이션 정렬 순서 (get_project_page)
+            models.Index(fields=["-start_date", "-id"], name="project_start_date_id_idx"),
+        ]
 
     def __str__(self):
         return self.title
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # demo_url 변경 감지를 위해 DB에서 읽은 값 보관 (지연 로딩 필드는 조회하지 않음)
+        instance._loaded_demo_url = instance.__dict__.get('demo_url')
+        return instance
+
+    def refresh_thumbnail(self):
+        """
+        대표 이미지를 다시 계산하여 저장합니다.
+        is_thumbnail로 지정된 이미지를 우선하고, 없으면 순서상 첫 번째 이미지를 사용합니다.
+        """
+        thumbnail = (
+            self.images.exclude(image='').exclude(image__isnull=True)
+            .order_by('-is_thumbnail', 'order', 'id')
+            .only('id')
+            .first()
+        )
+        thumbnail_id = thumbnail.pk if thumbnail else None
+        if thumbnail_id != self.thumbnail_id:
+            # save()를 거치지 않아 updated_at/설명 렌더링/임베드 확인에 영향 없음
+            Project.objects.filter(pk=self.pk).update(thumbnail=thumbnail_id)
+            self.thumbnail_id = thumbnail_id
+
+    def get_description_hash(self):
+        """설명 원문과 Markdown 확장 목록의 해시 (확장이 바뀌어도 다시 렌더링되도록 포함)"""
+        source = '\n'.join([','.join(DESCRIPTION_MARKDOWN_EXTENSIONS), self.description])
+        return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+    def render_description(self):
+        """설명이 바뀐 경우에만 Markdown을 HTML로 렌더링합니다. 렌더링했으면 True 반환"""
+        description_hash = self.get_description_hash()
+        if description_hash == self.description_hash:
+            return False
+        self.description_html = markdown.markdown(self.description, extensions=DESCRIPTION_MARKDOWN_EXTENSIONS)
+        self.description_hash = description_hash
+        return True
+
+    def get_description_html(self):
+        """미리 렌더링된 설명 HTML 반환 (백필 전 데이터는 즉석에서 렌더링)"""
+        if not self.description_hash:
+            self.render_description()
+        return self.description_html
+
+    def save(self, *args, **kwargs):
+        self.render_description()
+
+        # demo_url이 바뀐 경우에만 임베드 가능 여부를 다시 확인
+        if self.demo_url != getattr(self, '_loaded_demo_url', None):
+            if not self.demo_url:
+                self.iframe_supported = True
+                self.iframe_checked_at = timezone.now()
+            elif self._state.adding:
+                # 새 프로젝트(create, loaddata 등)는 외부 요청 없이 저장하고 미확인으로 둠
+                # -> 첫 상세 조회(get_iframe_supported) 또는 check_iframe_support 명령에서 확인
+                self.iframe_checked_at = None
+            else:
+                from .services import check_iframe_embeddable
+                # 관리자 저장 요청 안에서 실행되므로 재시도 없이 한 번만 확인 (check_iframe_support 명령은 재시도)
+                self.iframe_supported = check_iframe_embeddable(self.demo_url, retry=False)
+                self.iframe_checked_at = timezone.now()
+
+        super().save(*args, **kwargs)
+        self._loaded_demo_url = self.demo_url
     
 class ProjectImage(models.Model):
     project = models.ForeignKey(
@@ -40,9 +132,15 @@ class ProjectImage(models.Model):
         on_delete=models.CASCADE,
         related_name='images',
         verbose_name="프로젝트명",
+        db_index=False,  # 복합 인덱스(Meta.indexes)의 첫 컬럼이 project이므로 단일 인덱스 불필요
     )
     image = models.ImageField(upload_to="project/img", blank=True, null=True, 
                               verbose_name="프로젝트 이미지")
+    image_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name="파생 이미지")
+    image_width = models.PositiveIntegerField(blank=True, null=True, editable=False, verbose_name="이미지 너비")
+    image_height = models.PositiveIntegerField(blank=True, null=True, editable=False, verbose_name="이미지 높이")
+    image_color = models.CharField(max_length=7, blank=True, editable=False, verbose_name="대표 색상")
+    image_placeholder = models.TextField(blank=True, editable=False, verbose_name="블러 미리보기")
     order = models.IntegerField(default=0, verbose_name="순서")
     is_thumbnail = models.BooleanField(default=False, verbose_name="대표 이미지")
 
@@ -50,9 +148,27 @@ class ProjectImage(models.Model):
         verbose_name = "프로젝트 이미지"
         verbose_name_plural = "프로젝트 이미지"
         ordering = ['order']
+        indexes = [
+            # 대표 이미지 선정(refresh_thumbnail)과 상세 모달의 이미지 prefetch
+            models.Index(fields=['project', '-is_thumbnail', 'order'], name='projectimage_thumb_order_idx'),
+        ]
     
     def __str__(self):
         return f"{self.project.title} - 이미지 {self.order}"
+
+    def save(self, *args, **kwargs):
+        # 이미지가 바뀐 경우에만 너비별 WebP/AVIF 파생본과 크기/대표 색상/미리보기 생성
+        # (카드/모달은 srcset으로 알맞은 크기를 고르고, 로딩 전에는 미리보기와 고정 비율로 자리 확보)
+        process_image(self, 'image')
+        super().save(*args, **kwargs)
+        # 대표 이미지 지정/순서 변경을 프로젝트의 썸네일 참조에 반영
+        self.project.refresh_thumbnail()
+
+    def delete(self, *args, **kwargs):
+        project = self.project
+        result = super().delete(*args, **kwargs)
+        project.refresh_thumbnail()
+        return result
     
 class ProjectFile(models.Model):
     project = models.ForeignKey(
@@ -60,6 +176,7 @@ class ProjectFile(models.Model):
         on_delete=models.CASCADE,
         related_name='files',
         verbose_name="프로젝트 파일",
+        db_index=False,  # 복합 인덱스(Meta.indexes)의 첫 컬럼이 project이므로 단일 인덱스 불필요
     )
 
     file = models.FileField (
@@ -87,8 +204,36 @@ class ProjectFile(models.Model):
         verbose_name = "프로젝트 파일"
         verbose_name_plural = "프로젝트 파일"
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['project', 'order'], name='projectfile_project_order_idx'),
+        ]
     def __str__(self):
         return f"{self.project.title} - 파일{self.title}"
+
+
+class GithubReadme(models.Model):
+    """
+    GitHub README 캐시
+    owner/repo 단위로 렌더링된 HTML과 GitHub이 준 ETag를 저장하여
+    모달 요청이 GitHub 응답 속도나 API 호출 한도에 영향을 받지 않도록 합니다.
+    """
+    owner = models.CharField(max_length=100, verbose_name="저장소 소유자")
+    repo = models.CharField(max_length=100, verbose_name="저장소명")
+    etag = models.CharField(max_length=200, blank=True, verbose_name="ETag")
+    content = models.TextField(blank=True, verbose_name="README 원문")
+    html = models.TextField(blank=True, verbose_name="README HTML")
+    fetched_at = models.DateTimeField(blank=True, null=True, verbose_name="내용 갱신일시")
+    checked_at = models.DateTimeField(blank=True, null=True, verbose_name="재검증일시")
+
+    class Meta:
+        verbose_name = "GitHub README 캐시"
+        verbose_name_plural = "GitHub README 캐시"
+        constraints = [
+            models.UniqueConstraint(fields=['owner', 'repo'], name='unique_github_readme_repo'),
+        ]
+
+    def __str__(self):
+        return f"{self.owner}/{self.repo}"
         
 
 
@@ -0,0 +1,189 @@
+"""
+프로젝트 전문 검색
+제목, 설명, 캐시된 GitHub README 원문을 색인하고 순위와 하이라이트 스니펫을 함께 반환합니다.
+
+- PostgreSQL: projects_project.search_vector (tsvector) 컬럼 + GIN 인덱스
+- SQLite (로컬 개발): FTS5 가상 테이블 projects_project_fts
+
+색인 컬럼/테이블은 ORM 모델 밖에서 관리하며(마이그레이션 0011),
+프로젝트/README 저장 시 시그널에서 해당 프로젝트만 증분 갱신합니다.
+"""
+import re
+
+from django.db import connection
+from django.utils.html import escape
+
+from .models import GithubReadme, Project
+from .services import parse_github_repo
+
+FTS_TABLE = 'projects_project_fts'
+# PostgreSQL 한국어 형태소 사전이 없으므로 공백 단위(simple) 사전 + 접두어 검색 사용
+PG_CONFIG = 'simple'
+
+# 하이라이트 표시용 임시 구분자 (이스케이프 후 <mark> 태그로 치환)
+_MARK_START = '\x02'
+_MARK_END = '\x03'
+
+
+def _tokenize(query: str) -> list:
+    return re.findall(r'\w+', query)[:10]
+
+
+def _readme_text(project: Project) -> str:
+    parsed = parse_github_repo(project.github_url)
+    if not parsed:
+        return ''
+    owner, repo = parsed
+    readme = GithubReadme.objects.filter(owner=owner, repo=repo).only('content').first()
+    return readme.content if readme else ''
+
+
+def _format_snippet(snippet: str) -> str:
+    """스니펫 본문은 이스케이프하고 일치 구간만 <mark>로 감쌈"""
+    return escape(snippet or '').replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+
+
+def index_project(project_id: int):
+    """프로젝트 하나의 검색 색인을 갱신합니다. (없는 프로젝트면 색인에서 제거)"""
+    project = Project.objects.filter(pk=project_id).only('id', 'title', 'description', 'github_url').first()
+    if project is None:
+        remove_project(project_id)
+        return
+
+    readme = _readme_text(project)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                f"""
+                UPDATE projects_project SET
+                    search_document = concat_ws(E'\\n', %s, %s, %s),
+                    search_vector =
+                        setweight(to_tsvector('{PG_CONFIG}', %s), 'A') ||
+                        setweight(to_tsvector('{PG_CONFIG}', %s), 'B') ||
+                        setweight(to_tsvector('{PG_CONFIG}', %s), 'C')
+                WHERE id = %s
+                """,
+                [project.title, project.description, readme,
+                 project.title, project.description, readme, project.pk],
+            )
+        elif connection.vendor == 'sqlite':
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [project.pk])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description, readme) VALUES (%s, %s, %s, %s)",
+                [project.pk, project.title, project.description, readme],
+            )
+
+
+def remove_project(project_id: int):
+    """검색 색인에서 프로젝트를 제거합니다. (PostgreSQL은 행과 함께 삭제되므로 SQLite만 처리)"""
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [project_id])
+
+
+def index_projects_for_readme(owner: str, repo: str):
+    """README가 갱신된 저장소를 사용하는 프로젝트들의 색인을 갱신합니다."""
+    for project in Project.objects.filter(github_url__icontains=f'github.com/{owner}/{repo}').only('id', 'github_url'):
+        if parse_github_repo(project.github_url) == (owner, repo):
+            index_project(project.pk)
+
+
+def rebuild_index() -> int:
+    """
+    모든 프로젝트의 검색 색인을 다시 만듭니다.
+
+    Returns:
+        int: 색인한 프로젝트 수
+    """
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE}")
+
+    project_ids = list(Project.objects.values_list('id', flat=True))
+    for project_id in project_ids:
+        index_project(project_id)
+    return len(project_ids)
+
+
+def search_projects(query: str, limit: int = 20) -> list:
+    """
+    프로젝트를 전문 검색하여 관련도 순으로 반환합니다.
+
+    Args:
+        query: 검색어 (공백으로 구분된 단어는 모두 포함, 각 단어는 접두어 일치)
+        limit: 최대 결과 수
+
+    Returns:
+        list: [{'id', 'title', 'snippet'(하이라이트 HTML), 'rank'}] 관련도 높은 순
+    """
+    tokens = _tokenize(query)
+    if not tokens:
+        return []
+
+    if connection.vendor == 'postgresql':
+        rows = _search_postgresql(tokens, limit)
+    elif connection.vendor == 'sqlite':
+        rows = _search_sqlite(tokens, limit)
+    else:
+        rows = _search_fallback(tokens, limit)
+
+    return [
+        {'id': project_id, 'title': title, 'snippet': _format_snippet(snippet), 'rank': round(rank, 6)}
+        for project_id, title, snippet, rank in rows
+    ]
+
+
+def _search_postgresql(tokens, limit):
+    tsquery = ' & '.join(f"{token}:*" for token in tokens)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT id, title,
+                ts_headline('{PG_CONFIG}', coalesce(search_document, ''), query,
+                    'StartSel={_MARK_START}, StopSel={_MARK_END}, MaxWords=30, MinWords=10, MaxFragments=2'),
+                ts_rank(search_vector, query) AS rank
+            FROM (
+                SELECT id, title, search_document, search_vector, query
+                FROM projects_project, to_tsquery('{PG_CONFIG}', %s) AS query
+                WHERE search_vector @@ query
+                ORDER BY ts_rank(search_vector, query) DESC, id DESC
+                LIMIT %s
+            ) AS matched
+            ORDER BY rank DESC, id DESC
+            """,
+            [tsquery, limit],
+        )
+        return cursor.fetchall()
+
+
+def _search_sqlite(tokens, limit):
+    match = ' '.join('"{}"*'.format(token.replace('"', '""')) for token in tokens)
+    with connection.cursor() as cursor:
+        # bm25()는 관련도가 높을수록 작은(음수) 값 -> 부호를 바꿔 rank로 사용
+        # 가중치: 제목 10, 설명 4, README 1
+        cursor.execute(
+            f"""
+            SELECT p.id, p.title,
+                snippet({FTS_TABLE}, -1, '{_MARK_START}', '{_MARK_END}', '…', 16),
+                -bm25({FTS_TABLE}, 10.0, 4.0, 1.0) AS rank
+            FROM {FTS_TABLE}
+            JOIN projects_project p ON p.id = {FTS_TABLE}.rowid
+            WHERE {FTS_TABLE} MATCH %s
+            ORDER BY rank DESC, p.id DESC
+            LIMIT %s
+            """,
+            [match, limit],
+        )
+        return cursor.fetchall()
+
+
+def _search_fallback(tokens, limit):
+    # 전문 검색을 지원하지 않는 DB: 단순 포함 검색 (순위/하이라이트 없음)
+    from django.db.models import Q
+
+    condition = Q()
+    for token in tokens:
+        condition &= Q(title__icontains=token) | Q(description__icontains=token)
+    projects = Project.objects.filter(condition).only('id', 'title', 'description')[:limit]
+    return [(p.id, p.title, p.description[:120], 0.0) for p in projects]
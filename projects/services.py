@@ -0,0 +1,496 @@
+"""
+Projects 앱의 비즈니스 로직을 담당하는 서비스 계층
+프로젝트 목록 페이지네이션, GitHub README 캐시, Demo URL 임베드 확인 등의 로직을 뷰에서 분리합니다.
+"""
+import asyncio
+import base64
+import logging
+import re
+import threading
+from datetime import date, timedelta
+from typing import Optional
+
+import httpx
+import markdown
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core import http_client
+from core.caching import bump_content_version
+from .models import GithubReadme, Project
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = 'https://api.github.com/repos/{owner}/{repo}/readme'
+README_EXTENSIONS = ['fenced_code', 'tables', 'nl2br', 'codehilite']
+
+# 프로젝트 목록 한 페이지 크기 (홈/목록 첫 화면과 무한 스크롤 공통)
+PROJECT_PAGE_SIZE = 6
+PROJECT_PAGE_MAX_SIZE = 24
+
+# 백그라운드 재검증 중인 저장소 (중복 요청 방지)
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+class InvalidCursor(ValueError):
+    """페이지네이션 커서를 해석할 수 없는 경우"""
+
+
+class ReadmeUnavailable(Exception):
+    """이번 요청에서 README를 처음 가져오려다 실패한 경우 (응답이 일부 빠진 상태)"""
+
+
+def encode_cursor(project: Project) -> str:
+    """프로젝트의 정렬 키 (start_date, id)를 URL에 안전한 커서 문자열로 변환합니다."""
+    raw = f'{project.start_date.isoformat()}:{project.pk}'
+    return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    커서 문자열을 (start_date, id)로 해석합니다.
+
+    Raises:
+        InvalidCursor: 형식이 잘못된 경우
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode('ascii')).decode('ascii')
+        start_date, pk = raw.split(':')
+        return date.fromisoformat(start_date), int(pk)
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursor(f"잘못된 커서입니다: {cursor}") from e
+
+
+def get_project_page(cursor: Optional[str] = None, limit: int = PROJECT_PAGE_SIZE) -> tuple:
+    """
+    (start_date, id) 내림차순 키셋 페이지네이션으로 프로젝트 한 페이지를 조회합니다.
+    OFFSET을 쓰지 않으므로 프로젝트 수와 관계없이 페이지 조회 비용이 일정합니다.
+
+    Args:
+        cursor: 이전 페이지의 next_cursor (None이면 첫 페이지)
+        limit: 페이지 크기
+
+    Returns:
+        tuple: (프로젝트 리스트, 다음 페이지 커서 또는 None)
+
+    Raises:
+        InvalidCursor: 커서 형식이 잘못된 경우
+    """
+    queryset = Project.objects.select_related('company', 'thumbnail').order_by('-start_date', '-id')
+
+    if cursor:
+        start_date, pk = decode_cursor(cursor)
+        queryset = queryset.filter(Q(start_date__lt=start_date) | Q(start_date=start_date, id__lt=pk))
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    projects = list(queryset[:limit + 1])
+    next_cursor = encode_cursor(projects[limit - 1]) if len(projects) > limit else None
+    return projects[:limit], next_cursor
+
+
+def parse_github_repo(github_url: str) -> Optional[tuple]:
+    """
+    GitHub URL에서 (owner, repo)를 추출합니다.
+    지원 형식: https://github.com/username/repo
+
+    Returns:
+        tuple | None: (owner, repo) 또는 GitHub URL이 아니면 None
+    """
+    if not github_url:
+        return None
+
+    match = re.search(r'github\.com/([^/]+)/([^/?#]+)', github_url)
+    if not match:
+        return None
+
+    owner, repo = match.groups()
+    # URL 끝의 .git 제거
+    repo = repo.removesuffix('.git')
+    return owner, repo
+
+
+def get_github_readme(github_url: str) -> Optional[str]:
+    """
+    프로젝트의 GitHub README HTML을 반환합니다. (stale-while-revalidate)
+    캐시가 있으면 바로 반환하고, 유효기간이 지났으면 백그라운드에서 재검증합니다.
+    캐시가 없을 때만 요청 안에서 GitHub을 호출합니다.
+
+    Args:
+        github_url: 프로젝트의 GitHub URL
+
+    Returns:
+        str | None: README HTML. README가 없거나 가져올 수 없으면 None
+    """
+    parsed = parse_github_repo(github_url)
+    if not parsed:
+        return None
+    owner, repo = parsed
+
+    readme = GithubReadme.objects.filter(owner=owner, repo=repo).first()
+    if readme is None:
+        # 요청 안에서의 호출이므로 재시도 없이 한 번만 시도 (실패는 네거티브 캐시, 이후 백그라운드 재시도)
+        readme = refresh_github_readme(owner, repo, retry=False)
+    elif _is_stale(readme):
+        schedule_readme_refresh(owner, repo)
+
+    if readme is None or not readme.html:
+        return None
+    return readme.html
+
+
+def _is_stale(readme: GithubReadme) -> bool:
+    if readme.checked_at is None:
+        return True
+    return timezone.now() - readme.checked_at > timedelta(seconds=settings.GITHUB_README_TTL)
+
+
+def _github_headers(etag: str = '') -> dict:
+    headers = {'Accept': 'application/vnd.github+json'}
+    if settings.GITHUB_TOKEN:
+        headers['Authorization'] = f'Bearer {settings.GITHUB_TOKEN}'
+    if etag:
+        # 304 응답은 GitHub API 호출 한도에서 차감되지 않음
+        headers['If-None-Match'] = etag
+    return headers
+
+
+def render_readme(content: str) -> str:
+    """README Markdown을 HTML로 변환합니다."""
+    return markdown.markdown(content, extensions=README_EXTENSIONS)
+
+
+def refresh_github_readme(owner: str, repo: str, retry: bool = True) -> Optional[GithubReadme]:
+    """
+    GitHub에서 README를 조건부 요청(If-None-Match)으로 재검증하고 캐시를 갱신합니다.
+
+    Args:
+        owner: 저장소 소유자
+        repo: 저장소명
+        retry: 실패 시 재시도 여부 (요청 처리 중에는 False)
+
+    Returns:
+        GithubReadme: 갱신된 캐시. 요청이 실패하면 실패 시각이 기록된 기존 캐시(없으면 빈 캐시)
+    """
+    readme = GithubReadme.objects.filter(owner=owner, repo=repo).first()
+    api_url = GITHUB_API_URL.format(owner=owner, repo=repo)
+
+    try:
+        response = http_client.get(
+            api_url,
+            headers=_github_headers(readme.etag if readme else ''),
+            timeout=5,
+            retry=retry,
+        )
+    except requests.RequestException as e:
+        logger.warning(f"GitHub README fetch error: {owner}/{repo}: {e}")
+        return record_readme_failure(owner, repo, readme)
+
+    payload = response.json() if response.status_code == 200 else None
+    return store_readme_response(owner, repo, readme, response.status_code, response.headers, payload)
+
+
+def store_readme_response(owner, repo, readme, status_code, headers, payload) -> Optional[GithubReadme]:
+    """
+    GitHub README API 응답을 캐시에 반영합니다. (동기/비동기 요청 경로 공용)
+
+    Args:
+        owner: 저장소 소유자
+        repo: 저장소명
+        readme: 기존 캐시 (없으면 None)
+        status_code: 응답 상태 코드
+        headers: 응답 헤더
+        payload: 200 응답의 JSON 본문
+
+    Returns:
+        GithubReadme | None: 갱신된 캐시
+    """
+    now = timezone.now()
+
+    if status_code == 304 and readme is not None:
+        # 변경 없음: 재검증 시각만 갱신
+        GithubReadme.objects.filter(pk=readme.pk).update(checked_at=now)
+        readme.checked_at = now
+        return readme
+
+    if status_code == 200:
+        content = base64.b64decode(payload['content']).decode('utf-8')
+        etag = headers.get('ETag', '')
+    elif status_code == 404:
+        # README가 없는 저장소도 캐시하여 반복 호출을 막음
+        content = ''
+        etag = headers.get('ETag', '')
+    else:
+        # 호출 한도 초과(403) 등: 기존 캐시를 유지하고 TTL 동안 재시도하지 않음
+        logger.warning(f"GitHub README fetch failed: {owner}/{repo}: HTTP {status_code}")
+        return record_readme_failure(owner, repo, readme)
+
+    html = render_readme(content) if content else ''
+    changed = readme is None or readme.html != html
+
+    readme, _ = GithubReadme.objects.update_or_create(
+        owner=owner,
+        repo=repo,
+        defaults={
+            'etag': etag,
+            'content': content,
+            'html': html,
+            'checked_at': now,
+            **({'fetched_at': now} if changed else {}),
+        },
+    )
+
+    if changed:
+        # 프로젝트 상세 JSON의 ETag가 바뀌도록 콘텐츠 버전 갱신
+        transaction.on_commit(bump_content_version)
+
+    return readme
+
+
+def record_readme_failure(owner, repo, readme) -> GithubReadme:
+    """
+    README를 가져오지 못한 결과를 기록합니다. (네거티브 캐시)
+    기존 캐시는 내용을 유지한 채 재검증 시각만 갱신하고, 캐시가 없으면 빈 내용의 행을 만들어
+    TTL(GITHUB_README_TTL) 동안은 모달 요청마다 GitHub을 다시 호출하지 않도록 합니다.
+    (이후 재시도는 만료된 캐시와 같이 백그라운드 재검증으로 처리)
+
+    Returns:
+        GithubReadme: 재검증 시각이 갱신된 캐시
+    """
+    now = timezone.now()
+    if readme is None:
+        readme, created = GithubReadme.objects.get_or_create(
+            owner=owner, repo=repo, defaults={'checked_at': now},
+        )
+        if created:
+            return readme
+
+    GithubReadme.objects.filter(pk=readme.pk).update(checked_at=now)
+    readme.checked_at = now
+    return readme
+
+
+def schedule_readme_refresh(owner: str, repo: str):
+    """README 재검증을 백그라운드 스레드에서 실행합니다. (요청 응답을 지연시키지 않음)"""
+    key = (owner, repo)
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def run():
+        try:
+            refresh_github_readme(owner, repo)
+        except Exception:
+            logger.exception(f"GitHub README background refresh failed: {owner}/{repo}")
+        finally:
+            close_old_connections()
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    threading.Thread(target=run, name=f'readme-refresh-{owner}/{repo}', daemon=True).start()
+
+
+def is_embeddable(headers) -> bool:
+    """
+    응답 헤더(X-Frame-Options, CSP frame-ancestors)로 다른 사이트의 iframe 임베드 허용 여부를 판단합니다.
+
+    Args:
+        headers: 대소문자 구분 없는 응답 헤더 매핑
+
+    Returns:
+        bool: 임베드 가능하면 True
+    """
+    x_frame_options = headers.get('X-Frame-Options', '').upper()
+    if x_frame_options in ['DENY', 'SAMEORIGIN']:
+        return False
+
+    csp = headers.get('Content-Security-Policy', '')
+    for directive in csp.split(';'):
+        parts = directive.strip().split()
+        if parts and parts[0].lower() == 'frame-ancestors':
+            sources = [source.lower() for source in parts[1:]]
+            # 모든 출처('*' 또는 https:)를 허용할 때만 포트폴리오에서 임베드 가능
+            return '*' in sources or 'https:' in sources
+
+    return True
+
+
+def check_iframe_embeddable(demo_url: str, timeout: float = 3, retry: bool = True) -> bool:
+    """
+    Demo URL에 HEAD 요청을 보내 iframe 임베드 가능 여부를 확인합니다.
+    요청이 실패하면 True를 반환합니다. (프론트에서 onerror로 처리)
+
+    Args:
+        demo_url: 확인할 Demo URL
+        timeout: 요청 타임아웃 (초)
+        retry: 실패 시 재시도 여부 (관리자 저장 등 요청 처리 중에는 False)
+
+    Returns:
+        bool: 임베드 가능하면 True
+    """
+    try:
+        response = http_client.head(demo_url, timeout=timeout, allow_redirects=True, retry=retry)
+    except requests.RequestException as e:
+        logger.info(f"Demo URL embed check failed: {demo_url}: {e}")
+        return True
+    return is_embeddable(response.headers)
+
+
+def get_iframe_supported(project: Project) -> bool:
+    """
+    프로젝트의 iframe 임베드 가능 여부를 반환합니다.
+    아직 확인하지 않은 프로젝트(iframe_checked_at이 없는 기존 행, 새로 만든 행)는
+    요청 안에서 재시도 없이 한 번 확인하여 저장합니다. (비동기 상세의 _aget_iframe_supported와 동일)
+    """
+    if not project.demo_url or project.iframe_checked_at is not None:
+        return project.iframe_supported
+
+    supported = check_iframe_embeddable(project.demo_url, retry=False)
+    Project.objects.filter(pk=project.pk).update(
+        iframe_supported=supported,
+        iframe_checked_at=timezone.now(),
+    )
+    return supported
+
+
+def refresh_iframe_support(project: Project) -> bool:
+    """
+    프로젝트의 iframe 임베드 가능 여부를 다시 확인하여 저장합니다.
+    updated_at은 바꾸지 않으며, 값이 바뀐 경우에만 콘텐츠 버전을 올립니다.
+
+    Returns:
+        bool: 저장된 값이 바뀌었으면 True
+    """
+    supported = check_iframe_embeddable(project.demo_url) if project.demo_url else True
+    changed = supported != project.iframe_supported
+
+    Project.objects.filter(pk=project.pk).update(
+        iframe_supported=supported,
+        iframe_checked_at=timezone.now(),
+    )
+    project.iframe_supported = supported
+
+    if changed:
+        transaction.on_commit(bump_content_version)
+    return changed
+
+
+# 비동기 버전 (프로젝트 상세 비동기 뷰에서 사용)
+# ------------------------------------------------------------------------------
+
+async def aget_github_readme(github_url: str, client: httpx.AsyncClient,
+                             timeout: float = http_client.DEFAULT_TIMEOUT) -> Optional[str]:
+    """
+    get_github_readme()의 비동기 버전. 캐시가 없을 때만 GitHub을 호출합니다.
+
+    Raises:
+        ReadmeUnavailable: 캐시가 없어 GitHub을 호출했지만 실패한 경우 (실패는 네거티브 캐시로 기록됨)
+    """
+    parsed = parse_github_repo(github_url)
+    if not parsed:
+        return None
+    owner, repo = parsed
+
+    readme = await GithubReadme.objects.filter(owner=owner, repo=repo).afirst()
+    if readme is None:
+        readme = await arefresh_github_readme(owner, repo, client, timeout=timeout)
+        if readme.fetched_at is None:
+            # 한 번도 받아오지 못함 (404로 README가 없는 저장소는 fetched_at이 기록됨)
+            raise ReadmeUnavailable(f'{owner}/{repo}')
+    elif _is_stale(readme):
+        schedule_readme_refresh(owner, repo)
+
+    if readme is None or not readme.html:
+        return None
+    return readme.html
+
+
+async def arefresh_github_readme(owner: str, repo: str, client: httpx.AsyncClient,
+                                 readme: Optional[GithubReadme] = None,
+                                 timeout: float = http_client.DEFAULT_TIMEOUT) -> Optional[GithubReadme]:
+    """refresh_github_readme()의 비동기 버전"""
+    api_url = GITHUB_API_URL.format(owner=owner, repo=repo)
+
+    try:
+        response = await http_client.arequest(
+            client, 'GET', api_url, headers=_github_headers(readme.etag if readme else ''), timeout=timeout,
+        )
+    except (httpx.HTTPError, http_client.CircuitOpenError) as e:
+        logger.warning(f"GitHub README fetch error: {owner}/{repo}: {e}")
+        return await sync_to_async(record_readme_failure)(owner, repo, readme)
+
+    payload = response.json() if response.status_code == 200 else None
+    return await sync_to_async(store_readme_response)(
+        owner, repo, readme, response.status_code, response.headers, payload
+    )
+
+
+async def acheck_iframe_embeddable(demo_url: str, client: httpx.AsyncClient,
+                                   timeout: float = http_client.DEFAULT_TIMEOUT) -> bool:
+    """check_iframe_embeddable()의 비동기 버전"""
+    try:
+        response = await http_client.arequest(client, 'HEAD', demo_url, timeout=timeout)
+    except (httpx.HTTPError, http_client.CircuitOpenError) as e:
+        logger.info(f"Demo URL embed check failed: {demo_url}: {e}")
+        return True
+    return is_embeddable(response.headers)
+
+
+async def _aget_iframe_supported(project: Project, client: httpx.AsyncClient, timeout: float) -> bool:
+    # 이미 확인된 값이 있으면 외부 요청 없이 저장된 값 사용
+    if not project.demo_url or project.iframe_checked_at is not None:
+        return project.iframe_supported
+
+    supported = await acheck_iframe_embeddable(project.demo_url, client, timeout=timeout)
+    await Project.objects.filter(pk=project.pk).aupdate(
+        iframe_supported=supported,
+        iframe_checked_at=timezone.now(),
+    )
+    return supported
+
+
+def _task_result(task, done, default, label):
+    """(결과, 대체값 사용 여부) 반환"""
+    if task not in done:
+        logger.warning(f"Project detail {label} timed out")
+        return default, True
+    if task.exception() is not None:
+        logger.warning(f"Project detail {label} failed: {task.exception()}")
+        return default, True
+    return task.result(), False
+
+
+async def aget_project_extras(project: Project, deadline: float) -> tuple:
+    """
+    프로젝트 상세의 외부 연동 부분(README, iframe 임베드 여부)을 동시에 조회합니다.
+    두 작업은 하나의 마감 시간을 공유하며, 한쪽이 늦거나 실패해도 다른 쪽 결과에는 영향이 없습니다.
+
+    Args:
+        project: 조회할 프로젝트
+        deadline: 전체 마감 시간 (초)
+
+    Returns:
+        tuple: (readme_html 또는 None, iframe_supported, degraded)
+            degraded: 마감 시간 초과/실패로 대체값을 사용한 부분이 있는지 여부
+            (이 응답은 다음 요청에서 다시 조회해야 하므로 캐시 검증자 없이 보내야 함)
+    """
+    # 프로세스(이벤트 루프) 공용 클라이언트로 연결 재사용, 마감 시간은 요청별 timeout으로 전달
+    # (서킷 브레이커/지표는 http_client.arequest에서 공유)
+    client = http_client.get_async_client()
+    readme_task = asyncio.create_task(aget_github_readme(project.github_url, client, timeout=deadline))
+    iframe_task = asyncio.create_task(_aget_iframe_supported(project, client, deadline))
+
+    done, pending = await asyncio.wait({readme_task, iframe_task}, timeout=deadline)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    readme_html, readme_degraded = _task_result(readme_task, done, None, 'README')
+    iframe_supported, iframe_degraded = _task_result(iframe_task, done, project.iframe_supported, 'embed check')
+    return readme_html, iframe_supported, readme_degraded or iframe_degraded
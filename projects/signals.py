@@ -0,0 +1,30 @@
+"""
+프로젝트 검색 색인 갱신 시그널
+프로젝트나 README 캐시가 저장/삭제되면 해당 프로젝트의 검색 색인만 증분 갱신합니다.
+"""
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from . import search
+from .models import GithubReadme, Project
+
+
+def update_project_index(sender, instance, **kwargs):
+    project_id = instance.pk
+    transaction.on_commit(lambda: search.index_project(project_id))
+
+
+def remove_project_index(sender, instance, **kwargs):
+    project_id = instance.pk
+    transaction.on_commit(lambda: search.remove_project(project_id))
+
+
+def update_readme_index(sender, instance, **kwargs):
+    owner, repo = instance.owner, instance.repo
+    transaction.on_commit(lambda: search.index_projects_for_readme(owner, repo))
+
+
+def connect_signals():
+    post_save.connect(update_project_index, sender=Project, dispatch_uid='project_search_index_save')
+    post_delete.connect(remove_project_index, sender=Project, dispatch_uid='project_search_index_delete')
+    post_save.connect(update_readme_index, sender=GithubReadme, dispatch_uid='readme_search_index_save')
@@ -1,3 +1,260 @@
-from django.test import TestCase
+import asyncio
+from datetime import date
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.testing import QueryPlanAssertionsMixin
+
+from . import search, services
+from .models import GithubReadme, Project, ProjectFile, ProjectImage
+
+
+class ProjectQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    """프로젝트 목록/상세 조회 쿼리의 인덱스 사용 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(10):
+            project = Project.objects.create(
+                title=f"프로젝트 {index}",
+                description="설명",
+                start_date=date(2020 + index % 3, index % 12 + 1, 1),
+            )
+            for order in range(3):
+                ProjectImage.objects.create(project=project, order=order, is_thumbnail=order == 1)
+                ProjectFile.objects.create(project=project, original_filename=f"f{order}.pdf",
+                                           title=f"파일 {order}", order=order)
+        cls.project = project
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_view_uses_keyset_index(self):
+        with self.capture_queries() as captured:
+            response = self.client.get(reverse('projects:list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertQueryUsesIndex(captured, 'projects_project', 'project_start_date_id_idx')
+
+    def test_list_json_next_page_uses_keyset_index(self):
+        first = self.client.get(reverse('projects:list_json')).json()
+        with self.capture_queries() as captured:
+            response = self.client.get(reverse('projects:list_json'), {'cursor': first['next_cursor']})
+        self.assertEqual(response.status_code, 200)
+        self.assertQueryUsesIndex(captured, 'projects_project', 'project_start_date_id_idx')
+
+    def test_detail_json_prefetch_uses_indexes(self):
+        with self.capture_queries() as captured:
+            response = self.client.get(reverse('projects:detail_json_sync', args=[self.project.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertQueryUsesIndex(captured, 'projects_projectimage', 'projectimage_thumb_order_idx')
+        self.assertQueryUsesIndex(captured, 'projects_projectfile', 'projectfile_project_order_idx')
+
+    def test_refresh_thumbnail_uses_index(self):
+        with self.capture_queries() as captured:
+            self.project.refresh_thumbnail()
+        self.assertQueryUsesIndex(captured, 'projects_projectimage', 'projectimage_thumb_order_idx')
+
+
+class GithubReadmeNegativeCacheTests(TestCase):
+    """README 조회 실패도 캐시하여 TTL 동안 GitHub을 다시 호출하지 않는지 확인"""
+
+    github_url = 'https://github.com/owner/repo'
+
+    def test_fetch_error_is_cached(self):
+        with mock.patch.object(services.http_client, 'get', side_effect=requests.ConnectionError('down')) as get:
+            self.assertIsNone(services.get_github_readme(self.github_url))
+            self.assertIsNone(services.get_github_readme(self.github_url))
+
+        self.assertEqual(get.call_count, 1)
+        readme = GithubReadme.objects.get(owner='owner', repo='repo')
+        self.assertEqual(readme.html, '')
+        self.assertIsNotNone(readme.checked_at)
+
+    def test_stale_failure_is_retried_in_background(self):
+        with mock.patch.object(services.http_client, 'get', side_effect=requests.ConnectionError('down')):
+            services.get_github_readme(self.github_url)
+        GithubReadme.objects.update(checked_at=None)
+
+        with mock.patch.object(services.http_client, 'get') as get, \
+                mock.patch.object(services, 'schedule_readme_refresh') as schedule:
+            self.assertIsNone(services.get_github_readme(self.github_url))
+
+        get.assert_not_called()
+        schedule.assert_called_once_with('owner', 'repo')
+
+
+@override_settings(PROJECT_DETAIL_DEADLINE=0.05)
+class ProjectDetailDegradedResponseTests(TestCase):
+    """README 조회가 마감 시간을 넘긴 상세 응답은 검증자 없이 보내 다음 요청에서 다시 조회되는지 확인"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(
+            title="프로젝트", description="설명", start_date=date(2024, 1, 1),
+            github_url='https://github.com/owner/repo',
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_timed_out_response_is_not_revalidated_to_304(self):
+        url = reverse('projects:detail_json', args=[self.project.pk])
+
+        async def slow_readme(github_url, client, timeout):
+            await asyncio.sleep(1)
+
+        with mock.patch.object(services, 'aget_github_readme', slow_readme):
+            degraded = self.client.get(url)
+        self.assertEqual(degraded.status_code, 200)
+        self.assertIsNone(degraded.json()['readme_html'])
+        self.assertNotIn('ETag', degraded)
+        self.assertNotIn('Last-Modified', degraded)
+        self.assertEqual(degraded['Cache-Control'], 'no-store')
+
+        async def readme(github_url, client, timeout):
+            return '<p>README</p>'
+
+        # 클라이언트는 저장한 검증자가 없으므로 조건 없이 다시 요청 -> README 포함 전체 응답
+        with mock.patch.object(services, 'aget_github_readme', readme):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=degraded.get('ETag', ''))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['readme_html'], '<p>README</p>')
+        self.assertIn('ETag', response)
+
+        # 정상 응답은 그대로 재검증 가능
+        with mock.patch.object(services, 'aget_github_readme', readme):
+            revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+
+
+class ProjectSearchTests(TestCase):
+    """전문 검색 순위/스니펫과 저장·삭제 시 색인 갱신 확인 (SQLite FTS5)"""
+
+    def create_project(self, **kwargs):
+        # 색인 갱신은 커밋 후 실행되므로 콜백을 바로 실행
+        with self.captureOnCommitCallbacks(execute=True):
+            return Project.objects.create(start_date=date(2024, 1, 1), **kwargs)
+
+    def indexed_ids(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT rowid FROM {search.FTS_TABLE} ORDER BY rowid")
+            return [row[0] for row in cursor.fetchall()]
+
+    def test_results_are_ranked_title_description_readme(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            GithubReadme.objects.create(owner='owner', repo='repo', content='Built with Django and Postgres')
+        readme_match = self.create_project(
+            title="포트폴리오", description="개인 사이트", github_url='https://github.com/owner/repo',
+        )
+        description_match = self.create_project(title="블로그", description="Django 기반 블로그 엔진")
+        title_match = self.create_project(title="Django 쇼핑몰", description="결제 연동")
+        self.create_project(title="무관한 프로젝트", description="React 앱")
+
+        response = self.client.get(reverse('projects:search'), {'q': 'djan'})
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual(
+            [result['id'] for result in results],
+            [title_match.pk, description_match.pk, readme_match.pk],
+        )
+        self.assertIn('<mark>Django</mark>', results[2]['snippet'])
+
+    def test_snippet_escapes_indexed_html(self):
+        self.create_project(title="Django <script>", description="설명")
+
+        results = search.search_projects('django')
+
+        self.assertEqual(results[0]['snippet'], '<mark>Django</mark> &lt;script&gt;')
+
+    def test_empty_query_returns_no_results(self):
+        self.create_project(title="Django", description="설명")
+
+        response = self.client.get(reverse('projects:search'), {'q': '  '})
+
+        self.assertEqual(response.json(), {'query': '', 'results': []})
+
+    def test_index_follows_project_save_and_delete(self):
+        project = self.create_project(title="Flask API", description="설명")
+        self.assertEqual([r['id'] for r in search.search_projects('flask')], [project.pk])
+
+        project.title = "FastAPI 서버"
+        with self.captureOnCommitCallbacks(execute=True):
+            project.save()
+        self.assertEqual(search.search_projects('flask'), [])
+        self.assertEqual([r['id'] for r in search.search_projects('fastapi')], [project.pk])
+
+        project_id = project.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            project.delete()
+        self.assertEqual(search.search_projects('fastapi'), [])
+        self.assertNotIn(project_id, self.indexed_ids())
+
+    def test_readme_update_reindexes_projects(self):
+        project = self.create_project(
+            title="포트폴리오", description="설명", github_url='https://github.com/owner/repo',
+        )
+        self.assertEqual(search.search_projects('kubernetes'), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            GithubReadme.objects.create(owner='owner', repo='repo', content='Deployed on Kubernetes')
+
+        self.assertEqual([r['id'] for r in search.search_projects('kubernetes')], [project.pk])
+
+    def test_rebuild_search_index_command(self):
+        # 시그널 없이 만든 행(bulk_create)과 남아 있는 잘못된 색인 행
+        first, second = Project.objects.bulk_create([
+            Project(title="Vue 대시보드", description="설명", start_date=date(2024, 1, 1)),
+            Project(title="Svelte 위젯", description="설명", start_date=date(2024, 2, 1)),
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {search.FTS_TABLE} (rowid, title, description, readme) VALUES (%s, %s, '', '')",
+                [9999, 'Stale'],
+            )
+        self.assertEqual(search.search_projects('vue'), [])
+
+        out = StringIO()
+        call_command('rebuild_search_index', stdout=out)
+
+        self.assertIn('Indexed 2 project(s)', out.getvalue())
+        self.assertEqual(self.indexed_ids(), sorted([first.pk, second.pk]))
+        self.assertEqual([r['id'] for r in search.search_projects('vue')], [first.pk])
+
+
+class ProjectIframeSupportTests(TestCase):
+    """새 프로젝트 저장은 외부 요청 없이, 미확인 임베드 여부는 첫 상세 조회에서 확인"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_create_does_not_check_demo_url(self):
+        with mock.patch.object(services, 'check_iframe_embeddable') as check:
+            project = Project.objects.create(
+                title="데모", description="설명", start_date=date(2024, 1, 1), demo_url='https://demo.example.com',
+            )
+
+        check.assert_not_called()
+        self.assertIsNone(project.iframe_checked_at)
+
+    def test_sync_detail_checks_unchecked_project_once(self):
+        project = Project.objects.create(
+            title="데모", description="설명", start_date=date(2024, 1, 1), demo_url='https://demo.example.com',
+        )
+        url = reverse('projects:detail_json_sync', args=[project.pk])
+
+        with mock.patch.object(services, 'check_iframe_embeddable', return_value=False) as check:
+            self.assertIs(self.client.get(url).json()['iframe_supported'], False)
+            self.assertIs(self.client.get(url).json()['iframe_supported'], False)
+
+        check.assert_called_once_with('https://demo.example.com', retry=False)
+        project.refresh_from_db()
+        self.assertFalse(project.iframe_supported)
+        self.assertIsNotNone(project.iframe_checked_at)
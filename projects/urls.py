@@ -1,9 +1,16 @@
 from django.urls import path
-from .views import ProjectListView, project_detail_json
+from .views import (
+    ProjectListView, project_list_json, project_search_json,
+    project_detail_json, project_detail_json_async,
+)
 
 app_name = 'projects'
 
 urlpatterns = [
     path('', ProjectListView.as_view(), name='list'),
-    path('<int:pk>/json/', project_detail_json, name='detail_json'),
+    path('page/', project_list_json, name='list_json'),
+    path('search/', project_search_json, name='search'),
+    # 모달은 비동기 버전 사용 (README/임베드 확인 동시 실행), 동기 버전은 대체 경로로 유지
+    path('<int:pk>/json/', project_detail_json_async, name='detail_json'),
+    path('<int:pk>/json/sync/', project_detail_json, name='detail_json_sync'),
 ]
\ No newline at end of file
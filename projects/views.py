@@ -1,87 +1,147 @@
 from django.shortcuts import render
 from django.views.generic import ListView
-from django.db.models import Prefetch
-from .models import Project, ProjectImage
+from .models import Project
 from django.http import JsonResponse
-from django.shortcuts import get_object_or_404
-import markdown
+from django.shortcuts import get_object_or_404, aget_object_or_404
+from django.conf import settings
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from core.caching import conditional_content, no_store_if_degraded
+from core.templatetags.image_extras import image_data
+from django.utils.html import strip_tags
 from django.utils.safestring import mark_safe
-import requests
-import re
-import base64
+from django.utils.text import Truncator
+from . import search, services
 
-def fetch_github_readme(github_url):
+# Create your views here.
+# 콘텐츠 버전이 같으면 렌더링/쿼리 없이 304 응답 (브라우저는 매번 재검증)
+@method_decorator([cache_control(no_cache=True), conditional_content], name='dispatch')
+class ProjectListView(ListView):
+    model = Project
+    template_name = 'projects/project_list.html'
+    context_object_name = 'projects' #템플릿에서 {{ projects }} 사용
+
+    def get_queryset(self):
+        # N+1 문제 방지를 위한 쿼리 최적화
+        # company와 대표 이미지(thumbnail)는 ForeignKey이므로 select_related로 조인
+        # -> 이미지 prefetch 없이 한 번의 쿼리로 목록 조회
+        # 첫 페이지만 렌더링하고 이후 페이지는 project_list_json으로 불러옴 (무한 스크롤)
+        projects, self.next_cursor = services.get_project_page()
+        return projects
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['next_cursor'] = self.next_cursor
+        return context
+
+
+@cache_control(no_cache=True)
+@conditional_content
+def project_list_json(request):
     """
-    GitHub URL에서 README 파일을 가져와 HTML로 변환
-    지원 형식: https://github.com/username/repo
+    프로젝트 목록 JSON (키셋 페이지네이션, 무한 스크롤용)
+    쿼리 파라미터: cursor (이전 응답의 next_cursor), limit (최대 24)
     """
-    if not github_url:
-        return None
+    try:
+        limit = min(int(request.GET.get('limit', services.PROJECT_PAGE_SIZE)), services.PROJECT_PAGE_MAX_SIZE)
+    except ValueError:
+        limit = services.PROJECT_PAGE_SIZE
 
-    # GitHub URL에서 owner/repo 추출
-    pattern = r'github\.com/([^/]+)/([^/]+)'
-    match = re.search(pattern, github_url)
+    try:
+        projects, next_cursor = services.get_project_page(request.GET.get('cursor'), max(limit, 1))
+    except services.InvalidCursor as e:
+        return JsonResponse({'error': str(e)}, status=400)
 
-    if not match:
-        return None
+    return JsonResponse({
+        'results': [_build_project_card(project) for project in projects],
+        'next_cursor': next_cursor,
+    })
 
-    owner, repo = match.groups()
-    # URL 끝의 .git 제거
-    repo = repo.replace('.git', '')
 
-    # GitHub API로 README 가져오기
-    api_url = f'https://api.github.com/repos/{owner}/{repo}/readme'
+def project_search_json(request):
+    """
+    프로젝트 전문 검색 JSON (제목, 설명, GitHub README)
+    쿼리 파라미터: q (검색어)
+    응답: 관련도 순 결과와 일치 구간이 <mark>로 표시된 스니펫
+    """
+    query = request.GET.get('q', '').strip()[:100]
+    return JsonResponse({
+        'query': query,
+        'results': search.search_projects(query) if query else [],
+    })
 
-    try:
-        response = requests.get(api_url, timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            # Base64 디코딩
-            readme_content = base64.b64decode(data['content']).decode('utf-8')
-            # Markdown을 HTML로 변환
-            readme_html = markdown.markdown(
-                readme_content,
-                extensions=['fenced_code', 'tables', 'nl2br', 'codehilite']
-            )
-            return readme_html
-    except Exception as e:
-        print(f"GitHub README fetch error: {e}")
-
-    return None
 
-# Create your views here.
-class ProjectListView(ListView):
-    model = Project
-    template_name = 'projects/project_list.html'
-    context_object_name = 'projects' #템플릿에서 {{ projects }} 사용
+def _build_project_card(project):
+    """프로젝트 카드 JSON 구성 (project_list.html 카드와 같은 내용)"""
+    thumbnail = project.thumbnail
+    period = f"{project.start_date.strftime('%Y.%m')} - "
+    period += project.end_date.strftime('%Y.%m') if project.end_date else "진행중"
 
-    def get_queryset(self):
-        # N+1 문제 방지를 위한 쿼리 최적화
-        # company는 ForeignKey이므로 selected_related로 조인
-        # images는 역참조이므로 prefetch_related 사용
-        # 썸네일 이미지만 먼저 가져오도록 Prefectch 객체 사용
-        thumbnail_images = Prefetch(
-            'images',
-            queryset=ProjectImage.objects.filter(is_thumbnail=True),
-            to_attr='thumbnail_list'
-        )
-
-        return Project.objects.select_related('company').prefetch_related(
-            thumbnail_images,
-            'images' #전체 이미지도 필요한 경우 대비
-        )
-    
+    return {
+        'id': project.pk,
+        'title': project.title,
+        'company': project.company.company if project.company else '',
+        'period': period,
+        'summary': Truncator(strip_tags(project.description)).words(20, truncate=' …'),
+        # 카드 이미지: url, srcset, width/height, color, placeholder (없으면 None)
+        'thumbnail': image_data(thumbnail, 'image') if thumbnail and thumbnail.image else None,
+        'github_url': project.github_url or '',
+        'demo_url': project.demo_url or '',
+        'figma_url': project.figma_url or '',
+    }
+
+
+@cache_control(no_cache=True)
+@conditional_content
 def project_detail_json(request, pk):
+    """프로젝트 상세 JSON (동기 버전, README는 DB 캐시에서 조회)"""
     # 프로젝트 객체 조회 (없으면 404)
-    project = get_object_or_404(Project.objects.prefetch_related('images', 'files'), pk=pk)
+    project = get_object_or_404(
+        Project.objects.select_related('company').prefetch_related('images', 'files'), pk=pk
+    )
+
+    # GitHub README 가져오기 (DB 캐시, 만료 시 백그라운드 재검증)
+    readme_html = None
+    if project.github_url:
+        readme_html = services.get_github_readme(project.github_url)
 
+    # 저장 시/주기 명령으로 미리 계산된 iframe 임베드 가능 여부 사용 (미확인 프로젝트는 한 번 확인)
+    iframe_supported = services.get_iframe_supported(project)
+    return JsonResponse(_build_project_detail(project, readme_html, iframe_supported))
+
+
+@no_store_if_degraded
+@cache_control(no_cache=True)
+@conditional_content
+async def project_detail_json_async(request, pk):
+    """
+    프로젝트 상세 JSON (비동기 버전)
+    README 조회와 iframe 임베드 확인을 공통 마감 시간 안에서 동시에 실행하고,
+    한쪽이 늦거나 실패해도 다른 쪽과 독립적으로 응답합니다. (예: readme_html: null)
+    일부가 빠진 응답은 ETag 없이 no-store로 보내 다음 요청에서 다시 조회합니다.
+    ASGI 서버(uvicorn 워커)에서 실행해야 대기 중에 워커가 다른 요청을 처리할 수 있습니다.
+    """
+    project = await aget_object_or_404(
+        Project.objects.select_related('company').prefetch_related('images', 'files'), pk=pk
+    )
+
+    readme_html, iframe_supported, degraded = await services.aget_project_extras(
+        project, settings.PROJECT_DETAIL_DEADLINE
+    )
+    response = JsonResponse(_build_project_detail(project, readme_html, iframe_supported))
+    response.degraded = degraded
+    return response
+
+
+def _build_project_detail(project, readme_html, iframe_supported):
+    """프로젝트 상세 JSON 응답 데이터 구성 (동기/비동기 뷰 공용, DB 조회 없음)"""
     # 기간 계산
     period = f"{project.start_date.strftime('%Y.%m')} - "
     period += project.end_date.strftime('%Y.%m') if project.end_date else "진행중"
 
     # 이미지 리스트 생성
     images = [
-        {'url': img.image.url, 'order': img.order}
+        {**image_data(img, 'image'), 'order': img.order}
         for img in project.images.all() if img.image
     ]
 
@@ -96,31 +156,11 @@ def project_detail_json(request, pk):
         for f in project.files.all() if f.file
     ]
 
-    # Markdown을 HTML로 변환 (nl2br: 줄바꿈을 <br> 태그로 변환)
-    description_html = mark_safe(markdown.markdown(
-        project.description,
-        extensions=['fenced_code', 'tables', 'nl2br']
-    ))
-
-    # GitHub README 가져오기
-    readme_html = None
-    if project.github_url:
-        readme_html = fetch_github_readme(project.github_url)
-
-    # Demo URL iframe 지원 여부 확인
-    iframe_supported = True
-    if project.demo_url:
-        try:
-            response = requests.head(project.demo_url, timeout=3)
-            x_frame_options = response.headers.get('X-Frame-Options', '').upper()
-            if x_frame_options in ['DENY', 'SAMEORIGIN']:
-                iframe_supported = False
-        except:
-            # 요청 실패시 일단 true로 (프론트에서 onerror로 처리)
-            iframe_supported = True
+    # 저장 시 미리 렌더링된 Markdown HTML 사용 (요청마다 파싱하지 않음)
+    description_html = mark_safe(project.get_description_html())
 
     #응답 데이터 구성
-    data = {
+    return {
         'title': project.title,
         'description': description_html,
         'company': project.company.company if project.company else '개인/기타',
@@ -133,6 +173,3 @@ def project_detail_json(request, pk):
         'images': images,
         'files': files,
     }
-
-    # JSON 응답 변환
-    return JsonResponse(data)
\ No newline at end of file